@@ -16,8 +16,10 @@ MICROSOFT_CLIENT_ID = os.getenv("MICROSOFT_CLIENT_ID")
 MICROSOFT_CLIENT_SECRET = os.getenv("MICROSOFT_CLIENT_SECRET")
 MICROSOFT_TENANT_ID = os.getenv("MICROSOFT_TENANT_ID")
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_REQUESTS_PER_MINUTE = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "60"))
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")  # Custom Search Engine ID
+GOOGLE_SEARCH_QUERIES_PER_SECOND = float(os.getenv("GOOGLE_SEARCH_QUERIES_PER_SECOND", "10"))
 APOLLO_API_KEY = os.getenv("APOLLO_API_KEY")
 LINKEDIN_CLIENT_ID = os.getenv("LINKEDIN_CLIENT_ID")
 LINKEDIN_CLIENT_SECRET = os.getenv("LINKEDIN_CLIENT_SECRET")
@@ -523,6 +525,30 @@ CIRCUIT_BREAKER_RESET_TIME = 30  # Minutes before resetting circuit breaker
 DEFAULT_MAX_ORGS_PER_RUN = 50  # Default maximum organizations per discovery run
 DEFAULT_MAX_CONTACTS_PER_ORG = 10  # Default maximum contacts per organization
 MIN_RELEVANCE_SCORE = 5  # Only proceed with contacts scoring 5+ for relevance
+RESULT_CACHE_PATH = BASE_DIR / "data" / "result_cache.db"  # Persistent cache for Gemini/search results
+GEMINI_CACHE_TTL_DAYS = 14  # Days before cached Gemini results expire
+SEARCH_CACHE_TTL_HOURS = 24  # Hours before cached search API results expire
+GEMINI_SKIP_THRESHOLD = 5  # Skip Gemini contact extraction when HTML/regex extraction already found this many named contacts
+
+# Common first-name nicknames mapped to the formal name, used when checking whether
+# a discovered contact duplicates an existing one ("Bob Smith" vs "Robert Smith")
+FIRST_NAME_NICKNAMES = {
+    "al": "albert", "alex": "alexander", "andy": "andrew", "bill": "william", "billy": "william",
+    "bob": "robert", "bobby": "robert", "rob": "robert", "robbie": "robert",
+    "cathy": "catherine", "kathy": "katherine", "kate": "katherine", "katie": "katherine",
+    "chris": "christopher", "chuck": "charles", "charlie": "charles",
+    "dan": "daniel", "danny": "daniel", "dave": "david", "don": "donald",
+    "ed": "edward", "eddie": "edward", "jim": "james", "jimmy": "james", "jamie": "james",
+    "jon": "john", "johnny": "john", "jack": "john", "joe": "joseph", "joey": "joseph",
+    "ken": "kenneth", "kenny": "kenneth", "larry": "lawrence", "liz": "elizabeth", "beth": "elizabeth",
+    "matt": "matthew", "mike": "michael", "mick": "michael", "nick": "nicholas",
+    "pat": "patrick", "peggy": "margaret", "maggie": "margaret", "pete": "peter",
+    "rick": "richard", "rich": "richard", "dick": "richard", "ron": "ronald",
+    "sam": "samuel", "steve": "stephen", "steven": "stephen", "sue": "susan",
+    "ted": "theodore", "tom": "thomas", "tommy": "thomas", "tony": "anthony",
+    "greg": "gregory", "jeff": "jeffrey", "jerry": "gerald", "josh": "joshua",
+    "ben": "benjamin", "will": "william", "tim": "timothy", "jen": "jennifer", "jenny": "jennifer"
+}
 
 # Exclusion criteria for organizations
 EXCLUDED_ORGANIZATION_TYPES = {
@@ -4,9 +4,10 @@ CRUD operations for the GBL Data Contact Management System.
 import datetime
 import logging
 import json
-from typing import List, Dict, Any, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func, or_, and_
+from typing import List, Dict, Any, Iterable, Optional, Tuple, Set
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import desc, func, or_, and_, tuple_
+from app.config import FIRST_NAME_NICKNAMES
 from app.database.models import Organization, Contact, ContactInteraction, ContactStatus, EmailEngagement, ProcessSummary
 from app.utils.logger import get_logger
 import os
@@ -56,6 +57,63 @@ def get_organization_by_name_and_state(db: Session, name: str, state: str) -> Op
     ).first()
 
 
+def get_organizations_by_name_and_state(
+    db: Session, name_state_pairs: Iterable[Tuple[str, str]]
+) -> Dict[Tuple[str, str], Organization]:
+    """
+    Get all organizations matching any of several (name, state) pairs with one query.
+    
+    Names are matched ignoring case and surrounding whitespace. Only the
+    identifying and score columns are loaded up front; any other attribute is
+    loaded on first access.
+    
+    Args:
+        db: Database session
+        name_state_pairs: (name, state) pairs to look up
+        
+    Returns:
+        Dictionary mapping (normalized name, state) to the matching organization,
+        where the normalized name is name.strip().lower()
+    """
+    name_state_pairs = {(name.strip().lower(), state) for name, state in name_state_pairs}
+    if not name_state_pairs:
+        return {}
+    
+    organizations = db.query(Organization).options(
+        load_only(Organization.id, Organization.name, Organization.state, Organization.relevance_score)
+    ).filter(
+        tuple_(func.lower(func.trim(Organization.name)), Organization.state).in_(name_state_pairs)
+    ).all()
+    return {(org.name.strip().lower(), org.state): org for org in organizations}
+
+
+def bulk_create_organizations(db: Session, org_data_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create many organizations with a single bulk insert and commit.
+    
+    Organizations with a .edu website are rejected, as in create_organization.
+    
+    Args:
+        db: Database session
+        org_data_list: List of organization data dictionaries
+        
+    Returns:
+        The organization data dictionaries that were inserted
+    """
+    accepted = []
+    for org_data in org_data_list:
+        website = org_data.get('website', '')
+        if website and '.edu' in website.lower():
+            logger.info(f"Rejecting organization with .edu website: {website}")
+            continue
+        accepted.append(org_data)
+    
+    if accepted:
+        db.bulk_insert_mappings(Organization, accepted)
+    db.commit()
+    return accepted
+
+
 def get_contact_by_email(db: Session, email: str) -> Optional[Contact]:
     """
     Get a contact by email address.
@@ -72,7 +130,7 @@ def get_contact_by_email(db: Session, email: str) -> Optional[Contact]:
 
 def contact_exists(db: Session, first_name: str, last_name: str, organization_id: int) -> bool:
     """
-    Check if a contact with the given name exists for an organization.
+    Check if a contact with the same name, or an obvious variant of it, exists for an organization.
     
     Args:
         db: Database session
@@ -89,7 +147,105 @@ def contact_exists(db: Session, first_name: str, last_name: str, organization_id
         Contact.organization_id == organization_id
     ).first()
     
-    return contact is not None
+    if contact is not None:
+        return True
+    
+    # Fall back to variant matching (case, initials, nicknames) against the organization's contacts
+    return contact_name_matches(
+        normalize_contact_name(first_name, last_name),
+        get_contact_name_index(db, organization_id)
+    )
+
+
+def normalize_contact_name(first_name: Optional[str], last_name: Optional[str]) -> Tuple[str, str]:
+    """
+    Normalize a contact's name for duplicate detection.
+    
+    Args:
+        first_name: Contact's first name
+        last_name: Contact's last name
+        
+    Returns:
+        Tuple of casefolded (first_name, last_name) with collapsed whitespace
+    """
+    return (
+        " ".join((first_name or "").casefold().split()),
+        " ".join((last_name or "").casefold().split())
+    )
+
+
+def get_contact_name_index(db: Session, organization_id: int) -> Set[Tuple[str, str]]:
+    """
+    Get the normalized names of all contacts of an organization.
+    
+    Args:
+        db: Database session
+        organization_id: Organization ID
+        
+    Returns:
+        Set of normalized (first_name, last_name) tuples
+    """
+    rows = db.query(Contact.first_name, Contact.last_name).filter(
+        Contact.organization_id == organization_id
+    ).all()
+    
+    return {normalize_contact_name(first_name, last_name) for first_name, last_name in rows}
+
+
+def _first_names_match(first_name: str, known_first_name: str) -> bool:
+    """
+    Check whether two normalized first names refer to the same person.
+    
+    Names match when they are equal, when one is an initial of the other
+    ("J" or "J." vs "John"), or when both map to the same formal name in
+    FIRST_NAME_NICKNAMES ("Bob" vs "Robert").
+    
+    Args:
+        first_name: Normalized first name
+        known_first_name: Normalized first name of an existing contact
+        
+    Returns:
+        True if the first names match, False otherwise
+    """
+    if first_name == known_first_name:
+        return True
+    if not first_name or not known_first_name:
+        return False
+    
+    first = first_name.rstrip(".")
+    known_first = known_first_name.rstrip(".")
+    if len(first) == 1 or len(known_first) == 1:
+        return first[0] == known_first[0]
+    
+    return FIRST_NAME_NICKNAMES.get(first, first) == FIRST_NAME_NICKNAMES.get(known_first, known_first)
+
+
+def contact_name_matches(name: Tuple[str, str], name_index: Set[Tuple[str, str]]) -> bool:
+    """
+    Check whether a normalized name matches a name in the index.
+    
+    The last names must be identical; first names may differ by an initial or a
+    known nickname ("Bob Smith" vs "Robert Smith"). Similar but different first
+    names ("Mary" vs "Mark") are treated as different people.
+    
+    Args:
+        name: Normalized (first_name, last_name) tuple
+        name_index: Set of normalized (first_name, last_name) tuples
+        
+    Returns:
+        True if the same name or a variant of it exists, False otherwise
+    """
+    if name in name_index:
+        return True
+    
+    first_name, last_name = name
+    if not last_name:
+        return False
+    
+    return any(
+        known_last_name == last_name and _first_names_match(first_name, known_first_name)
+        for known_first_name, known_last_name in name_index
+    )
 
 
 def create_contact(db: Session, contact_data: Dict[str, Any]) -> Contact:
@@ -15,6 +15,7 @@ from app.config import (
     TARGET_STATES, ILLINOIS_SOUTH_OF_I80
 )
 from app.database.models import Organization, DiscoveredURL
+from app.discovery.http_session import create_http_session
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,14 +26,16 @@ class Crawler:
     This wrapper provides the functionality needed for the enhanced organization discovery.
     """
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, http_session: Optional[requests.Session] = None):
         """
         Initialize the crawler.
         
         Args:
             db_session: Database session
+            http_session: Optional shared HTTP session (a pooled session is created if omitted)
         """
         self.db_session = db_session
+        self.http = http_session or create_http_session()
         self.web_crawler = WebCrawler(db_session)
         self.content_cache = {}  # Simple in-memory cache for page content
         
@@ -72,7 +75,7 @@ class Crawler:
                 headers = {
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
                 }
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self.http.get(url, headers=headers, timeout=30)
                 response.raise_for_status()
                 content = response.text
                 logger.info(f"Successfully downloaded {url} ({len(content)} bytes)")
@@ -204,7 +207,7 @@ class Crawler:
                 headers = {
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
                 }
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self.http.get(url, headers=headers, timeout=30)
                 response.raise_for_status()
                 html_content = response.text
                 logger.info(f"Successfully downloaded {url} ({len(html_content)} bytes)")
@@ -4,26 +4,78 @@ Modified discovery manager for the GDS Contact Management System.
 This module contains the enhanced DiscoveryManager class that focuses on extracting
 real organizations from content rather than treating webpages as organizations.
 """
+from collections import Counter
 from datetime import datetime
+from html.parser import HTMLParser
+import concurrent.futures
+import json
+import re
 import time
 from typing import Dict, List, Any, Optional
+from bs4 import BeautifulSoup
+import google.generativeai as genai
+from sqlalchemy import func, and_
 from sqlalchemy.orm import Session
 from app.config import (
     TARGET_STATES, SEARCH_QUERIES, 
     ORG_TYPES, CLASSIFICATION_KEYWORDS, 
-    INDUSTRY_DIRECTORIES, MIN_RELEVANCE_SCORE
+    INDUSTRY_DIRECTORIES, MIN_RELEVANCE_SCORE,
+    GEMINI_API_KEY, GEMINI_REQUESTS_PER_MINUTE,
+    RESULT_CACHE_PATH, GEMINI_CACHE_TTL_DAYS, GEMINI_SKIP_THRESHOLD
 )
+from app.database import crud
 from app.database.models import Organization, Contact, DiscoveredURL, SearchQuery, SystemMetric
 from app.discovery.search_engine import SearchEngine
 from app.discovery.crawler import Crawler
+from app.discovery.http_session import create_http_session
 from app.discovery.organization_extractor import OrganizationExtractor
 from app.discovery.fallback_contact_discovery import FallbackContactDiscovery
+from app.discovery.rate_limiter import TokenBucket
+from app.discovery.result_cache import ResultCache, make_cache_key
 from app.validation.email_validator import EmailValidator
+from app.utils.contact_assigner import assign_contact_to_user
 from app.utils.gemini_client import GeminiClient
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Precompiled patterns used during contact extraction
+_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+_JSON_ARRAY_RE = re.compile(r'\[\s*\{.*\}\s*\]', re.DOTALL)
+
+# Shared rate limiter for Gemini calls (allows bursts up to the per-minute quota)
+_gemini_rate_limiter = TokenBucket.per_minute(GEMINI_REQUESTS_PER_MINUTE)
+
+# Approximate token budget for page text sent to Gemini. Tokens are not counted;
+# the budget is applied as a character limit (GEMINI_MAX_TEXT_TOKENS * _APPROX_CHARS_PER_TOKEN)
+GEMINI_MAX_TEXT_TOKENS = 4000
+
+# Rough characters-per-token ratio for English text, used to turn the token budget
+# into a character limit without an extra count_tokens round-trip to the API
+_APPROX_CHARS_PER_TOKEN = 4
+
+# Page sections most likely to contain staff/contact details
+_CONTACT_SECTION_SELECTOR = (
+    'main, article, '
+    'div[class*="team"], div[class*="staff"], div[class*="contact"]'
+)
+
+# Chunk size used when streaming HTML through _ContactTextScanner
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+
+class _ContactTextScanner(HTMLParser):
+    """Streaming HTML scanner that flags any text node mentioning "contact" without building a DOM."""
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.found = False
+    
+    def handle_data(self, data):
+        if not self.found and "contact" in data.lower():
+            self.found = True
+
+
 class DiscoveryManager:
     """
     Enhanced discovery manager that extracts real organizations from content.
@@ -39,7 +91,10 @@ class DiscoveryManager:
         self.db_session = db_session
         # Initialize basic components
         self.search_engine = SearchEngine(db_session)
-        self.crawler = Crawler(db_session)
+        
+        # Shared pooled HTTP session (keep-alive across pages of the same site)
+        self._http = create_http_session()
+        self.crawler = Crawler(db_session, http_session=self._http)
         self.org_extractor = OrganizationExtractor(db_session)
         
         # Initialize email validator
@@ -50,15 +105,43 @@ class DiscoveryManager:
         self.fallback_discovery = None
         self.is_fully_setup = False
         
+        # Shared worker pool for Gemini calls (used to enforce a timeout without
+        # spinning up a new thread pool for every organization)
+        self._gemini_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+        
+        # Worker pool for extracting contacts from secondary (staff/team) pages
+        self._link_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+        
+        # Configure Gemini once and keep a single model instance for contact extraction
+        self._gemini_model = None
+        if GEMINI_API_KEY:
+            try:
+                genai.configure(api_key=GEMINI_API_KEY)
+                self._gemini_model = genai.GenerativeModel('gemini-2.0-flash')
+            except Exception as e:
+                logger.error(f"Error initializing Gemini API: {e}")
+        else:
+            logger.warning("GEMINI_API_KEY not set, Gemini contact extraction will be unavailable")
+        
+        # Minimum number of structured + text contacts that makes the Gemini call unnecessary
+        self.gemini_skip_threshold = GEMINI_SKIP_THRESHOLD
+        
+        # Cache of Gemini contact extraction results keyed by prompt hash
+        self._gemini_cache = ResultCache(
+            RESULT_CACHE_PATH,
+            namespace="discovery_contacts",
+            ttl_seconds=GEMINI_CACHE_TTL_DAYS * 24 * 3600
+        )
+        
         # Initialize metrics
         self.metrics = {
             "organizations_discovered": 0,
             "contacts_discovered": 0,
             "urls_discovered": 0,
             "urls_crawled": 0,
-            "by_source": {},
-            "by_organization_type": {},
-            "by_state": {}
+            "by_source": Counter(),
+            "by_organization_type": Counter(),
+            "by_state": Counter()
         }
         
         logger.info("DiscoveryManager initialized with basic components (advanced components deferred)")
@@ -76,7 +159,6 @@ class DiscoveryManager:
             
         try:
             # Initialize Gemini client
-            from app.config import GEMINI_API_KEY
             self.gemini_client = GeminiClient(GEMINI_API_KEY) if GEMINI_API_KEY else None
             
             # Initialize fallback discovery system
@@ -93,6 +175,15 @@ class DiscoveryManager:
             logger.error(f"Error setting up DiscoveryManager advanced components: {e}")
             return False
     
+    def close(self):
+        """
+        Shut down the worker pools used for Gemini calls and secondary page extraction.
+        
+        Running tasks finish in the background; the manager cannot run discovery afterwards.
+        """
+        self._gemini_executor.shutdown(wait=False)
+        self._link_executor.shutdown(wait=False)
+    
     def run_scheduled_discovery(self, max_orgs_per_run: int = 50, target_org_types: List[str] = None) -> Dict[str, Any]:
         """
         Run a scheduled discovery process.
@@ -115,9 +206,9 @@ class DiscoveryManager:
                 "urls_discovered": 0,
                 "urls_crawled": 0,
                 "search_queries_executed": 0,
-                "by_source": {},
-                "by_organization_type": {},
-                "by_state": {}
+                "by_source": Counter(),
+                "by_organization_type": Counter(),
+                "by_state": Counter()
             }
             
             # Ensure advanced components are set up before proceeding
@@ -148,6 +239,8 @@ class DiscoveryManager:
         except Exception as e:
             logger.error(f"Error in discovery run: {e}")
             return {"error": str(e)}
+        finally:
+            self.close()
     
     def _execute_search_phase(self, target_org_types=None):
         """
@@ -228,13 +321,13 @@ class DiscoveryManager:
                             
                             # Update source metrics
                             source = "search_engine"
-                            self.metrics["by_source"][source] = self.metrics["by_source"].get(source, 0) + len(org_ids)
+                            self.metrics["by_source"][source] += len(org_ids)
                             
                             # Update organization type metrics
-                            self.metrics["by_organization_type"][industry] = self.metrics["by_organization_type"].get(industry, 0) + len(org_ids)
+                            self.metrics["by_organization_type"][industry] += len(org_ids)
                             
                             # Update state metrics
-                            self.metrics["by_state"][state] = self.metrics["by_state"].get(state, 0) + len(org_ids)
+                            self.metrics["by_state"][state] += len(org_ids)
         
         logger.info(f"Search phase completed. Discovered {self.metrics['urls_discovered']} URLs")
     
@@ -316,7 +409,7 @@ class DiscoveryManager:
                     
                     # Update source metrics
                     source = "crawler"
-                    self.metrics["by_source"][source] = self.metrics["by_source"].get(source, 0) + len(org_ids)
+                    self.metrics["by_source"][source] += len(org_ids)
                     
                     # Save discovered links
                     for link in links:
@@ -373,9 +466,6 @@ class DiscoveryManager:
         """
         logger.info("Starting contact discovery phase")
         
-        from sqlalchemy import func, and_
-        from app.database.models import Contact
-        
         # Get count of contacts per organization
         contact_counts = self.db_session.query(
             Contact.organization_id, 
@@ -496,12 +586,12 @@ class DiscoveryManager:
             
             # Update organization type metrics
             org_type = org.org_type
-            self.metrics["by_organization_type"][org_type] = self.metrics["by_organization_type"].get(org_type, 0) + 1
+            self.metrics["by_organization_type"][org_type] += 1
             
             # Update state metrics
             state = org.state
             if state:
-                self.metrics["by_state"][state] = self.metrics["by_state"].get(state, 0) + 1
+                self.metrics["by_state"][state] += 1
         
         logger.info(f"Contact discovery phase completed. Found {total_contacts} contacts")
     
@@ -630,46 +720,22 @@ class DiscoveryManager:
                 logger.warning(f"Could not retrieve content for {organization.website}")
                 return discovered_contacts
             
-            # Extract contacts from content
-            raw_contacts = self._extract_contacts_from_content(content, organization, profiles)
+            # Names of the organization's existing contacts, used for duplicate checks
+            known_names = crud.get_contact_name_index(self.db_session, organization.id)
             
-            # Process and validate contacts
-            for contact_data in raw_contacts:
-                # Check if contact already exists
-                from app.database import crud
-                if crud.contact_exists(
-                    self.db_session, 
-                    contact_data.get("first_name", ""), 
-                    contact_data.get("last_name", ""), 
-                    organization.id
-                ):
-                    continue
-                
-                # Create new contact
-                contact = Contact(
-                    organization_id=organization.id,
-                    first_name=contact_data.get("first_name", ""),
-                    last_name=contact_data.get("last_name", ""),
-                    job_title=contact_data.get("job_title", ""),
-                    email=contact_data.get("email", ""),
-                    phone=contact_data.get("phone", ""),
-                    discovery_method="website",
-                    discovery_url=organization.website,
-                    contact_confidence_score=contact_data.get("confidence", 0.7),
-                    contact_relevance_score=contact_data.get("relevance", 7.0),
-                    notes=contact_data.get("notes", "")
-                )
-                
-                # Assign contact to appropriate user based on organization type
-                from app.utils.contact_assigner import assign_contact_to_user
-                assign_contact_to_user(contact, organization)
-                
-                self.db_session.add(contact)
-                self.db_session.commit()
-                
-                discovered_contacts.append(contact)
+            # Worker threads get plain values: the Session is not thread-safe, and the
+            # crawler's commits below expire the organization's attributes
+            org_name = organization.name
+            org_website = organization.website
+            
+            # Extract contacts from the main page in the background so the Gemini
+            # call overlaps with crawling the secondary links below
+            main_future = self._link_executor.submit(
+                self._extract_contacts_from_content, content, org_name, org_website, profiles
+            )
             
-            # Follow any staff/team/about links to find more contacts
+            # Crawl any staff/team/about links (sequentially, as the crawler shares the DB session)
+            link_pages = []
             for link in links:
                 # Check if link contains keywords suggesting contact information
                 link_lower = link.lower()
@@ -682,57 +748,52 @@ class DiscoveryManager:
                         link_content = result.get("html_content", "")
                         
                         if link_content:
-                            # Extract contacts
-                            link_contacts = self._extract_contacts_from_content(link_content, organization, profiles)
-                            
-                            # Process and validate contacts
-                            for contact_data in link_contacts:
-                                # Check if contact already exists
-                                if crud.contact_exists(
-                                    self.db_session, 
-                                    contact_data.get("first_name", ""), 
-                                    contact_data.get("last_name", ""), 
-                                    organization.id
-                                ):
-                                    continue
-                                
-                                # Create new contact
-                                contact = Contact(
-                                    organization_id=organization.id,
-                                    first_name=contact_data.get("first_name", ""),
-                                    last_name=contact_data.get("last_name", ""),
-                                    job_title=contact_data.get("job_title", ""),
-                                    email=contact_data.get("email", ""),
-                                    phone=contact_data.get("phone", ""),
-                                    discovery_method="website_secondary",
-                                    discovery_url=link,
-                                    contact_confidence_score=contact_data.get("confidence", 0.7),
-                                    contact_relevance_score=contact_data.get("relevance", 7.0),
-                                    notes=contact_data.get("notes", "")
-                                )
-                                
-                                # Assign contact to appropriate user based on organization type
-                                from app.utils.contact_assigner import assign_contact_to_user
-                                assign_contact_to_user(contact, organization)
-                                
-                                self.db_session.add(contact)
-                                self.db_session.commit()
-                                
-                                discovered_contacts.append(contact)
+                            link_pages.append((link, link_content))
                     
                     except Exception as e:
                         logger.error(f"Error crawling contact link {link}: {e}")
             
+            # Extract contacts from the linked pages in parallel (dominated by Gemini latency).
+            # Gemini concurrency stays bounded by the shared Gemini executor.
+            link_futures = [
+                (link, self._link_executor.submit(
+                    self._extract_contacts_from_content, link_content, org_name, org_website, profiles
+                ))
+                for link, link_content in link_pages
+            ]
+            
+            # Let every extraction finish before anything is validated or committed,
+            # so no worker is still running while the session changes
+            concurrent.futures.wait([main_future] + [future for _, future in link_futures])
+            
+            # Main page extraction errors propagate to the fallback path
+            raw_contacts = self._validate_extracted_contacts(org_name, main_future.result())
+            
+            # Collect contacts from the linked pages in link order
+            link_results = []
+            for link, future in link_futures:
+                try:
+                    link_results.append((link, self._validate_extracted_contacts(org_name, future.result())))
+                except Exception as e:
+                    logger.error(f"Error crawling contact link {link}: {e}")
+            
+            # Process and validate contacts
+            discovered_contacts.extend(self._materialize_contacts(
+                organization, raw_contacts, known_names,
+                discovery_method="website",
+                discovery_url=org_website
+            ))
+            
+            for link, link_contacts in link_results:
+                discovered_contacts.extend(self._materialize_contacts(
+                    organization, link_contacts, known_names,
+                    discovery_method="website_secondary",
+                    discovery_url=link
+                ))
+            
             # Always perform position-based searches to find role-specific contacts
             # Prepare organization data for discovery
-            org_data = {
-                "name": organization.name,
-                "website": organization.website,
-                "org_type": organization.org_type,
-                "state": organization.state,
-                "city": organization.city or "",
-                "location": f"{organization.city}, {organization.state}" if organization.city else organization.state
-            }
+            org_data = self._build_org_data(organization)
             
             # 1. First, always perform role/title specific searches to find key personnel
             logger.info(f"Performing position-based search for {organization.name}")
@@ -745,7 +806,7 @@ class DiscoveryManager:
             
             if position_contacts_data:
                 logger.info(f"Found {len(position_contacts_data)} contacts via position-based search")
-                self.metrics["by_source"]["position_search"] = self.metrics["by_source"].get("position_search", 0) + len(position_contacts_data)
+                self.metrics["by_source"]["position_search"] += len(position_contacts_data)
             
             # 2. Then check if we need additional fallback discovery
             actual_contacts = [c for c in discovered_contacts if c.first_name and c.last_name and c.discovery_method != 'inferred']
@@ -766,22 +827,28 @@ class DiscoveryManager:
                 
                 # Process the fallback contacts
                 # First, prioritize actual contacts with names over generic ones
-                real_contacts = [c for c in fallback_contacts_data if c.get("first_name") and c.get("last_name") and not c.get("is_generic", False)]
-                generic_contacts = [c for c in fallback_contacts_data if c.get("is_generic", False)]
+                # (single pass; contacts that are neither named nor generic are skipped)
+                real_contacts = []
+                generic_contacts = []
+                for c in fallback_contacts_data:
+                    if c.get("is_generic", False):
+                        generic_contacts.append(c)
+                    elif c.get("first_name") and c.get("last_name"):
+                        real_contacts.append(c)
                 
                 # Sort by confidence score within each group
                 real_contacts.sort(key=lambda x: x.get("confidence_score", 0), reverse=True)
                 prioritized_contacts = real_contacts + generic_contacts
                 
                 # Process in priority order
-                from app.database import crud
                 for contact_data in prioritized_contacts:
                     # Check if contact already exists
                     first_name = contact_data.get("first_name", "")
                     last_name = contact_data.get("last_name", "")
+                    contact_name = crud.normalize_contact_name(first_name, last_name)
                     
                     if first_name and last_name:
-                        if crud.contact_exists(self.db_session, first_name, last_name, organization.id):
+                        if crud.contact_name_matches(contact_name, known_names):
                             continue
                     elif contact_data.get("email"):
                         # Check by email if no name
@@ -825,22 +892,22 @@ class DiscoveryManager:
                     )
                     
                     # Assign contact to appropriate user based on organization type
-                    from app.utils.contact_assigner import assign_contact_to_user
                     assign_contact_to_user(contact, organization)
                     
                     self.db_session.add(contact)
                     self.db_session.commit()
+                    known_names.add(contact_name)
                     
                     discovered_contacts.append(contact)
                 
                 # Update metrics with a breakdown of real vs generic contacts
-                real_contacts_added = len([c for c in fallback_contacts_data if c.get("first_name") and c.get("last_name") and not c.get("is_generic", False)])
-                generic_contacts_added = len([c for c in fallback_contacts_data if c.get("is_generic", False)])
+                real_contacts_added = len(real_contacts)
+                generic_contacts_added = len(generic_contacts)
                 
                 if fallback_contacts_data:
                     logger.info(f"Found {len(fallback_contacts_data)} additional contacts using fallback discovery ({real_contacts_added} real, {generic_contacts_added} generic)")
-                    self.metrics["by_source"]["fallback_discovery"] = self.metrics["by_source"].get("fallback_discovery", 0) + real_contacts_added
-                    self.metrics["by_source"]["generic_contacts"] = self.metrics["by_source"].get("generic_contacts", 0) + generic_contacts_added
+                    self.metrics["by_source"]["fallback_discovery"] += real_contacts_added
+                    self.metrics["by_source"]["generic_contacts"] += generic_contacts_added
             
             return discovered_contacts
         
@@ -853,43 +920,23 @@ class DiscoveryManager:
                     logger.info(f"Attempting fallback discovery after error for {organization.name}")
                     
                     # Prepare organization data for fallback discovery
-                    org_data = {
-                        "name": organization.name,
-                        "website": organization.website,
-                        "org_type": organization.org_type,
-                        "state": organization.state,
-                        "city": organization.city or "",
-                        "location": f"{organization.city}, {organization.state}" if organization.city else organization.state
-                    }
+                    org_data = self._build_org_data(organization)
                     
                     # Use fallback discovery
                     fallback_contacts_data = self.fallback_discovery.discover_contacts(org_data, min_contacts=3)
                     
-                    # Process the fallback contacts (simplified to avoid repeating too much code)
-                    for contact_data in fallback_contacts_data:
-                        contact = Contact(
-                            organization_id=organization.id,
-                            first_name=contact_data.get("first_name", ""),
-                            last_name=contact_data.get("last_name", ""),
-                            job_title=contact_data.get("job_title", ""),
-                            email=contact_data.get("email", ""),
-                            phone=contact_data.get("phone", ""),
-                            discovery_method="fallback_after_error",
-                            discovery_url=contact_data.get("source_url", organization.website),
-                            contact_confidence_score=contact_data.get("confidence_score", 0.5),
-                            contact_relevance_score=contact_data.get("relevance_score", 5.0),
-                            notes="Discovered using fallback methods after primary discovery error"
-                        )
-                        
-                        # Assign contact to appropriate user based on organization type
-                        from app.utils.contact_assigner import assign_contact_to_user
-                        assign_contact_to_user(contact, organization)
-                        
-                        self.db_session.add(contact)
-                        discovered_contacts.append(contact)
-                    
-                    if discovered_contacts:
-                        self.db_session.commit()
+                    # Process the fallback contacts
+                    known_names = crud.get_contact_name_index(self.db_session, organization.id)
+                    discovered_contacts.extend(self._materialize_contacts(
+                        organization, fallback_contacts_data, known_names,
+                        discovery_method="fallback_after_error",
+                        discovery_url=organization.website,
+                        confidence_key="confidence_score",
+                        default_confidence=0.5,
+                        relevance_key="relevance_score",
+                        default_relevance=5.0,
+                        notes="Discovered using fallback methods after primary discovery error"
+                    ))
                         
                     logger.info(f"Fallback discovery found {len(discovered_contacts)} contacts after error")
                     return discovered_contacts
@@ -898,13 +945,136 @@ class DiscoveryManager:
             
             return discovered_contacts
     
-    def _extract_contacts_from_content(self, content: str, organization: Organization, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _build_org_data(self, organization: Organization) -> Dict[str, str]:
+        """
+        Build the organization dictionary used by the fallback discovery system.
+        
+        Args:
+            organization: Organization record
+            
+        Returns:
+            Dictionary with organization name, website, type and location
+        """
+        return {
+            "name": organization.name,
+            "website": organization.website,
+            "org_type": organization.org_type,
+            "state": organization.state,
+            "city": organization.city or "",
+            "location": f"{organization.city}, {organization.state}" if organization.city else organization.state
+        }
+    
+    def _materialize_contacts(self, organization: Organization, contacts_data: List[Dict[str, Any]],
+                              known_names: set, *, discovery_method: str, discovery_url: str,
+                              confidence_key: str = "confidence", default_confidence: float = 0.7,
+                              relevance_key: str = "relevance", default_relevance: float = 7.0,
+                              notes: Optional[str] = None) -> List[Contact]:
+        """
+        Create, assign and save Contact records for extracted contact dictionaries.
+        
+        Contacts whose name matches one in known_names are skipped; the names of
+        new contacts are added to known_names. All new contacts are committed at
+        once; if that commit fails, they are saved one by one so a single bad
+        row does not discard the rest.
+        
+        Args:
+            organization: Organization record
+            contacts_data: List of extracted contact dictionaries
+            known_names: Normalized names of the organization's existing contacts
+            discovery_method: Discovery method recorded on the contacts
+            discovery_url: Discovery URL used when a contact has no source_url
+            confidence_key: Key holding the confidence score in contacts_data
+            default_confidence: Confidence score used when the key is missing
+            relevance_key: Key holding the relevance score in contacts_data
+            default_relevance: Relevance score used when the key is missing
+            notes: Notes for all contacts (defaults to each contact's own notes)
+            
+        Returns:
+            List of newly created contacts
+        """
+        new_contacts = []
+        new_names = []
+        
+        for contact_data in contacts_data:
+            # Check if contact (or a variant of its name) already exists
+            contact_name = crud.normalize_contact_name(contact_data.get("first_name", ""), contact_data.get("last_name", ""))
+            if crud.contact_name_matches(contact_name, known_names):
+                continue
+            
+            # Create new contact
+            contact = Contact(
+                organization_id=organization.id,
+                first_name=contact_data.get("first_name", ""),
+                last_name=contact_data.get("last_name", ""),
+                job_title=contact_data.get("job_title", ""),
+                email=contact_data.get("email", ""),
+                phone=contact_data.get("phone", ""),
+                discovery_method=discovery_method,
+                discovery_url=contact_data.get("source_url") or discovery_url,
+                contact_confidence_score=contact_data.get(confidence_key, default_confidence),
+                contact_relevance_score=contact_data.get(relevance_key, default_relevance),
+                notes=notes if notes is not None else contact_data.get("notes", "")
+            )
+            
+            # Assign contact to appropriate user based on organization type
+            assign_contact_to_user(contact, organization)
+            
+            self.db_session.add(contact)
+            known_names.add(contact_name)
+            new_contacts.append(contact)
+            new_names.append(contact_name)
+        
+        if not new_contacts:
+            return new_contacts
+        
+        try:
+            self.db_session.commit()
+            return new_contacts
+        except Exception as e:
+            logger.error(f"Error saving {len(new_contacts)} contacts for {organization.name}, saving individually: {e}")
+            self.db_session.rollback()
+        
+        saved_contacts = []
+        for contact, contact_name in zip(new_contacts, new_names):
+            try:
+                self.db_session.add(contact)
+                self.db_session.commit()
+                saved_contacts.append(contact)
+            except Exception as e:
+                logger.error(f"Error saving contact {contact.first_name} {contact.last_name}: {e}")
+                self.db_session.rollback()
+                known_names.discard(contact_name)
+        
+        return saved_contacts
+    
+    def _validate_extracted_contacts(self, org_name: str, contacts_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Filter extracted contacts before they are saved.
+        
+        Always called on the thread that owns the database session. The base
+        implementation keeps every contact.
+        
+        Args:
+            org_name: Organization name
+            contacts_data: List of extracted contact dictionaries
+            
+        Returns:
+            List of contact dictionaries to save
+        """
+        return contacts_data
+    
+    def _extract_contacts_from_content(self, content: str, org_name: str, org_website: str,
+                                       profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Extract contacts from content using Gemini API with fallback to regex-based extraction.
         
+        Runs on worker threads, so it takes plain organization values and does
+        not use the database session.
+        
         Args:
             content: HTML content
-            organization: Organization record
+            org_name: Organization name
+            org_website: Organization website (used for logging)
             profiles: List of role profiles
             
         Returns:
@@ -915,28 +1085,36 @@ class DiscoveryManager:
         text_contacts = []
         fallback_contacts = []
         
+        # Parse the page once and share the tree/text between all extraction methods
+        soup = BeautifulSoup(content, 'html.parser')
+        
         # Try structured contact extraction (using HTML patterns)
-        structured_contacts = self._extract_structured_contacts(content)
+        structured_contacts = self._extract_structured_contacts(soup)
         if structured_contacts:
-            logger.info(f"Found {len(structured_contacts)} structured contacts from {organization.website}")
+            logger.info(f"Found {len(structured_contacts)} structured contacts from {org_website}")
             contacts.extend(structured_contacts)
         
+        # Convert HTML to text (strips boilerplate elements from the tree)
+        page_text = self.org_extractor.soup_to_text(soup)
+        
         # Try text-based extraction (using text patterns)
-        text_contacts = self._extract_text_contacts(content)
+        text_contacts = self._extract_text_contacts(page_text)
         if text_contacts:
-            logger.info(f"Found {len(text_contacts)} text contacts from {organization.website}")
+            logger.info(f"Found {len(text_contacts)} text contacts from {org_website}")
             contacts.extend(text_contacts)
             
-        # Always continue to try Gemini API, even if we found contacts through simpler methods
+        # Skip the (expensive) Gemini API when the simpler methods already found enough
+        # named contacts; email-only matches don't replace the people Gemini would find
+        named_count = sum(1 for contact in contacts if contact.get("first_name") and contact.get("last_name"))
+        if named_count >= self.gemini_skip_threshold:
+            logger.info(f"Skipping Gemini extraction for {org_website} - "
+                        f"{named_count} named contacts found by structured/text extraction")
+            return contacts
             
         # Otherwise try the Gemini API method
         try:
-            # Convert HTML to text
-            text = self.org_extractor.html_to_text(content)
-            
-            # Truncate text if too long (Gemini has token limits)
-            if len(text) > 15000:
-                text = text[:15000]
+            # Build the (truncated) prompt text from the contact-relevant sections only
+            text = self._build_prompt_text(soup, page_text)
             
             # Create role titles list for the prompt
             role_titles = []
@@ -946,7 +1124,7 @@ class DiscoveryManager:
             
             # Create the prompt
             prompt = f"""
-            Extract contact information for individuals at {organization.name} with roles related to SCADA systems, 
+            Extract contact information for individuals at {org_name} with roles related to SCADA systems, 
             water management, automation, or operations from the following text.
             
             Focus on finding people with these job titles or similar roles:
@@ -972,81 +1150,136 @@ class DiscoveryManager:
             If no valid contacts are found, return an empty array.
             """
             
-            # Call Gemini API
-            import google.generativeai as genai
-            from app.config import GEMINI_API_KEY
-            import json
-            import re
-            
-            # Initialize API if needed
-            genai.configure(api_key=GEMINI_API_KEY)
-            
-            # Add rate limiting - sleep for 1 second before API call
-            import time
-            time.sleep(1)
+            gemini_contacts = self._generate_gemini_contacts(prompt, org_name, org_website)
             
-            # Call the API with a timeout
-            import concurrent.futures
+            # Don't filter out contacts by confidence score
+            valid_contacts = gemini_contacts
             
-            def call_gemini():
-                model = genai.GenerativeModel('gemini-2.0-flash')
-                return model.generate_content(prompt)
-                
-            # Use executor to implement timeout
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(call_gemini)
-                try:
-                    # Increase timeout to 20 seconds
-                    response = future.result(timeout=20)
-                    
-                    # Process response text
-                    response_text = response.text
-                    
-                    # Find JSON in response
-                    json_match = re.search(r'\[\s*{.*}\s*\]', response_text, re.DOTALL)
-                    if json_match:
-                        json_str = json_match.group(0)
-                    else:
-                        # Try to find anything that looks like JSON
-                        json_str = response_text
-                    
-                    # Parse the JSON response
-                    gemini_contacts = json.loads(json_str)
-                    
-                    # Don't filter out contacts by confidence score
-                    valid_contacts = gemini_contacts
-                    
-                    if valid_contacts:
-                        logger.info(f"Found {len(valid_contacts)} contacts via Gemini API from {organization.website}")
-                        contacts.extend(valid_contacts)
-                        
-                except concurrent.futures.TimeoutError:
-                    logger.error(f"Gemini API timed out for {organization.name}")
-                    # Stop the operation instead of falling back
-                    raise Exception(f"Gemini API timeout for {organization.name} - stopping operation")
-                except Exception as e:
-                    logger.error(f"Error extracting contacts with Gemini API: {e}")
-                    # Stop the operation when API fails
-                    raise
+            if valid_contacts:
+                logger.info(f"Found {len(valid_contacts)} contacts via Gemini API from {org_website}")
+                contacts.extend(valid_contacts)
         
         except Exception as e:
             logger.error(f"Error in Gemini extraction setup: {e}")
             # Stop the operation when Gemini API fails
             raise
                 
-        logger.info(f"Found {len(structured_contacts)} structured contacts, {len(text_contacts)} text contacts from {organization.website}")
+        logger.info(f"Found {len(structured_contacts)} structured contacts, {len(text_contacts)} text contacts from {org_website}")
         
         return contacts
         
-    def _extract_structured_contacts(self, html_content: str) -> List[Dict[str, Any]]:
-        """Extract contacts from structured HTML content (team pages, staff listings, etc.)"""
-        contacts = []
+    def _generate_gemini_contacts(self, prompt: str, org_name: str, org_website: str) -> List[Dict[str, Any]]:
+        """
+        Run the contact extraction prompt through Gemini, using the result cache.
+        
+        Args:
+            prompt: Fully rendered extraction prompt
+            org_name: Organization name (used for logging)
+            org_website: Organization website (used for logging)
+            
+        Returns:
+            List of contact dictionaries parsed from the Gemini response
+        """
+        # Skip the API entirely if this exact prompt was answered recently
+        cache_key = make_cache_key(prompt)
+        cached_contacts = self._gemini_cache.get(cache_key)
+        if cached_contacts is not None:
+            logger.info(f"Using cached Gemini contacts for {org_website}")
+            return cached_contacts
+        
+        if self._gemini_model is None:
+            raise Exception("Gemini API is not configured")
+        
+        # Rate limiting - only waits when the per-minute quota is exhausted
+        _gemini_rate_limiter.acquire()
         
-        # Parse HTML
-        from bs4 import BeautifulSoup
+        # Call the API with a timeout
+        def call_gemini():
+            return self._gemini_model.generate_content(prompt)
+            
+        # Use the shared executor to implement timeout
+        future = self._gemini_executor.submit(call_gemini)
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # Increase timeout to 20 seconds
+            response = future.result(timeout=20)
+            
+            # Process response text
+            response_text = response.text
+            
+            # Find JSON in response
+            json_match = _JSON_ARRAY_RE.search(response_text)
+            if json_match:
+                json_str = json_match.group(0)
+            else:
+                # Try to find anything that looks like JSON
+                json_str = response_text
+            
+            # Parse the JSON response
+            gemini_contacts = json.loads(json_str)
+            
+        except concurrent.futures.TimeoutError:
+            logger.error(f"Gemini API timed out for {org_name}")
+            # Stop the operation instead of falling back
+            raise Exception(f"Gemini API timeout for {org_name} - stopping operation")
+        except Exception as e:
+            logger.error(f"Error extracting contacts with Gemini API: {e}")
+            # Stop the operation when API fails
+            raise
+        
+        self._gemini_cache.set(cache_key, gemini_contacts)
+        return gemini_contacts
+    
+    def _build_prompt_text(self, soup: BeautifulSoup, page_text: str, max_tokens: int = GEMINI_MAX_TEXT_TOKENS) -> str:
+        """
+        Build the page text for the Gemini prompt.
+        
+        Only the main/article and team/staff/contact sections are converted to
+        text, and conversion stops once max_chars have been collected, so large
+        pages are not fully stringified just to be truncated afterwards. The
+        budget is given in tokens but enforced as a character limit using a
+        chars-per-token estimate; tokens are never actually counted.
+        
+        Args:
+            soup: Parsed HTML tree (boilerplate already removed)
+            page_text: Full page text, used when no contact sections are found
+            max_tokens: Approximate maximum number of tokens to return
+            
+        Returns:
+            Prompt text of at most max_tokens * _APPROX_CHARS_PER_TOKEN characters
+        """
+        max_chars = max_tokens * _APPROX_CHARS_PER_TOKEN
+        
+        sections = soup.select(_CONTACT_SECTION_SELECTOR)
+        if not sections:
+            return page_text[:max_chars]
+        
+        selected = set(map(id, sections))
+        parts = []
+        length = 0
+        for section in sections:
+            # Skip sections nested inside another selected section
+            if any(id(parent) in selected for parent in section.parents):
+                continue
             
+            section_text = section.get_text(separator=' ', strip=True)
+            if not section_text:
+                continue
+            
+            parts.append(section_text)
+            length += len(section_text) + 1
+            if length >= max_chars:
+                break
+        
+        if not parts:
+            return page_text[:max_chars]
+        
+        return re.sub(r'\s+', ' ', ' '.join(parts)).strip()[:max_chars]
+    
+    def _extract_structured_contacts(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """Extract contacts from a parsed HTML tree (team pages, staff listings, etc.)"""
+        contacts = []
+        
+        try:
             # Look for structured patterns like staff listings, team pages, etc.
             # This is a simplified implementation - a real one would be more sophisticated
             
@@ -1055,24 +1288,23 @@ class DiscoveryManager:
             logger.error(f"Error extracting structured contacts: {e}")
             return []
             
-    def _extract_text_contacts(self, html_content: str) -> List[Dict[str, Any]]:
-        """Extract contacts using text patterns (regexes for emails, names, titles, etc.)"""
+    def _extract_text_contacts(self, text: str) -> List[Dict[str, Any]]:
+        """Extract contacts from page text using patterns (regexes for emails, names, titles, etc.)"""
         contacts = []
         
-        # Parse HTML to text
-        text = self.org_extractor.html_to_text(html_content)
-        
-        # Look for email patterns
-        import re
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        
         # Find all emails
-        emails = re.findall(email_pattern, text)
+        emails = _EMAIL_RE.findall(text)
+        seen_emails = set()
         
         # For each email, try to extract other information
         for email in emails:
+            # Skip emails we have already added
+            if email in seen_emails:
+                continue
+            seen_emails.add(email)
+            
             # Simple extraction - a real implementation would be more sophisticated
-            contact = {
+            contacts.append({
                 "email": email,
                 "first_name": "",
                 "last_name": "",
@@ -1081,11 +1313,7 @@ class DiscoveryManager:
                 "confidence": 0.75,
                 "relevance": 7.0,
                 "notes": "Extracted from website text patterns"
-            }
-            
-            # Add if it's not already in the list
-            if not any(c.get("email") == email for c in contacts):
-                contacts.append(contact)
+            })
                 
         return contacts
         
@@ -1094,14 +1322,17 @@ class DiscoveryManager:
         contacts = []
         
         # Extract general contact information
-        from bs4 import BeautifulSoup
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Look for "Contact Us" text
-            contact_elements = soup.find_all(text=lambda text: "contact" in text.lower() if text else False)
+            # Look for "Contact Us" text, streaming the page and stopping at the first match
+            scanner = _ContactTextScanner()
+            for start in range(0, len(html_content), _SCAN_CHUNK_SIZE):
+                scanner.feed(html_content[start:start + _SCAN_CHUNK_SIZE])
+                if scanner.found:
+                    break
+            else:
+                scanner.close()
             
-            if contact_elements:
+            if scanner.found:
                 # Very simple fallback - in a real implementation this would be more sophisticated
                 contact = {
                     "first_name": "Contact",
@@ -1134,7 +1365,7 @@ class DiscoveryManager:
                 urls_crawled=self.metrics["urls_crawled"],
                 organizations_discovered=self.metrics["organizations_discovered"],
                 contacts_discovered=self.metrics["contacts_discovered"],
-                search_queries_executed=self.metrics["search_queries_executed"],
+                search_queries_executed=self.metrics.get("search_queries_executed", 0),
                 runtime_seconds=runtime_seconds
             )
             
@@ -1144,4 +1375,5 @@ class DiscoveryManager:
             logger.info(f"Saved metrics to database")
         
         except Exception as e:
-            logger.error(f"Error saving metrics to database: {e}")
\ No newline at end of file
+            logger.error(f"Error saving metrics to database: {e}")
+            self.db_session.rollback()
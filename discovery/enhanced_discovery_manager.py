@@ -6,17 +6,26 @@ that are likely to need SCADA integration services, focusing on infrastructure
 and operational indicators rather than explicit SCADA mentions.
 """
 
+import concurrent.futures
+import functools
+import heapq
 import json
 import time
 import random
 import datetime
 import logging
+import threading
+from types import MappingProxyType
 from typing import Dict, List, Any, Tuple, Optional, Set
-from urllib.parse import urlparse
+from urllib.parse import unquote, urlparse
 import re
+from collections import Counter, defaultdict
+from operator import itemgetter
 
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, func, desc, tuple_
+from sqlalchemy.orm.attributes import flag_modified
 from bs4 import BeautifulSoup
+import orjson
 import tldextract
 
 from app.database.models import (
@@ -28,8 +37,11 @@ from app.database.models import (
     DiscoveryCheckpoint
 )
 from app.discovery.search.google_search import GoogleSearchClient
+from app.discovery.http_session import create_http_session
 from app.discovery.mock_crawler import MockCrawler
 from app.discovery.organization_extractor import OrganizationExtractor
+from app.discovery.rate_limiter import TokenBucket
+from app.discovery.result_cache import ResultCache, make_cache_key
 from app.utils.gemini_client import GeminiClient
 from app.utils.logger import setup_logger
 from app.config import (
@@ -38,12 +50,425 @@ from app.config import (
     REGULATORY_REQUIREMENT_KEYWORDS,
     ORG_RELEVANCE_INDICATORS,
     COMPETITOR_INDICATORS,
-    IMPROVED_SEARCH_QUERIES
+    IMPROVED_SEARCH_QUERIES,
+    RESULT_CACHE_PATH,
+    GEMINI_CACHE_TTL_DAYS,
+    CRAWLER_POLITENESS_DELAY
 )
 
 # Set up logging
 logger = setup_logger("enhanced_discovery")
 
+# Number of search API queries executed concurrently during the search phase
+SEARCH_CONCURRENCY = 2
+
+# Bulky per-page fields kept out of checkpoint payloads
+_CHECKPOINT_EXCLUDED_FIELDS = frozenset(["html_content"])
+
+
+def _checkpoint_view(organizations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Project organization records for checkpointing, dropping page content.
+    
+    Args:
+        organizations: Crawled or ranked organization dictionaries
+        
+    Returns:
+        Shallow copies without the bulky page content fields
+    """
+    return [
+        {key: value for key, value in org.items() if key not in _CHECKPOINT_EXCLUDED_FIELDS}
+        for org in organizations
+    ]
+
+
+# Number of extracted organizations saved per database commit during the crawl
+ORG_COMMIT_BATCH_SIZE = 50
+
+# Search results crawled per requested organization (not every page yields one)
+SEARCH_RESULT_FAN_OUT = 5
+
+# Characters of page text per URL sent to Gemini for contact extraction
+CONTACT_PAGE_TEXT_LIMIT = 20000
+
+# Worker threads for contact extraction (one organization's pages plus its Gemini request)
+CONTACT_EXTRACTION_WORKERS = 6
+
+# Search result prioritization: preferred domain suffixes (a tuple, so one
+# str.endswith call checks them all), positive and negative terms. The terms
+# are plain lowercase substrings; a compiled alternation measured ~3x slower
+# on titles/snippets and would miss overlapping terms such as "water" in
+# "wastewater"
+PRIORITY_DOMAINS = (".gov", ".edu", ".org", ".us")
+PRIORITY_TERMS = (
+    "water", "wastewater", "utility", "municipal", "city of",
+    "county of", "authority", "district", "department", "agency",
+    "plant", "facility", "infrastructure", "engineering"
+)
+NEGATIVE_TERMS = ("scada provider", "scada integrator", "integration services")
+
+# Single extractor using the bundled public suffix list snapshot (no network fetch)
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=())
+
+
+@functools.lru_cache(maxsize=8192)
+def _extract_registered_domain(url: str) -> str:
+    """
+    Extract the registered domain (e.g. example.com) from a URL, memoized per URL.
+    
+    Args:
+        url: URL string
+        
+    Returns:
+        Domain string
+    """
+    try:
+        # Extract root domain plus suffix (e.g., example.com)
+        ext = _TLD_EXTRACT(url)
+        return f"{ext.domain}.{ext.suffix}"
+    except Exception:
+        # Fallback to simple parsing
+        try:
+            return urlparse(url).netloc
+        except Exception:
+            return url
+
+
+def _lowered_keywords(keywords: List[str]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Pair each keyword with its lowercase form so matching never re-lowers keywords.
+    
+    Case-insensitive duplicates are dropped (first spelling wins), so a table
+    can never report the same match twice and the match lists need no
+    membership checks while scanning.
+    """
+    unique = {}
+    for keyword in keywords:
+        unique.setdefault(keyword.lower(), keyword)
+    return tuple((keyword, keyword_lower) for keyword_lower, keyword in unique.items())
+
+
+# Keyword tables lowered once at import time for case-insensitive matching.
+# Plain substring checks against the lowercased page are kept on purpose: a
+# compiled IGNORECASE alternation over the same lists scans far slower in
+# CPython's backtracking regex engine and cannot report every matching keyword.
+_INFRASTRUCTURE_KEYWORDS = {
+    industry: _lowered_keywords(keywords)
+    for industry, keywords in INFRASTRUCTURE_PROCESS_KEYWORDS.items()
+}
+_OPERATIONAL_CHALLENGE_KEYWORDS = _lowered_keywords(OPERATIONAL_CHALLENGE_KEYWORDS)
+_REGULATORY_REQUIREMENT_KEYWORDS = _lowered_keywords(REGULATORY_REQUIREMENT_KEYWORDS)
+_RELEVANCE_INDICATOR_KEYWORDS = {
+    industry: {
+        "infrastructure": _lowered_keywords(indicators.get("infrastructure", [])),
+        "processes": _lowered_keywords(indicators.get("processes", []))
+    }
+    for industry, indicators in ORG_RELEVANCE_INDICATORS.items()
+}
+_COMPETITOR_KEYWORDS = _lowered_keywords(COMPETITOR_INDICATORS)
+
+# Phrases that mark a page as a likely competitor on their own
+_COMPETITOR_PHRASES = ("scada integrator", "scada provider", "system integrator", "integration services")
+
+
+class _PageKeywordIndex:
+    """
+    Case-insensitive keyword lookups against the text of one page.
+    
+    The text is lowercased once and each keyword is searched at most once, so
+    every analyzer sharing an index scans the page for a given keyword only once.
+    """
+    
+    def __init__(self, text_content: str):
+        self.text_lower = text_content.lower()
+        self._found = {}
+    
+    def contains(self, keyword_lower: str) -> bool:
+        """
+        Check whether a lowercase keyword occurs in the page text.
+        
+        Args:
+            keyword_lower: Lowercased keyword
+            
+        Returns:
+            True if the keyword occurs in the page
+        """
+        hit = self._found.get(keyword_lower)
+        if hit is None:
+            hit = self._found[keyword_lower] = keyword_lower in self.text_lower
+        return hit
+
+# Relevance multipliers by organization type. These are different than the
+# priority values - they represent how likely an organization of this type
+# is to need SCADA services
+TYPE_MULTIPLIERS = MappingProxyType({
+    "water": 1.0,           # Top tier: Water treatment/distribution has very high SCADA needs
+    "wastewater": 1.0,      # Top tier: Wastewater treatment has very high SCADA needs
+    "utility": 0.95,        # Very high: Utilities generally need monitoring/control
+    "oil_gas": 0.95,        # Very high: Oil & gas operations need extensive monitoring
+    "agriculture": 0.9,     # High: Large irrigation districts need water management
+    "municipal": 0.9,       # High: Municipalities often manage multiple infrastructure systems
+    "transportation": 0.85, # Good: Traffic systems, tunnels, etc.
+    "engineering": 0.75,    # Moderate: Engineering firms may handle SCADA projects for clients
+    "government": 0.75,     # Moderate: Depends on the specific government function
+    "healthcare": 0.7,      # Moderate: Building automation, but less core to operations
+})
+
+
+# Contact role profiles for each organization type (read-only, built once at import)
+ROLE_PROFILES = MappingProxyType({
+    "water": (
+        "Public Works Director", "Water Treatment Superintendent", 
+        "Operations Manager", "Utility Director", "City Engineer",
+        "Water Systems Manager", "Plant Supervisor"
+    ),
+    "wastewater": (
+        "Wastewater Superintendent", "Treatment Plant Supervisor",
+        "Operations Manager", "Public Works Director", "Facilities Manager",
+        "Process Control Supervisor", "Plant Engineer"
+    ),
+    "utility": (
+        "Operations Director", "Director of Engineering", "Utility Manager",
+        "Operations Supervisor", "Facilities Director", "Systems Engineer",
+        "Chief Engineer", "Operations Supervisor", "Control Room Supervisor"
+    ),
+    "municipal": (
+        "Public Works Director", "City Engineer", "Facilities Manager",
+        "Infrastructure Manager", "Utility Director", "Operations Manager"
+    ),
+    "oil_gas": (
+        "Operations Manager", "Automation Engineer", "Production Supervisor",
+        "Facilities Manager", "Engineering Manager", "Production Engineer",
+        "Operations Supervisor"
+    ),
+    "agriculture": (
+        "Water Manager", "Operations Director", "Irrigation Manager",
+        "District Manager", "Engineering Manager", "Facilities Director"
+    ),
+    "transportation": (
+        "Operations Director", "Systems Manager", "Facilities Manager",
+        "Engineering Director", "Maintenance Manager", "Infrastructure Manager"
+    ),
+    "engineering": (
+        "Project Manager", "Automation Engineer", "Control Systems Engineer",
+        "Engineering Manager", "Director of Engineering", "Principal Engineer"
+    ),
+    "government": (
+        "Facilities Director", "Operations Manager", "Public Works Director",
+        "Infrastructure Manager", "Systems Administrator", "Maintenance Director"
+    ),
+    "healthcare": (
+        "Facilities Director", "Engineering Manager", "Operations Director",
+        "Plant Operations Manager", "Maintenance Director"
+    )
+})
+
+# Role synonyms to expand search
+ROLE_SYNONYMS = MappingProxyType({
+    "Director": ("Manager", "Head", "Chief", "Supervisor", "Leader"),
+    "Manager": ("Director", "Supervisor", "Head", "Chief", "Administrator"),
+    "Supervisor": ("Manager", "Coordinator", "Lead", "Chief", "Head"),
+    "Engineer": ("Specialist", "Technician", "Technologist", "Coordinator"),
+    "Superintendent": ("Manager", "Director", "Supervisor", "Chief"),
+    "Operations": ("Operational", "Operating", "Process", "Production", "Facility")
+})
+
+
+@functools.lru_cache(maxsize=32)
+def _expanded_roles_for(org_type: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Look up the contact roles for an organization type and expand them with synonyms.
+    
+    Args:
+        org_type: Lowercased organization type
+        
+    Returns:
+        Tuple of (relevant_roles, unique_expanded_roles)
+    """
+    relevant_roles = ROLE_PROFILES.get(org_type, ROLE_PROFILES.get("municipal", ()))
+    
+    # Expand role list with synonyms
+    expanded_roles = []
+    for role in relevant_roles:
+        expanded_roles.append(role)
+        
+        # Add synonym variations
+        role_words = role.split()
+        for i, word in enumerate(role_words):
+            if word in ROLE_SYNONYMS:
+                for synonym in ROLE_SYNONYMS[word]:
+                    new_role = role_words.copy()
+                    new_role[i] = synonym
+                    expanded_roles.append(" ".join(new_role))
+    
+    # Unique expanded roles, in first-seen order
+    return tuple(relevant_roles), tuple(dict.fromkeys(expanded_roles))
+
+
+# Weights of each indicator match in the infrastructure score
+INFRASTRUCTURE_MATCH_WEIGHT = 1.0
+PROCESS_MATCH_WEIGHT = 1.0
+CHALLENGE_MATCH_WEIGHT = 1.5
+REGULATORY_MATCH_WEIGHT = 1.0
+
+
+def _infrastructure_score(
+    infrastructure_count: int,
+    process_count: int,
+    challenge_count: int,
+    regulatory_count: int
+) -> float:
+    """
+    Compute a page's infrastructure score from its indicator match counts.
+    
+    Args:
+        infrastructure_count: Number of infrastructure matches
+        process_count: Number of process matches
+        challenge_count: Number of operational challenge matches
+        regulatory_count: Number of regulatory requirement matches
+        
+    Returns:
+        Infrastructure score (0-10)
+    """
+    raw_score = (
+        infrastructure_count * INFRASTRUCTURE_MATCH_WEIGHT +
+        process_count * PROCESS_MATCH_WEIGHT +
+        challenge_count * CHALLENGE_MATCH_WEIGHT +
+        regulatory_count * REGULATORY_MATCH_WEIGHT
+    )
+    
+    # Normalize to 0-10 scale
+    return min(10, raw_score)
+
+
+def _combine_relevance_score(
+    infra_score: float,
+    base_confidence: float,
+    type_multiplier: float,
+    is_competitor: bool,
+    competitor_score: float
+) -> Tuple[float, float, float]:
+    """
+    Combine an organization's indicator scores into its relevance score.
+    
+    Args:
+        infra_score: Infrastructure score (0-10)
+        base_confidence: Extraction confidence (0-1)
+        type_multiplier: Organization type multiplier
+        is_competitor: Whether the organization looks like a competitor
+        competitor_score: Competitor score (0-10)
+        
+    Returns:
+        Tuple of (raw_score, competitor_penalty, relevance_score)
+    """
+    # Combine scores with heavier weight on infrastructure indicators
+    raw_score = (
+        (infra_score * 0.6) +                   # 60% from infrastructure indicators
+        (base_confidence * 10 * 0.4)            # 40% from base confidence (scaled to 0-10)
+    ) * type_multiplier                         # Apply type multiplier
+    
+    # Apply competitor penalty if needed (capped at 8 points)
+    competitor_penalty = min(8, competitor_score * 0.8) if is_competitor else 0
+    
+    # Final relevance score clipped to the 0-10 scale
+    return raw_score, competitor_penalty, max(0, min(10, raw_score - competitor_penalty))
+
+
+# Patterns used to reduce raw HTML to its text for keyword matching
+_NON_TEXT_BLOCK_RE = re.compile(r'<(script|style|noscript|template)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def html_to_page_text(html_content: str) -> str:
+    """
+    Reduce HTML to its text for keyword matching, without parsing it.
+    
+    Script/style blocks and tags (including their attributes) are replaced by
+    spaces and whitespace runs collapsed, using precompiled regex passes.
+    Entities are left undecoded, which does not affect the plain-phrase
+    keyword tables.
+    
+    Args:
+        html_content: HTML content string
+        
+    Returns:
+        Page text
+    """
+    text = _NON_TEXT_BLOCK_RE.sub(" ", html_content)
+    text = _HTML_TAG_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def html_to_contact_text(html_content: str) -> str:
+    """
+    Convert HTML to text for contact extraction.
+    
+    Unlike html_to_page_text, the page is parsed so entities are decoded
+    (e.g. "&#64;" in obfuscated emails), and the addresses of mailto links are
+    kept next to the link text.
+    
+    Args:
+        html_content: HTML content string
+        
+    Returns:
+        Page text with mailto addresses
+    """
+    soup = BeautifulSoup(html_content, "html.parser")
+    for element in soup(["script", "style", "noscript", "template"]):
+        element.decompose()
+    
+    # Mailto addresses are often only in the href ("Email us")
+    for link in soup.select('a[href^="mailto:" i]'):
+        address = unquote(link["href"][len("mailto:"):].split("?", 1)[0]).strip()
+        if address and address not in link.get_text():
+            link.append(f" ({address})")
+    
+    return _WHITESPACE_RE.sub(" ", soup.get_text(" ")).strip()
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _is_object_array(value: Any) -> bool:
+    """Check whether a decoded JSON value is a list of objects."""
+    return isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+def extract_json_array(text: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Extract the first JSON array of objects from a model response.
+    
+    The whole response is parsed first; otherwise the decoder is started at
+    each '[' in turn, so the response is scanned linearly instead of with a
+    backtracking regex over the full text.
+    
+    Args:
+        text: Response text that may wrap a JSON array in prose or code fences
+        
+    Returns:
+        The decoded list, or None if the response contains no such array
+    """
+    try:
+        parsed = json.loads(text)
+        if _is_object_array(parsed):
+            return parsed
+    except ValueError:
+        pass
+    
+    start = text.find("[")
+    while start != -1:
+        try:
+            parsed, _ = _JSON_DECODER.raw_decode(text, start)
+            if _is_object_array(parsed):
+                return parsed
+        except ValueError:
+            pass
+        start = text.find("[", start + 1)
+    
+    return None
+
+
 class EnhancedDiscoveryManager:
     """
     Enhanced discovery manager that focuses on identifying potential SCADA integration
@@ -64,14 +489,24 @@ class EnhancedDiscoveryManager:
         self.db_session = db_session
         self.config = config
         
+        # Shared pooled HTTP session so search API calls and crawls reuse keep-alive connections
+        self._http = create_http_session(pool_size=50)
+        
         # Initialize clients
-        self.google_search = GoogleSearchClient(db_session)  # Uses config variables internally
+        self.google_search = GoogleSearchClient(db_session, http_session=self._http)  # Uses config variables internally
         # Use the real web crawler instead of the mock crawler
         from app.discovery.crawler.web_crawler import Crawler
-        self.web_crawler = Crawler(db_session)
+        self.web_crawler = Crawler(db_session, http_session=self._http)
         self.org_extractor = OrganizationExtractor(db_session)
         self.gemini_client = GeminiClient(api_key=config.GEMINI_API_KEY)
         
+        # Cache of Gemini organization extraction results keyed by page content hash
+        self._extraction_cache = ResultCache(
+            RESULT_CACHE_PATH,
+            namespace="organization_extraction",
+            ttl_seconds=GEMINI_CACHE_TTL_DAYS * 24 * 3600
+        )
+        
         # Set target industries from configuration or parameter
         if target_org_types:
             # Convert comma-separated string to list if needed
@@ -104,6 +539,12 @@ class EnhancedDiscoveryManager:
             "Illinois": "south of I-80"
         }
         
+        # Lowercased state/region names for matching against search queries
+        self._state_names_lower = [
+            (state, state.lower())
+            for state in self.target_states + list(self.special_regions.keys())
+        ]
+        
         # Priority ranking for organization types (higher = more priority)
         self.org_type_priority = {
             "water": 10,
@@ -118,6 +559,10 @@ class EnhancedDiscoveryManager:
             "healthcare": 4
         }
         
+        # Per-host politeness limiters (one request per CRAWLER_POLITENESS_DELAY seconds per host)
+        self._host_limiters = {}
+        self._host_limiters_lock = threading.Lock()
+        
         # Initialize discovery session
         self.session_id = None
         self.checkpoint_id = None
@@ -206,8 +651,8 @@ class EnhancedDiscoveryManager:
         # Load checkpoint if resuming
         if resume_from:
             try:
-                with open(f"data/checkpoints/{resume_from}", "r") as f:
-                    checkpoint_data = json.load(f)
+                with open(f"data/checkpoints/{resume_from}", "rb") as f:
+                    checkpoint_data = orjson.loads(f.read())
                 
                 self.session_id = checkpoint_data.get("session_id")
                 self.checkpoint_id = checkpoint_data.get("checkpoint_id")
@@ -289,7 +734,7 @@ class EnhancedDiscoveryManager:
         
         # Create checkpoint after crawl phase
         self.create_checkpoint("crawl_complete", {
-            "crawled_organizations": crawled_organizations if crawled_organizations else [],
+            "crawled_organizations": _checkpoint_view(crawled_organizations) if crawled_organizations else [],
             "metrics": metrics
         })
         
@@ -311,30 +756,32 @@ class EnhancedDiscoveryManager:
         # Phase 3: Rank organizations by potential as SCADA clients
         ranked_organizations = self._rank_organizations(crawled_organizations)
         
-        # Update metrics with organization types
-        for org in ranked_organizations:
-            if "organization" in org and org["organization"]:
-                org_type = org["organization"].get("org_type")
-                if org_type:
-                    metrics["orgs_by_type"][org_type] = metrics["orgs_by_type"].get(org_type, 0) + 1
-                
-                state = org["organization"].get("state")
-                if state:
-                    metrics["orgs_by_state"][state] = metrics["orgs_by_state"].get(state, 0) + 1
-                
-                # Count potential clients vs competitors
-                if org.get("is_competitor", False):
-                    metrics["competitors_filtered"] += 1
-                else:
-                    metrics["potential_clients_found"] += 1
-                
-                # Count high relevance orgs
-                if org.get("relevance_score", 0) >= 7.0:
-                    metrics["high_relevance_orgs"] += 1
+        # Update metrics with organization types and states
+        found_orgs = [org for org in ranked_organizations if org.get("organization")]
+        
+        orgs_by_type = Counter(metrics["orgs_by_type"])
+        orgs_by_type.update(
+            org_type for org_type in (org["organization"].get("org_type") for org in found_orgs) if org_type
+        )
+        metrics["orgs_by_type"] = dict(orgs_by_type)
+        
+        orgs_by_state = Counter(metrics["orgs_by_state"])
+        orgs_by_state.update(
+            state for state in (org["organization"].get("state") for org in found_orgs) if state
+        )
+        metrics["orgs_by_state"] = dict(orgs_by_state)
+        
+        # Count potential clients vs competitors
+        competitors = sum(1 for org in found_orgs if org.get("is_competitor", False))
+        metrics["competitors_filtered"] += competitors
+        metrics["potential_clients_found"] += len(found_orgs) - competitors
+        
+        # Count high relevance orgs
+        metrics["high_relevance_orgs"] += sum(1 for org in found_orgs if org.get("relevance_score", 0) >= 7.0)
         
         # Create checkpoint after ranking phase
         self.create_checkpoint("ranking_complete", {
-            "ranked_organizations": ranked_organizations,
+            "ranked_organizations": _checkpoint_view(ranked_organizations),
             "metrics": metrics
         })
         
@@ -344,7 +791,7 @@ class EnhancedDiscoveryManager:
         
         # Create checkpoint after contact discovery
         self.create_checkpoint("discovery_complete", {
-            "ranked_organizations": ranked_organizations,
+            "ranked_organizations": _checkpoint_view(ranked_organizations),
             "contacts_discovered": contacts_discovered,
             "metrics": metrics
         })
@@ -384,6 +831,9 @@ class EnhancedDiscoveryManager:
         
         logger.info(f"Searching for organizations in industries: {active_industries}")
         
+        # Plan every query up front so the searches can run concurrently
+        planned_searches = []
+        
         # Process each target industry
         for industry in active_industries:
             # Get queries for industry
@@ -412,47 +862,95 @@ class EnhancedDiscoveryManager:
                     # Format query
                     query = query_template.replace("{industry}", industry).replace("{state}", location_spec)
                     
-                    # Add to database
-                    search_query = SearchQuery(
-                        query=query,
-                        category=industry,  # Changed from industry to category
-                        state=state,
-                        execution_date=datetime.datetime.now()  # Changed from timestamp to execution_date
+                    # Row for the search_queries table (inserted in bulk after the searches)
+                    query_row = {
+                        "query": query,
+                        "category": industry,  # Changed from industry to category
+                        "state": state,
+                        "execution_date": datetime.datetime.now()  # Changed from timestamp to execution_date
                         # Removed session_id as it's not in the model
-                    )
-                    self.db_session.add(search_query)
+                    }
+                    planned_searches.append((query, query_row))
+        
+        # Execute searches a few at a time. The API calls are network-bound, so
+        # overlapping them (and their politeness delays) cuts wall-clock time,
+        # while the database is only ever touched from this thread.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY) as executor:
+            futures = [
+                (query, query_row, executor.submit(self._run_search, query))
+                for query, query_row in planned_searches
+            ]
+            
+            for query, query_row, future in futures:
+                try:
+                    search_results = future.result()
+                    engine = "google"
                     
-                    # Execute search - use only Google since Bing API gives permission errors
-                    try:
-                        # Always use Google search since Bing API is returning 401 errors
-                        # Get full page of results instead of just the first 10
-                        search_results = self.google_search.get_all_results(query, max_results=100)
-                        engine = "google"
-                        
-                        # Update query record
-                        search_query.results_count = len(search_results)
-                        search_query.search_engine = engine
-                        search_query.status = "completed"
-                        
-                        # Store results
-                        results.append((query, search_results))
-                        
-                        # Log
-                        logger.info(f"Search for '{query}' returned {len(search_results)} results from {engine}")
-                        
-                        # Politeness delay
-                        time.sleep(random.uniform(1.0, 3.0))
+                    # Update query record
+                    query_row["results_count"] = len(search_results)
+                    query_row["search_engine"] = engine
                     
-                    except Exception as e:
-                        logger.error(f"Search error for '{query}': {e}")
-                        search_query.status = "error"
-                        search_query.error_message = str(e)
+                    # Store results
+                    results.append((query, search_results))
+                    
+                    # Log
+                    logger.info(f"Search for '{query}' returned {len(search_results)} results from {engine}")
+                
+                except Exception as e:
+                    logger.error(f"Search error for '{query}': {e}")
         
-        # Commit database changes
-        self.db_session.commit()
+        # Record all executed queries with a single bulk insert
+        try:
+            self.db_session.bulk_insert_mappings(
+                SearchQuery, [query_row for _, query_row in planned_searches]
+            )
+            self.db_session.commit()
+        except Exception as e:
+            logger.error(f"Failed to save search queries: {e}")
+            self.db_session.rollback()
         
         return results
     
+    def _run_search(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Execute a single search query (runs on a worker thread).
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            List of search results
+        """
+        # Politeness: pace queries to the search API host
+        self._wait_for_host(self.google_search.base_url)
+        
+        # Always use Google search since Bing API is returning 401 errors
+        # Get full page of results instead of just the first 10
+        return self.google_search.get_all_results(query, max_results=100)
+    
+    def _wait_for_host(self, url: str) -> None:
+        """
+        Block until a request to the URL's host is allowed by its rate limiter.
+        
+        Unlike a fixed sleep after every request, requests to different hosts
+        never wait on each other.
+        
+        Args:
+            url: URL about to be requested
+        """
+        host = urlparse(url).netloc.lower()
+        
+        with self._host_limiters_lock:
+            limiter = self._host_limiters.get(host)
+            if limiter is None:
+                limiter = self._host_limiters[host] = TokenBucket(
+                    rate=1.0 / CRAWLER_POLITENESS_DELAY, capacity=1
+                )
+        
+        waited = limiter.acquire()
+        if waited:
+            logger.debug(f"Waited {waited:.2f}s before requesting {host}")
+    
     def _crawl_and_extract_organizations(
         self, search_results: List[Tuple[str, List[Dict[str, Any]]]], max_orgs: int = 20
     ) -> List[Dict[str, Any]]:
@@ -467,91 +965,44 @@ class EnhancedDiscoveryManager:
             List of processed organization data
         """
         crawled_organizations = []
-        processed_domains = set()
+        pending_organizations = []  # Extracted but not yet saved to the database
         org_count = 0
         
         # Flatten and deduplicate search results
-        all_results = []
+        all_results = self._collect_unique_results(search_results)
         
-        logger.info(f"Processing search results type: {type(search_results)}")
-        if len(search_results) > 0:
-            logger.info(f"First search result item type: {type(search_results[0])}")
-            
-        for query_results in search_results:
-            # Handle different formats of search results
-            if isinstance(query_results, tuple) and len(query_results) == 2:
-                query, results = query_results
-                logger.info(f"Processing query: {query} with {len(results) if isinstance(results, list) else 'non-list'} results")
-                
-                # Skip if results is not a list/dictionary that we can iterate
-                if not hasattr(results, '__iter__') or isinstance(results, str):
-                    logger.warning(f"Skipping non-iterable results for query {query}")
-                    continue
-                    
-                # For Google search results from API
-                if isinstance(results, dict) and "items" in results:
-                    logger.info(f"Processing Google API results with {len(results['items'])} items")
-                    items = results["items"]
-                else:
-                    items = results
-            else:
-                # Single result item (possibly from a simplistic test)
-                logger.info(f"Processing direct result: {type(query_results)}")
-                items = [query_results]
-            
-            # Process each individual search result
-            for result in items:
-                if not isinstance(result, dict):
-                    logger.warning(f"Skipping non-dict result: {type(result)}")
-                    continue
-                    
-                # Extract domain
-                url = result.get("link", "")
-                if not url:
-                    url = result.get("url", "")  # Alternate field name
-                    
-                if not url:
-                    logger.warning(f"Skipping result with no URL: {result}")
-                    continue
-                    
-                domain = self._extract_domain(url)
-                
-                # Skip if domain already processed
-                if domain in processed_domains:
-                    continue
-                
-                result_data = {
-                    "url": url,
-                    "title": result.get("title", "") or result.get("name", ""),  # Google vs Bing API
-                    "snippet": result.get("snippet", "") or result.get("description", ""),  # Google vs Bing API
-                    "query": query if 'query' in locals() else "Unknown query"
-                }
-                
-                logger.info(f"Adding search result for {url}")
-                all_results.append(result_data)
-                processed_domains.add(domain)
+        # Sort results by potential relevance (prioritize .gov, .edu, specific keywords),
+        # keeping enough candidates that max_orgs organizations can still be found
+        sorted_results = self._prioritize_search_results(
+            all_results, limit=max_orgs * SEARCH_RESULT_FAN_OUT
+        )
         
-        # Sort results by potential relevance (prioritize .gov, .edu, specific keywords)
-        sorted_results = self._prioritize_search_results(all_results)
+        # Detected (industry, state) per query; many results share the same query
+        query_context = {}
         
-        # Process all results with no limit
+        # Process the prioritized results
         for result in sorted_results:
                 
             try:
                 url = result["url"]
                 query = result["query"]
                 
-                # Extract industry and state from query
-                query_parts = query.lower().split()
-                detected_industry = next((ind for ind in self.target_industries 
-                                       if ind in query_parts), None)
-                detected_state = next((state for state in self.target_states + list(self.special_regions.keys())
-                                    if state.lower() in query.lower()), None)
+                # Extract industry and state from query (computed once per distinct query)
+                if query not in query_context:
+                    query_lower = query.lower()
+                    query_parts = set(query_lower.split())
+                    query_context[query] = (
+                        next((ind for ind in self.target_industries if ind in query_parts), None),
+                        next((state for state, state_lower in self._state_names_lower
+                              if state_lower in query_lower), None)
+                    )
+                detected_industry, detected_state = query_context[query]
                 
-                # Crawl the URL
-                logger.info(f"Crawling {url}")
+                # Crawl the URL (only waits if this host was fetched very recently)
+                self._wait_for_host(url)
+                logger.info("Crawling %s", url)
                 crawl_result = self.web_crawler.crawl_url(url)
-                logger.info(f"Crawl result type: {type(crawl_result)}")
+                logger.debug("Crawl result type: %s", type(crawl_result))
                 
                 # Handle different return types from crawler
                 if isinstance(crawl_result, tuple):
@@ -560,104 +1011,279 @@ class EnhancedDiscoveryManager:
                     crawl_result = {"html_content": html_content, "links": links}
                 
                 if not crawl_result or not crawl_result.get("html_content"):
-                    logger.warning(f"Failed to crawl {url}")
+                    logger.warning("Failed to crawl %s", url)
                     continue
                     
-                logger.info(f"Successfully crawled {url}, content length: {len(crawl_result.get('html_content', ''))}")
+                logger.info("Successfully crawled %s, content length: %d", url, len(crawl_result["html_content"]))
                 
                 # Extract organization data
                 html_content = crawl_result["html_content"]
-                soup = BeautifulSoup(html_content, "html.parser")
-                text_content = soup.get_text(" ", strip=True)
+                text_content = html_to_page_text(html_content)
+                
+                # One keyword index shared by both analyzers: the page is lowercased
+                # once and each keyword searched at most once. The lowercased copy
+                # and the page text only live for this iteration; the page text can
+                # be rebuilt from the cached HTML, so it is not kept with the result
+                keyword_index = _PageKeywordIndex(text_content)
                 
                 # Check for infrastructure indicators
                 infrastructure_indicators = self._extract_infrastructure_indicators(
-                    text_content, detected_industry
+                    text_content, detected_industry, keyword_index=keyword_index
                 )
                 
                 # Check for competitor indicators
-                competitor_analysis = self._analyze_for_competitor_indicators(text_content)
+                competitor_analysis = self._analyze_for_competitor_indicators(
+                    text_content, keyword_index=keyword_index
+                )
                 
                 # Extract organization using Gemini
-                logger.info(f"Extracting organizations from {url} with industry={detected_industry}, state={detected_state}")
-                org_data = self.org_extractor.extract_organizations_from_content(
-                    html_content, url, state_context=detected_state, industry_hint=detected_industry
+                logger.info("Extracting organizations from %s with industry=%s, state=%s", url, detected_industry, detected_state)
+                org_data = self._extract_organizations_cached(
+                    html_content, url, detected_state, detected_industry
                 )
                 
-                logger.info(f"Extraction result: {len(org_data) if org_data else 0} organizations found")
+                logger.info("Extraction result: %d organizations found", len(org_data) if org_data else 0)
                 
                 if org_data and len(org_data) > 0:
                     organization = org_data[0]  # Take the first organization
-                    logger.info(f"Found organization: {organization.get('name', 'Unknown')}, type: {organization.get('org_type', 'Unknown')}")
-                    
-                    # Insert organization into database if it doesn't exist
-                    from app.database import crud
-                    existing_org = crud.get_organization_by_name_and_state(
-                        self.db_session, 
-                        organization.get('name'),
-                        organization.get('state')
-                    )
-                    
-                    if not existing_org:
-                        # Create new organization
-                        org_record = crud.create_organization(self.db_session, {
-                            'name': organization.get('name'),
-                            'org_type': organization.get('org_type'),
-                            'state': organization.get('state'),
-                            'description': organization.get('description'),
-                            'source_url': url,
-                            'discovery_method': 'enhanced_discovery',
-                            'confidence_score': organization.get('confidence_score', 0.7),
-                            'relevance_score': organization.get('relevance_score', 7.0)
-                        })
-                        logger.info(f"Extracted organization: {organization.get('name')}")
-                    else:
-                        org_record = existing_org
-                        logger.info(f"Organization already exists: {organization.get('name')}")
-                    
-                    # Update organization record with infrastructure analysis
-                    organization_id = org_record.id if org_record else None
-                    if organization_id:
-                        org_record = self.db_session.query(Organization).filter(
-                            Organization.id == organization_id
-                        ).first()
-                        
-                        if org_record:
-                            # Store infrastructure indicators as JSON in extended_data field
-                            if not org_record.extended_data:
-                                org_record.extended_data = {}
-                            
-                            org_record.extended_data["infrastructure_indicators"] = infrastructure_indicators
-                            org_record.extended_data["competitor_analysis"] = competitor_analysis
-                            
-                            # Update database
-                            self.db_session.commit()
+                    logger.info("Found organization: %s, type: %s", organization.get("name", "Unknown"), organization.get("org_type", "Unknown"))
                     
                     # Add to crawled organizations
-                    crawled_organizations.append({
+                    pending_organizations.append({
                         "url": url,
                         "organization": organization,
                         "infrastructure_indicators": infrastructure_indicators,
                         "competitor_analysis": competitor_analysis,
-                        "html_content": crawl_result["html_content"],
-                        "text_content": text_content
+                        "html_content": crawl_result["html_content"]
                     })
                     
                     org_count += 1
-                    logger.info(f"Extracted organization: {organization.get('name')}")
+                    logger.info("Extracted organization: %s", organization.get("name"))
+                    
+                    # Save in batches so a long crawl keeps its progress without committing per page
+                    if len(pending_organizations) >= ORG_COMMIT_BATCH_SIZE:
+                        crawled_organizations.extend(self._save_crawled_organizations(pending_organizations))
+                        pending_organizations = []
                 else:
-                    logger.info(f"No organization found at {url}")
-                
-                # Politeness delay
-                time.sleep(random.uniform(1.0, 2.0))
+                    logger.info("No organization found at %s", url)
             
             except Exception as e:
-                logger.error(f"Error processing {result['url']}: {e}")
+                logger.error("Error processing %s: %s", result["url"], e)
+        
+        # Persist the remaining extracted organizations
+        crawled_organizations.extend(self._save_crawled_organizations(pending_organizations))
         
         return crawled_organizations
     
+    def _extract_organizations_cached(
+        self, html_content: str, url: str, state: Optional[str], industry: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract organizations from page content, reusing earlier Gemini results for identical pages.
+        
+        Templated CMS pages and resumed sessions often present the same content
+        more than once; the cache is keyed by a hash of the content and hints.
+        
+        Args:
+            html_content: Raw HTML of the page
+            url: Source URL
+            state: Detected state context
+            industry: Detected industry hint
+            
+        Returns:
+            List of extracted organization dictionaries
+        """
+        cache_key = make_cache_key(html_content, state, industry)
+        cached = self._extraction_cache.get(cache_key)
+        
+        if cached is not None:
+            logger.info(f"Using cached organization extraction for {url}")
+            discovery_date = datetime.datetime.utcnow()
+            for org in cached:
+                org["source_url"] = url
+                org["discovery_date"] = discovery_date
+            return cached
+        
+        org_data = self.org_extractor.extract_organizations_from_content(
+            html_content, url, state_context=state, industry_hint=industry
+        )
+        
+        # Only cache successful extractions (failures also return an empty list);
+        # per-URL fields are restored on a cache hit
+        if org_data:
+            self._extraction_cache.set(cache_key, [
+                {key: value for key, value in org.items() if key not in ("source_url", "discovery_date")}
+                for org in org_data
+            ])
+        
+        return org_data
+    
+    def _save_crawled_organizations(self, crawled_organizations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert new organizations and store their analysis with a single lookup query.
+        
+        Args:
+            crawled_organizations: Crawled organization data from _crawl_and_extract_organizations
+            
+        Returns:
+            Crawled organizations that could be stored
+        """
+        if not crawled_organizations:
+            return crawled_organizations
+        
+        # Look up every (name, state) pair at once instead of one query per page
+        keys = {
+            (org_data["organization"].get("name"), org_data["organization"].get("state"))
+            for org_data in crawled_organizations
+        }
+        
+        try:
+            records = {
+                (org.name, org.state): org
+                for org in self.db_session.query(Organization).filter(
+                    tuple_(Organization.name, Organization.state).in_(list(keys))
+                ).all()
+            }
+        except Exception as e:
+            logger.error(f"Error looking up existing organizations: {e}")
+            self.db_session.rollback()
+            return []
+        
+        stored_organizations = []
+        new_records = []
+        
+        for org_data in crawled_organizations:
+            organization = org_data["organization"]
+            key = (organization.get("name"), organization.get("state"))
+            org_record = records.get(key)
+            
+            if org_record is None:
+                if not organization.get("name") or not organization.get("org_type"):
+                    logger.warning(f"Skipping organization without name or type from {org_data['url']}")
+                    continue
+                
+                # Create new organization
+                org_record = Organization(
+                    name=organization.get("name"),
+                    org_type=organization.get("org_type"),
+                    state=organization.get("state"),
+                    description=organization.get("description"),
+                    source_url=org_data["url"],
+                    discovery_method="enhanced_discovery",
+                    confidence_score=organization.get("confidence_score", 0.7),
+                    relevance_score=organization.get("relevance_score", 7.0)
+                )
+                records[key] = org_record
+                new_records.append(org_record)
+                logger.info(f"Extracted organization: {organization.get('name')}")
+            else:
+                logger.info(f"Organization already exists: {organization.get('name')}")
+            
+            # Store infrastructure indicators as JSON in extended_data field
+            if not org_record.extended_data:
+                org_record.extended_data = {}
+            
+            org_record.extended_data["infrastructure_indicators"] = org_data["infrastructure_indicators"]
+            org_record.extended_data["competitor_analysis"] = org_data["competitor_analysis"]
+            
+            # In-place changes to a JSON column are not tracked; mark it dirty explicitly
+            flag_modified(org_record, "extended_data")
+            
+            stored_organizations.append(org_data)
+        
+        try:
+            self.db_session.add_all(new_records)
+            self.db_session.commit()
+        except Exception as e:
+            logger.error(f"Error saving crawled organizations: {e}")
+            self.db_session.rollback()
+        
+        return stored_organizations
+    
+    def _collect_unique_results(
+        self, search_results: List[Tuple[str, List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Flatten search results and keep the first result for each domain.
+        
+        Args:
+            search_results: List of (query, results) tuples
+            
+        Returns:
+            List of result dictionaries (url, title, snippet, query, domain)
+        """
+        all_results = []
+        
+        # Canonical keys (lowercased registered domain) of results already kept;
+        # http/https and www/bare variants of a site map to the same key
+        processed_domains = set()
+        query = "Unknown query"
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Processing search results type: %s", type(search_results))
+            if len(search_results) > 0:
+                logger.debug("First search result item type: %s", type(search_results[0]))
+            
+        for query_results in search_results:
+            # Handle different formats of search results
+            if isinstance(query_results, tuple) and len(query_results) == 2:
+                query, results = query_results
+                logger.info("Processing query: %s with %s results", query, len(results) if isinstance(results, list) else "non-list")
+                
+                # Skip if results is not a list/dictionary that we can iterate
+                if not hasattr(results, '__iter__') or isinstance(results, str):
+                    logger.warning("Skipping non-iterable results for query %s", query)
+                    continue
+                    
+                # For Google search results from API
+                if isinstance(results, dict) and "items" in results:
+                    logger.info("Processing Google API results with %d items", len(results["items"]))
+                    items = results["items"]
+                else:
+                    items = results
+            else:
+                # Single result item (possibly from a simplistic test)
+                logger.debug("Processing direct result: %s", type(query_results))
+                items = [query_results]
+            
+            # Process each individual search result
+            for result in items:
+                if not isinstance(result, dict):
+                    logger.warning("Skipping non-dict result: %s", type(result))
+                    continue
+                    
+                # Extract domain
+                url = result.get("link", "")
+                if not url:
+                    url = result.get("url", "")  # Alternate field name
+                    
+                if not url:
+                    logger.warning("Skipping result with no URL: %s", result)
+                    continue
+                    
+                domain = self._extract_domain(url).lower()
+                
+                # Skip if domain already processed
+                if domain in processed_domains:
+                    continue
+                
+                result_data = {
+                    "url": url,
+                    "title": result.get("title", "") or result.get("name", ""),  # Google vs Bing API
+                    "snippet": result.get("snippet", "") or result.get("description", ""),  # Google vs Bing API
+                    "query": query,
+                    "domain": domain
+                }
+                
+                logger.debug("Adding search result for %s", url)
+                all_results.append(result_data)
+                processed_domains.add(domain)
+        
+        return all_results
+    
     def _extract_infrastructure_indicators(
-        self, text_content: str, industry: Optional[str] = None
+        self, text_content: str, industry: Optional[str] = None,
+        keyword_index: Optional[_PageKeywordIndex] = None
     ) -> Dict[str, Any]:
         """
         Extract infrastructure and process indicators from text content.
@@ -665,6 +1291,7 @@ class EnhancedDiscoveryManager:
         Args:
             text_content: Text content from website
             industry: Optional industry hint
+            keyword_index: Optional keyword index for the same text, shared between analyzers
             
         Returns:
             Dictionary of infrastructure indicators
@@ -677,71 +1304,77 @@ class EnhancedDiscoveryManager:
             "infrastructure_score": 0.0
         }
         
-        # Convert to lowercase for matching
-        text_lower = text_content.lower()
+        # Several keywords appear in more than one table; the index remembers
+        # each search result instead of scanning the page text again
+        contains = (keyword_index or _PageKeywordIndex(text_content)).contains
+        
+        # Infrastructure matches come from several tables that may share keywords,
+        # so they are deduplicated with a set; the other tables are unique already
+        infrastructure_matches = result["infrastructure_matches"]
+        infrastructure_seen = set()
         
         # Check industry-specific infrastructure keywords
-        if industry and industry in INFRASTRUCTURE_PROCESS_KEYWORDS:
-            for keyword in INFRASTRUCTURE_PROCESS_KEYWORDS[industry]:
-                if keyword.lower() in text_lower:
-                    result["infrastructure_matches"].append(keyword)
+        if industry and industry in _INFRASTRUCTURE_KEYWORDS:
+            for keyword, keyword_lower in _INFRASTRUCTURE_KEYWORDS[industry]:
+                if contains(keyword_lower):
+                    infrastructure_matches.append(keyword)
+                    infrastructure_seen.add(keyword)
         
         # Check all industries if no specific industry or insufficient matches
-        if not industry or len(result["infrastructure_matches"]) < 3:
-            for ind, keywords in INFRASTRUCTURE_PROCESS_KEYWORDS.items():
+        if not industry or len(infrastructure_matches) < 3:
+            for ind, keywords in _INFRASTRUCTURE_KEYWORDS.items():
                 if ind == industry:
                     continue  # Skip if already processed
                     
-                for keyword in keywords:
-                    if keyword.lower() in text_lower and keyword not in result["infrastructure_matches"]:
-                        result["infrastructure_matches"].append(keyword)
+                for keyword, keyword_lower in keywords:
+                    if keyword not in infrastructure_seen and contains(keyword_lower):
+                        infrastructure_matches.append(keyword)
+                        infrastructure_seen.add(keyword)
         
         # Check for operational challenges
-        for challenge in OPERATIONAL_CHALLENGE_KEYWORDS:
-            if challenge.lower() in text_lower:
+        for challenge, challenge_lower in _OPERATIONAL_CHALLENGE_KEYWORDS:
+            if contains(challenge_lower):
                 result["operational_challenges"].append(challenge)
         
         # Check for regulatory requirements
-        for req in REGULATORY_REQUIREMENT_KEYWORDS:
-            if req.lower() in text_lower:
+        for req, req_lower in _REGULATORY_REQUIREMENT_KEYWORDS:
+            if contains(req_lower):
                 result["regulatory_requirements"].append(req)
         
         # Check for industry-specific relevance indicators
-        if industry and industry in ORG_RELEVANCE_INDICATORS:
+        if industry and industry in _RELEVANCE_INDICATOR_KEYWORDS:
             # Infrastructure
-            for item in ORG_RELEVANCE_INDICATORS[industry]["infrastructure"]:
-                if item.lower() in text_lower and item not in result["infrastructure_matches"]:
-                    result["infrastructure_matches"].append(item)
+            for item, item_lower in _RELEVANCE_INDICATOR_KEYWORDS[industry]["infrastructure"]:
+                if item not in infrastructure_seen and contains(item_lower):
+                    infrastructure_matches.append(item)
+                    infrastructure_seen.add(item)
             
             # Processes
-            for item in ORG_RELEVANCE_INDICATORS[industry]["processes"]:
-                if item.lower() in text_lower:
+            for item, item_lower in _RELEVANCE_INDICATOR_KEYWORDS[industry]["processes"]:
+                if contains(item_lower):
                     result["process_matches"].append(item)
         
-        # Calculate infrastructure score (0-10 scale)
-        infra_weight = 1.0
-        process_weight = 1.0
-        challenge_weight = 1.5
-        regulatory_weight = 1.0
-        
-        raw_score = (
-            len(result["infrastructure_matches"]) * infra_weight +
-            len(result["process_matches"]) * process_weight +
-            len(result["operational_challenges"]) * challenge_weight +
-            len(result["regulatory_requirements"]) * regulatory_weight
+        # Calculate infrastructure score (0-10 scale). The match lists are saved with the
+        # organization and drive crud.rerank_organization_by_infrastructure, so every table
+        # is scanned even when the capped score is already reached
+        result["infrastructure_score"] = _infrastructure_score(
+            len(result["infrastructure_matches"]),
+            len(result["process_matches"]),
+            len(result["operational_challenges"]),
+            len(result["regulatory_requirements"])
         )
         
-        # Normalize to 0-10 scale
-        result["infrastructure_score"] = min(10, raw_score)
-        
         return result
     
-    def _analyze_for_competitor_indicators(self, text_content: str) -> Dict[str, Any]:
+    def _analyze_for_competitor_indicators(
+        self, text_content: str, keyword_index: Optional[_PageKeywordIndex] = None
+    ) -> Dict[str, Any]:
         """
         Analyze text content for indicators that the organization might be a SCADA provider.
         
         Args:
             text_content: Text content from website
+            keyword_index: Optional keyword index for the same text, shared between analyzers
             
         Returns:
             Dictionary with competitor analysis
@@ -752,12 +1385,11 @@ class EnhancedDiscoveryManager:
             "is_likely_competitor": False
         }
         
-        # Convert to lowercase for matching
-        text_lower = text_content.lower()
+        contains = (keyword_index or _PageKeywordIndex(text_content)).contains
         
         # Check for competitor indicators
-        for indicator in COMPETITOR_INDICATORS:
-            if indicator.lower() in text_lower:
+        for indicator, indicator_lower in _COMPETITOR_KEYWORDS:
+            if contains(indicator_lower):
                 result["competitor_indicators"].append(indicator)
         
         # Calculate competitor score (0-10 scale)
@@ -767,73 +1399,73 @@ class EnhancedDiscoveryManager:
         # Determine if likely competitor
         result["is_likely_competitor"] = (
             result["competitor_score"] >= 4.0 or  # Multiple competitor indicators
-            "scada integrator" in text_lower or
-            "scada provider" in text_lower or
-            "system integrator" in text_lower or
-            "integration services" in text_lower
+            any(contains(phrase) for phrase in _COMPETITOR_PHRASES)
         )
         
         return result
     
-    def _prioritize_search_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _prioritize_search_results(
+        self, results: List[Dict[str, Any]], limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Prioritize search results based on relevance to SCADA client discovery.
         
         Args:
             results: List of search results
+            limit: Optional number of top results to keep (selected without a full sort)
             
         Returns:
             Prioritized list of search results
         """
-        # Define priority domains and terms
-        priority_domains = [".gov", ".edu", ".org", ".us"]
-        priority_terms = [
-            "water", "wastewater", "utility", "municipal", "city of",
-            "county of", "authority", "district", "department", "agency",
-            "plant", "facility", "infrastructure", "engineering"
-        ]
-        
         # Score each result
-        scored_results = []
         for result in results:
-            url = result["url"]
-            title = result["title"].lower()
-            snippet = result["snippet"].lower()
-            
-            score = 0
-            
-            # Domain priority
-            domain = self._extract_domain(url)
-            for pri_domain in priority_domains:
-                if domain.endswith(pri_domain):
-                    score += 5
-                    break
-            
-            # Title and snippet priority terms
-            for term in priority_terms:
-                if term in title:
-                    score += 3
-                if term in snippet:
-                    score += 2
-            
-            # Check for negatives (likely competitors)
-            negative_terms = ["scada provider", "scada integrator", "integration services"]
-            for term in negative_terms:
-                if term in title or term in snippet:
-                    score -= 10
-            
-            # Add score to result
-            result["priority_score"] = score
-            scored_results.append(result)
+            result["priority_score"] = self._score_search_result(result)
         
-        # Sort by score (descending)
-        sorted_results = sorted(scored_results, key=lambda x: x["priority_score"], reverse=True)
+        # Sort by score (descending); when only the top results are needed,
+        # heapq.nlargest selects them in O(n log k) with the same ordering
+        if limit is not None and limit < len(results):
+            sorted_results = heapq.nlargest(limit, results, key=itemgetter("priority_score"))
+        else:
+            sorted_results = sorted(results, key=itemgetter("priority_score"), reverse=True)
         
-        # Process all results to find organizations (no limit)
         logger.info(f"Processing {len(sorted_results)} prioritized search results")
         
         return sorted_results
     
+    def _score_search_result(self, result: Dict[str, Any]) -> int:
+        """
+        Compute the crawl priority score for a single search result.
+        
+        Args:
+            result: Search result with url, title and snippet
+            
+        Returns:
+            Priority score (higher is crawled first)
+        """
+        title = result["title"].lower()
+        snippet = result["snippet"].lower()
+        
+        score = 0
+        
+        # Domain priority (reuse the domain computed during deduplication)
+        domain = result.get("domain") or self._extract_domain(result["url"])
+        if domain.endswith(PRIORITY_DOMAINS):
+            score += 5
+        
+        # Title and snippet priority terms
+        for term in PRIORITY_TERMS:
+            if term in title:
+                score += 3
+            if term in snippet:
+                score += 2
+        
+        # Check for negatives (likely competitors)
+        for term in NEGATIVE_TERMS:
+            if term in title or term in snippet:
+                score -= 10
+        
+        return score
+    
     def _extract_domain(self, url: str) -> str:
         """
         Extract domain from URL.
@@ -844,17 +1476,7 @@ class EnhancedDiscoveryManager:
         Returns:
             Domain string
         """
-        try:
-            # Extract root domain plus suffix (e.g., example.com)
-            ext = tldextract.extract(url)
-            return f"{ext.domain}.{ext.suffix}"
-        except:
-            # Fallback to simple parsing
-            try:
-                parsed = urlparse(url)
-                return parsed.netloc
-            except:
-                return url
+        return _extract_registered_domain(url)
     
     def _rank_organizations(self, crawled_organizations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -867,6 +1489,22 @@ class EnhancedDiscoveryManager:
             Ranked organizations
         """
         ranked_orgs = []
+        type_multipliers = {}
+        org_updates = []
+        
+        # Fetch the stored extended data of every organization with a record in one query
+        org_ids = [
+            org_data["organization"]["id"]
+            for org_data in crawled_organizations
+            if org_data.get("organization") and org_data["organization"].get("id")
+        ]
+        stored_extended_data = {}
+        if org_ids:
+            stored_extended_data = dict(
+                self.db_session.query(Organization.id, Organization.extended_data).filter(
+                    Organization.id.in_(org_ids)
+                ).all()
+            )
         
         for org_data in crawled_organizations:
             if not org_data.get("organization"):
@@ -881,29 +1519,17 @@ class EnhancedDiscoveryManager:
             competitor_score = competitor_analysis.get("competitor_score", 0)
             is_competitor = competitor_analysis.get("is_likely_competitor", False)
             
-            # Get organization type
+            # Calculate type multiplier (once per distinct organization type)
             org_type = organization.get("org_type")
+            type_multiplier = type_multipliers.get(org_type)
+            if type_multiplier is None:
+                type_multiplier = type_multipliers[org_type] = self._get_type_multiplier(org_type)
             
-            # Calculate type multiplier
-            type_multiplier = self._get_type_multiplier(org_type)
-            
-            # Calculate raw relevance score (on 0-10 scale)
+            # Calculate raw, penalty and final relevance scores (on 0-10 scale)
             base_confidence = float(organization.get("confidence", 0))
-            
-            # Combine scores with heavier weight on infrastructure indicators
-            raw_score = (
-                (infra_score * 0.6) +                   # 60% from infrastructure indicators
-                (base_confidence * 10 * 0.4)            # 40% from base confidence (scaled to 0-10)
-            ) * type_multiplier                         # Apply type multiplier
-            
-            # Apply competitor penalty if needed
-            if is_competitor:
-                competitor_penalty = min(8, competitor_score * 0.8)  # Cap penalty at 8 points
-            else:
-                competitor_penalty = 0
-            
-            # Calculate final relevance score
-            relevance_score = max(0, min(10, raw_score - competitor_penalty))
+            raw_score, competitor_penalty, relevance_score = _combine_relevance_score(
+                infra_score, base_confidence, type_multiplier, is_competitor, competitor_score
+            )
             
             # Add scores to organization data
             ranked_org = org_data.copy()
@@ -913,36 +1539,38 @@ class EnhancedDiscoveryManager:
             ranked_org["is_competitor"] = is_competitor
             ranked_org["type_multiplier"] = type_multiplier
             
-            # Update organization record in database
+            # Queue the organization record update (written in one batch below)
             org_id = organization.get("id")
-            if org_id:
-                org_record = self.db_session.query(Organization).filter(
-                    Organization.id == org_id
-                ).first()
-                
-                if org_record:
-                    org_record.relevance_score = relevance_score
-                    org_record.is_competitor = is_competitor
-                    
-                    # Update extended data
-                    if not org_record.extended_data:
-                        org_record.extended_data = {}
-                    
-                    org_record.extended_data["relevance_analysis"] = {
-                        "infrastructure_score": infra_score,
-                        "competitor_score": competitor_score,
-                        "type_multiplier": type_multiplier,
-                        "raw_score": raw_score,
-                        "competitor_penalty": competitor_penalty,
-                        "final_score": relevance_score
-                    }
-                    
-                    self.db_session.commit()
+            if org_id in stored_extended_data:
+                extended_data = dict(stored_extended_data[org_id] or {})
+                extended_data["relevance_analysis"] = {
+                    "infrastructure_score": infra_score,
+                    "competitor_score": competitor_score,
+                    "type_multiplier": type_multiplier,
+                    "raw_score": raw_score,
+                    "competitor_penalty": competitor_penalty,
+                    "final_score": relevance_score
+                }
+                org_updates.append({
+                    "id": org_id,
+                    "relevance_score": relevance_score,
+                    "is_competitor": is_competitor,
+                    "extended_data": extended_data
+                })
             
             ranked_orgs.append(ranked_org)
         
-        # Sort by relevance score (descending)
-        return sorted(ranked_orgs, key=lambda x: x.get("relevance_score", 0), reverse=True)
+        # Update all organization records with a single bulk update and commit
+        if org_updates:
+            try:
+                self.db_session.bulk_update_mappings(Organization, org_updates)
+                self.db_session.commit()
+            except Exception as e:
+                logger.error(f"Failed to save organization rankings: {e}")
+                self.db_session.rollback()
+        
+        # Sort by relevance score (descending); every ranked entry has the key set
+        return sorted(ranked_orgs, key=itemgetter("relevance_score"), reverse=True)
     
     def _get_type_multiplier(self, org_type: Optional[str]) -> float:
         """
@@ -956,24 +1584,14 @@ class EnhancedDiscoveryManager:
         """
         if not org_type:
             return 0.7  # Default multiplier
-            
-        # Define type multipliers based on organization types
-        # These are different than the priority values - they represent how likely
-        # an organization of this type is to need SCADA services
-        type_multipliers = {
-            "water": 1.0,           # Top tier: Water treatment/distribution has very high SCADA needs
-            "wastewater": 1.0,      # Top tier: Wastewater treatment has very high SCADA needs
-            "utility": 0.95,        # Very high: Utilities generally need monitoring/control
-            "oil_gas": 0.95,        # Very high: Oil & gas operations need extensive monitoring
-            "agriculture": 0.9,     # High: Large irrigation districts need water management
-            "municipal": 0.9,       # High: Municipalities often manage multiple infrastructure systems
-            "transportation": 0.85, # Good: Traffic systems, tunnels, etc.
-            "engineering": 0.75,    # Moderate: Engineering firms may handle SCADA projects for clients
-            "government": 0.75,     # Moderate: Depends on the specific government function
-            "healthcare": 0.7,      # Moderate: Building automation, but less core to operations
-        }
         
-        return type_multipliers.get(org_type.lower(), 0.7)  # Default to 0.7
+        # The extractor standardizes org_type to the lowercase ORG_TYPES keys,
+        # so only unexpected spellings need lowercasing
+        multiplier = TYPE_MULTIPLIERS.get(org_type)
+        if multiplier is None:
+            multiplier = TYPE_MULTIPLIERS.get(org_type.lower(), 0.7)  # Default to 0.7
+        
+        return multiplier
     
     def _discover_contacts(
         self, ranked_organizations: List[Dict[str, Any]], max_orgs: int = 20
@@ -988,64 +1606,6 @@ class EnhancedDiscoveryManager:
         Returns:
             List of discovered contacts
         """
-        # Define role profiles for each organization type
-        role_profiles = {
-            "water": [
-                "Public Works Director", "Water Treatment Superintendent", 
-                "Operations Manager", "Utility Director", "City Engineer",
-                "Water Systems Manager", "Plant Supervisor"
-            ],
-            "wastewater": [
-                "Wastewater Superintendent", "Treatment Plant Supervisor",
-                "Operations Manager", "Public Works Director", "Facilities Manager",
-                "Process Control Supervisor", "Plant Engineer"
-            ],
-            "utility": [
-                "Operations Director", "Director of Engineering", "Utility Manager",
-                "Operations Supervisor", "Facilities Director", "Systems Engineer",
-                "Chief Engineer", "Operations Supervisor", "Control Room Supervisor"
-            ],
-            "municipal": [
-                "Public Works Director", "City Engineer", "Facilities Manager",
-                "Infrastructure Manager", "Utility Director", "Operations Manager"
-            ],
-            "oil_gas": [
-                "Operations Manager", "Automation Engineer", "Production Supervisor",
-                "Facilities Manager", "Engineering Manager", "Production Engineer",
-                "Operations Supervisor"
-            ],
-            "agriculture": [
-                "Water Manager", "Operations Director", "Irrigation Manager",
-                "District Manager", "Engineering Manager", "Facilities Director"
-            ],
-            "transportation": [
-                "Operations Director", "Systems Manager", "Facilities Manager",
-                "Engineering Director", "Maintenance Manager", "Infrastructure Manager"
-            ],
-            "engineering": [
-                "Project Manager", "Automation Engineer", "Control Systems Engineer",
-                "Engineering Manager", "Director of Engineering", "Principal Engineer"
-            ],
-            "government": [
-                "Facilities Director", "Operations Manager", "Public Works Director",
-                "Infrastructure Manager", "Systems Administrator", "Maintenance Director"
-            ],
-            "healthcare": [
-                "Facilities Director", "Engineering Manager", "Operations Director",
-                "Plant Operations Manager", "Maintenance Director"
-            ]
-        }
-        
-        # Role synonyms to expand search
-        role_synonyms = {
-            "Director": ["Manager", "Head", "Chief", "Supervisor", "Leader"],
-            "Manager": ["Director", "Supervisor", "Head", "Chief", "Administrator"],
-            "Supervisor": ["Manager", "Coordinator", "Lead", "Chief", "Head"],
-            "Engineer": ["Specialist", "Technician", "Technologist", "Coordinator"],
-            "Superintendent": ["Manager", "Director", "Supervisor", "Chief"],
-            "Operations": ["Operational", "Operating", "Process", "Production", "Facility"]
-        }
-        
         discovered_contacts = []
         
         # Filter to non-competitor organizations with reasonable relevance
@@ -1054,91 +1614,90 @@ class EnhancedDiscoveryManager:
             if not org.get("is_competitor", False) and org.get("relevance_score", 0) >= 5.0
         ]
         
-        # Sort by relevance score (descending)
-        sorted_orgs = sorted(
-            potential_client_orgs, 
-            key=lambda x: x.get("relevance_score", 0),
-            reverse=True
-        )
-        
-        # Limit to max_orgs
-        target_orgs = sorted_orgs[:max_orgs]
-        
-        for org_data in target_orgs:
-            organization = org_data.get("organization")
-            if not organization:
-                continue
+        # Select the max_orgs most relevant (descending) without sorting every candidate
+        target_orgs = heapq.nlargest(max_orgs, potential_client_orgs, key=itemgetter("relevance_score"))
+        
+        # Fetch the top crawled pages of every target organization in one query
+        urls_by_org = self._top_discovered_urls_by_org([
+            org_data["organization"]["id"]
+            for org_data in target_orgs
+            if org_data.get("organization") and org_data["organization"].get("id")
+        ])
+        
+        # Worker pool shared by the Gemini request and the page extraction of each organization
+        with concurrent.futures.ThreadPoolExecutor(max_workers=CONTACT_EXTRACTION_WORKERS) as executor:
+            for org_data in target_orgs:
+                organization = org_data.get("organization")
+                if not organization:
+                    continue
+                    
+                org_id = organization.get("id")
+                org_name = organization.get("name")
+                org_type = organization.get("org_type", "").lower()
                 
-            org_id = organization.get("id")
-            org_name = organization.get("name")
-            org_type = organization.get("org_type", "").lower()
-            
-            if not org_id or not org_name:
-                continue
+                if not org_id or not org_name:
+                    continue
+                    
+                logger.info(f"Discovering contacts for {org_name}")
                 
-            logger.info(f"Discovering contacts for {org_name}")
-            
-            # Get relevant roles for this organization type
-            relevant_roles = role_profiles.get(org_type, role_profiles.get("municipal", []))
-            
-            # Expand role list with synonyms
-            expanded_roles = []
-            for role in relevant_roles:
-                expanded_roles.append(role)
+                # Get relevant and synonym-expanded roles (computed once per organization type)
+                relevant_roles, unique_roles = _expanded_roles_for(org_type)
                 
-                # Add synonym variations
-                role_words = role.split()
-                for i, word in enumerate(role_words):
-                    if word in role_synonyms:
-                        for synonym in role_synonyms[word]:
-                            new_role = role_words.copy()
-                            new_role[i] = synonym
-                            expanded_roles.append(" ".join(new_role))
-            
-            # Get unique expanded roles
-            unique_roles = list(set(expanded_roles))
-            
-            # Get crawled content and discovered URLs for this organization
-            urls = self.db_session.query(DiscoveredURL).filter(
-                DiscoveredURL.organization_id == org_id
-            ).order_by(
-                DiscoveredURL.priority_score.desc()
-            ).limit(5).all()
-            
-            # Extract contacts from pages
-            for url in urls:
+                # Get crawled content and discovered URLs for this organization
+                urls = urls_by_org.get(org_id, [])
+                
+                # Start the Gemini request first so it runs while the pages are parsed
+                gemini_future = None
                 try:
-                    # Skip if no HTML content
-                    if not url.html_content:
-                        logger.warning(f"No HTML content for URL: {url.url}")
-                        continue
-                        
-                    # Parse HTML
-                    soup = BeautifulSoup(url.html_content, "html.parser")
-                    logger.info(f"Parsed HTML for URL: {url.url}, content length: {len(url.html_content)}")
-                    
-                    # First try to extract structured contact data
-                    try:
-                        structured_contacts = self.web_crawler._extract_structured_contact_data(soup, url.url)
-                        logger.info(f"Found {len(structured_contacts)} structured contacts from {url.url}")
-                    except Exception as e:
-                        logger.error(f"Error extracting structured contacts: {e}")
-                        structured_contacts = []
+                    # Combine the (truncated) page text rather than the raw HTML
+                    combined_text = "\n\n".join(
+                        html_to_contact_text(url.html_content)[:CONTACT_PAGE_TEXT_LIMIT]
+                        for url in urls
+                        if url.html_content
+                    )
                     
-                    # Then try standard contact extraction
-                    try:
-                        standard_contacts = self.web_crawler._extract_contact_information(
-                            soup, url.url, org_name
+                    if combined_text:
+                        # Create prompt for Gemini
+                        prompt = f"""
+                        Extract potential contacts from this organization's website content that might be involved in 
+                        SCADA system decisions or infrastructure management.
+                        
+                        Organization: {org_name}
+                        Organization Type: {org_type}
+                        
+                        Key roles to look for:
+                        {", ".join(relevant_roles[:5])}
+                        
+                        Extract as many details as possible:
+                        - Name
+                        - Position/Title
+                        - Email (if available)
+                        - Phone (if available)
+                        - Department
+                        
+                        Return the data as a JSON list of contacts.
+                        """
+                        
+                        # Call Gemini API
+                        gemini_future = executor.submit(
+                            self.gemini_client.generate_content, prompt, combined_text, temperature=0.2
                         )
-                        logger.info(f"Found {len(standard_contacts)} standard contacts from {url.url}")
-                    except Exception as e:
-                        logger.error(f"Error extracting standard contacts: {e}")
-                        standard_contacts = []
-                    
-                    # Combine contact data
-                    contacts = structured_contacts + standard_contacts
-                    logger.info(f"Combined {len(contacts)} total contacts from {url.url}")
-                    
+                except Exception as e:
+                    logger.error(f"Error using Gemini to discover contacts for {org_name}: {e}")
+                
+                # Extract contacts from pages in parallel; database writes stay on this thread
+                pages = []
+                for url in urls:
+                    if url.html_content:
+                        pages.append((url.url, url.html_content))
+                    else:
+                        logger.warning(f"No HTML content for URL: {url.url}")
+                
+                page_contacts = executor.map(
+                    lambda page: self._extract_page_contacts(page[0], page[1], org_name), pages
+                )
+                
+                for contacts in page_contacts:
                     # Update organization in contacts
                     for contact in contacts:
                         contact["organization_id"] = org_id
@@ -1149,77 +1708,137 @@ class EnhancedDiscoveryManager:
                     
                     # Add to discovered contacts
                     discovered_contacts.extend(contacts)
+                
+                # Collect contacts discovered by Gemini
+                if gemini_future is not None:
+                    try:
+                        result = gemini_future.result()
+                        
+                        # Extract contacts from response
+                        if result and isinstance(result, str):
+                            # Try to parse JSON from response
+                            try:
+                                # Find JSON part in response
+                                gemini_contacts = extract_json_array(result)
+                                if gemini_contacts:
+                                    # Process each contact
+                                    for contact in gemini_contacts:
+                                        # Add organization details
+                                        contact["organization_id"] = org_id
+                                        contact["organization_name"] = org_name
+                                        contact["source"] = "gemini"
+                                        
+                                        # Add to database
+                                        self.web_crawler._add_contact_to_database(contact)
+                                        
+                                        # Add to discovered contacts
+                                        discovered_contacts.append(contact)
+                            except:
+                                logger.error(f"Failed to parse JSON from Gemini response for {org_name}")
                     
-                except Exception as e:
-                    logger.error(f"Error extracting contacts from {url.url}: {e}")
+                    except Exception as e:
+                        logger.error(f"Error using Gemini to discover contacts for {org_name}: {e}")
+                
+                # Politeness delay
+                time.sleep(random.uniform(0.5, 1.5))
+        
+        return discovered_contacts
+    
+    def _extract_page_contacts(self, page_url: str, html_content: str, org_name: str) -> List[Dict[str, Any]]:
+        """
+        Parse one crawled page and extract its contacts (no database access).
+        
+        Args:
+            page_url: URL of the page
+            html_content: HTML content of the page
+            org_name: Organization name
             
-            # Try to discover contacts using Gemini
+        Returns:
+            Structured and standard contacts found on the page
+        """
+        try:
+            # Parse HTML
+            soup = BeautifulSoup(html_content, "html.parser")
+            logger.info(f"Parsed HTML for URL: {page_url}, content length: {len(html_content)}")
+            
+            # First try to extract structured contact data
             try:
-                # Combine all HTML content
-                combined_html = ""
-                for url in urls:
-                    if url.html_content:
-                        combined_html += f"\n\n{url.html_content}"
-                
-                if combined_html:
-                    # Create prompt for Gemini
-                    prompt = f"""
-                    Extract potential contacts from this organization's website content that might be involved in 
-                    SCADA system decisions or infrastructure management.
-                    
-                    Organization: {org_name}
-                    Organization Type: {org_type}
-                    
-                    Key roles to look for:
-                    {", ".join(relevant_roles[:5])}
-                    
-                    Extract as many details as possible:
-                    - Name
-                    - Position/Title
-                    - Email (if available)
-                    - Phone (if available)
-                    - Department
-                    
-                    Return the data as a JSON list of contacts.
-                    """
-                    
-                    # Call Gemini API
-                    result = self.gemini_client.generate_content(
-                        prompt, combined_html, temperature=0.2
-                    )
-                    
-                    # Extract contacts from response
-                    if result and isinstance(result, str):
-                        # Try to parse JSON from response
-                        try:
-                            # Find JSON part in response
-                            json_match = re.search(r'\[\s*\{.*\}\s*\]', result, re.DOTALL)
-                            if json_match:
-                                json_str = json_match.group(0)
-                                gemini_contacts = json.loads(json_str)
-                                
-                                # Process each contact
-                                for contact in gemini_contacts:
-                                    # Add organization details
-                                    contact["organization_id"] = org_id
-                                    contact["organization_name"] = org_name
-                                    contact["source"] = "gemini"
-                                    
-                                    # Add to database
-                                    self.web_crawler._add_contact_to_database(contact)
-                                    
-                                    # Add to discovered contacts
-                                    discovered_contacts.append(contact)
-                        except:
-                            logger.error(f"Failed to parse JSON from Gemini response for {org_name}")
+                structured_contacts = self.web_crawler._extract_structured_contact_data(soup, page_url)
+                logger.info(f"Found {len(structured_contacts)} structured contacts from {page_url}")
+            except Exception as e:
+                logger.error(f"Error extracting structured contacts: {e}")
+                structured_contacts = []
             
+            # Then try standard contact extraction
+            try:
+                standard_contacts = self.web_crawler._extract_contact_information(
+                    soup, page_url, org_name
+                )
+                logger.info(f"Found {len(standard_contacts)} standard contacts from {page_url}")
             except Exception as e:
-                logger.error(f"Error using Gemini to discover contacts for {org_name}: {e}")
+                logger.error(f"Error extracting standard contacts: {e}")
+                standard_contacts = []
             
-            # Politeness delay
-            time.sleep(random.uniform(0.5, 1.5))
+            # Combine contact data
+            contacts = structured_contacts + standard_contacts
+            logger.info(f"Combined {len(contacts)} total contacts from {page_url}")
+            return contacts
         
-        return discovered_contacts
+        except Exception as e:
+            logger.error(f"Error extracting contacts from {page_url}: {e}")
+            return []
+    
+    def _top_discovered_urls_by_org(
+        self, org_ids: List[int], per_org: int = 5
+    ) -> Dict[int, List[Tuple[int, str, int, Optional[str]]]]:
+        """
+        Fetch the highest-priority discovered URLs of several organizations in one query.
+        
+        Plain column rows are returned instead of DiscoveredURL objects, so the
+        commits made while saving contacts do not expire them and trigger a
+        reload of each row's HTML.
+        
+        Args:
+            org_ids: Organization IDs
+            per_org: Maximum number of URLs per organization
+            
+        Returns:
+            Dictionary mapping organization ID to its (id, url, organization_id, html_content)
+            rows, highest priority first
+        """
+        urls_by_org = defaultdict(list)
+        if not org_ids:
+            return urls_by_org
+        
+        # Rank each organization's URLs by priority so only the top rows
+        # (and their HTML content) are loaded
+        ranked = self.db_session.query(
+            DiscoveredURL.id.label("id"),
+            func.row_number().over(
+                partition_by=DiscoveredURL.organization_id,
+                order_by=DiscoveredURL.priority_score.desc()
+            ).label("url_rank")
+        ).filter(
+            DiscoveredURL.organization_id.in_(org_ids)
+        ).subquery()
+        
+        urls = self.db_session.query(
+            DiscoveredURL.id,
+            DiscoveredURL.url,
+            DiscoveredURL.organization_id,
+            DiscoveredURL.html_content
+        ).join(
+            ranked, DiscoveredURL.id == ranked.c.id
+        ).filter(
+            ranked.c.url_rank <= per_org
+        ).order_by(
+            DiscoveredURL.organization_id, ranked.c.url_rank
+        ).all()
+        
+        for url in urls:
+            urls_by_org[url.organization_id].append(url)
+        
+        return urls_by_org
     
     def _update_session_status(self, status: str) -> None:
         """
@@ -1260,133 +1879,126 @@ class EnhancedDiscoveryManager:
             date_str = datetime.datetime.now().strftime("%Y%m%d")
             filename = f"reports/discovery_{date_str}.txt"
             
-            with open(filename, "w") as f:
-                f.write("=== SCADA CLIENT DISCOVERY REPORT ===\n")
-                f.write(f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Session ID: {self.session_id}\n\n")
-                
-                # Write metrics
-                f.write("=== DISCOVERY METRICS ===\n")
-                f.write(f"Search Queries Executed: {metrics.get('search_queries_executed', 0)}\n")
-                f.write(f"Search Results Found: {metrics.get('search_results_found', 0)}\n")
-                f.write(f"URLs Crawled: {metrics.get('urls_crawled', 0)}\n")
-                f.write(f"Organizations Discovered: {metrics.get('organizations_discovered', 0)}\n")
-                f.write(f"Potential Clients Found: {metrics.get('potential_clients_found', 0)}\n")
-                f.write(f"Competitors Filtered: {metrics.get('competitors_filtered', 0)}\n")
-                f.write(f"Contacts Discovered: {metrics.get('contacts_discovered', 0)}\n")
-                f.write(f"High Relevance Organizations: {metrics.get('high_relevance_orgs', 0)}\n\n")
-                
-                # Write organization breakdown by type
-                f.write("=== ORGANIZATIONS BY TYPE ===\n")
-                orgs_by_type = metrics.get("orgs_by_type", {})
-                for org_type, count in sorted(orgs_by_type.items(), key=lambda x: x[1], reverse=True):
-                    f.write(f"{org_type}: {count}\n")
-                f.write("\n")
-                
-                # Write organization breakdown by state
-                f.write("=== ORGANIZATIONS BY STATE ===\n")
-                orgs_by_state = metrics.get("orgs_by_state", {})
-                for state, count in sorted(orgs_by_state.items(), key=lambda x: x[1], reverse=True):
-                    f.write(f"{state}: {count}\n")
-                f.write("\n")
-                
-                # Write top potential clients
-                f.write("=== TOP POTENTIAL CLIENTS ===\n")
-                potential_clients = [
-                    org for org in ranked_organizations
-                    if not org.get("is_competitor", False) and org.get("relevance_score", 0) >= 6.0
-                ]
-                
-                # Sort by relevance score
-                potential_clients = sorted(
-                    potential_clients,
-                    key=lambda x: x.get("relevance_score", 0),
-                    reverse=True
-                )
-                
-                # Write top 20
-                for i, org_data in enumerate(potential_clients[:20], 1):
-                    org = org_data.get("organization", {})
-                    f.write(f"{i}. {org.get('name', 'Unknown')} ({org.get('org_type', 'Unknown')}, {org.get('state', 'Unknown')})\n")
-                    f.write(f"   Relevance Score: {org_data.get('relevance_score', 0):.1f}/10\n")
-                    f.write(f"   Infrastructure Score: {org_data.get('infrastructure_score', 0):.1f}/10\n")
-                    
-                    # Write infrastructure indicators
-                    infra_indicators = org_data.get("infrastructure_indicators", {})
-                    infra_matches = infra_indicators.get("infrastructure_matches", [])
-                    if infra_matches:
-                        f.write(f"   Infrastructure Indicators: {', '.join(infra_matches[:5])}\n")
-                    
-                    f.write("\n")
-                
-                # Write competitor organizations
-                f.write("=== IDENTIFIED COMPETITORS ===\n")
-                competitors = [
-                    org for org in ranked_organizations
-                    if org.get("is_competitor", True)
-                ]
-                
-                # Sort by competitor score
-                competitors = sorted(
-                    competitors,
-                    key=lambda x: x.get("competitor_score", 0),
-                    reverse=True
-                )
-                
-                # Write top 10
-                for i, org_data in enumerate(competitors[:10], 1):
-                    org = org_data.get("organization", {})
-                    f.write(f"{i}. {org.get('name', 'Unknown')} ({org.get('org_type', 'Unknown')}, {org.get('state', 'Unknown')})\n")
-                    f.write(f"   Competitor Score: {org_data.get('competitor_score', 0):.1f}/10\n")
-                    
-                    # Write competitor indicators
-                    comp_analysis = org_data.get("competitor_analysis", {})
-                    comp_indicators = comp_analysis.get("competitor_indicators", [])
-                    if comp_indicators:
-                        f.write(f"   Competitor Indicators: {', '.join(comp_indicators[:3])}\n")
-                    
-                    f.write("\n")
+            # Assemble the report in memory and write it with a single call
+            parts = []
+            write = parts.append
+            
+            write("=== SCADA CLIENT DISCOVERY REPORT ===\n")
+            write(f"Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            write(f"Session ID: {self.session_id}\n\n")
+            
+            # Write metrics
+            write("=== DISCOVERY METRICS ===\n")
+            write(f"Search Queries Executed: {metrics.get('search_queries_executed', 0)}\n")
+            write(f"Search Results Found: {metrics.get('search_results_found', 0)}\n")
+            write(f"URLs Crawled: {metrics.get('urls_crawled', 0)}\n")
+            write(f"Organizations Discovered: {metrics.get('organizations_discovered', 0)}\n")
+            write(f"Potential Clients Found: {metrics.get('potential_clients_found', 0)}\n")
+            write(f"Competitors Filtered: {metrics.get('competitors_filtered', 0)}\n")
+            write(f"Contacts Discovered: {metrics.get('contacts_discovered', 0)}\n")
+            write(f"High Relevance Organizations: {metrics.get('high_relevance_orgs', 0)}\n\n")
+            
+            # Write organization breakdown by type
+            write("=== ORGANIZATIONS BY TYPE ===\n")
+            orgs_by_type = metrics.get("orgs_by_type", {})
+            for org_type, count in sorted(orgs_by_type.items(), key=itemgetter(1), reverse=True):
+                write(f"{org_type}: {count}\n")
+            write("\n")
+            
+            # Write organization breakdown by state
+            write("=== ORGANIZATIONS BY STATE ===\n")
+            orgs_by_state = metrics.get("orgs_by_state", {})
+            for state, count in sorted(orgs_by_state.items(), key=itemgetter(1), reverse=True):
+                write(f"{state}: {count}\n")
+            write("\n")
+            
+            # Write top potential clients
+            write("=== TOP POTENTIAL CLIENTS ===\n")
+            potential_clients = [
+                org for org in ranked_organizations
+                if not org.get("is_competitor", False) and org.get("relevance_score", 0) >= 6.0
+            ]
+            
+            # Select the top 20 by relevance score (descending)
+            top_potential_clients = heapq.nlargest(
+                20, potential_clients, key=itemgetter("relevance_score")
+            )
+            
+            # Write top 20
+            for i, org_data in enumerate(top_potential_clients, 1):
+                org = org_data.get("organization", {})
+                write(f"{i}. {org.get('name', 'Unknown')} ({org.get('org_type', 'Unknown')}, {org.get('state', 'Unknown')})\n")
+                write(f"   Relevance Score: {org_data.get('relevance_score', 0):.1f}/10\n")
+                write(f"   Infrastructure Score: {org_data.get('infrastructure_score', 0):.1f}/10\n")
                 
-                # Write contact summary
-                f.write("=== DISCOVERED CONTACTS ===\n")
-                f.write(f"Total Contacts: {len(contacts)}\n\n")
+                # Write infrastructure indicators
+                infra_indicators = org_data.get("infrastructure_indicators", {})
+                infra_matches = infra_indicators.get("infrastructure_matches", [])
+                if infra_matches:
+                    write(f"   Infrastructure Indicators: {', '.join(infra_matches[:5])}\n")
                 
-                # Group contacts by organization
-                contacts_by_org = {}
-                for contact in contacts:
-                    org_id = contact.get("organization_id")
-                    if org_id:
-                        if org_id not in contacts_by_org:
-                            contacts_by_org[org_id] = []
-                        contacts_by_org[org_id].append(contact)
+                write("\n")
+            
+            # Write competitor organizations
+            write("=== IDENTIFIED COMPETITORS ===\n")
+            competitors = [
+                org for org in ranked_organizations
+                if org.get("is_competitor", True)
+            ]
+            
+            # Select the top 10 by competitor score (descending); _rank_organizations
+            # sets the score on every ranked entry
+            top_competitors = heapq.nlargest(
+                10, competitors, key=itemgetter("competitor_score")
+            )
+            
+            # Write top 10
+            for i, org_data in enumerate(top_competitors, 1):
+                org = org_data.get("organization", {})
+                write(f"{i}. {org.get('name', 'Unknown')} ({org.get('org_type', 'Unknown')}, {org.get('state', 'Unknown')})\n")
+                write(f"   Competitor Score: {org_data.get('competitor_score', 0):.1f}/10\n")
                 
-                # Write contacts for top 10 organizations
-                top_orgs = [
-                    org for org in ranked_organizations
-                    if not org.get("is_competitor", False) and org.get("relevance_score", 0) >= 7.0
-                ]
+                # Write competitor indicators
+                comp_analysis = org_data.get("competitor_analysis", {})
+                comp_indicators = comp_analysis.get("competitor_indicators", [])
+                if comp_indicators:
+                    write(f"   Competitor Indicators: {', '.join(comp_indicators[:3])}\n")
                 
-                top_orgs = sorted(
-                    top_orgs,
-                    key=lambda x: x.get("relevance_score", 0),
-                    reverse=True
-                )
+                write("\n")
+            
+            # Write contact summary
+            write("=== DISCOVERED CONTACTS ===\n")
+            write(f"Total Contacts: {len(contacts)}\n\n")
+            
+            # Group contacts by organization
+            contacts_by_org = defaultdict(list)
+            for contact in contacts:
+                org_id = contact.get("organization_id")
+                if org_id:
+                    contacts_by_org[org_id].append(contact)
+            
+            # Write contacts for top 10 organizations (a subset of the potential clients)
+            top_orgs = heapq.nlargest(
+                10,
+                (org for org in potential_clients if org["relevance_score"] >= 7.0),
+                key=itemgetter("relevance_score")
+            )
+            
+            for org_data in top_orgs:
+                org = org_data.get("organization", {})
+                org_id = org.get("id")
                 
-                for org_data in top_orgs[:10]:
-                    org = org_data.get("organization", {})
-                    org_id = org.get("id")
+                if org_id and org_id in contacts_by_org:
+                    write(f"Contacts for {org.get('name', 'Unknown')}:\n")
                     
-                    if org_id and org_id in contacts_by_org:
-                        f.write(f"Contacts for {org.get('name', 'Unknown')}:\n")
-                        
-                        for contact in contacts_by_org[org_id]:
-                            name = contact.get("name", "Unknown")
-                            title = contact.get("title", "Unknown")
-                            email = contact.get("email", "N/A")
-                            
-                            f.write(f"- {name}, {title}, {email}\n")
-                        
-                        f.write("\n")
+                    write("".join([
+                        f"- {contact.get('name', 'Unknown')}, {contact.get('title', 'Unknown')}, {contact.get('email', 'N/A')}\n"
+                        for contact in contacts_by_org[org_id]
+                    ]))
+                    write("\n")
+            
+            with open(filename, "w") as f:
+                f.write("".join(parts))
             
             logger.info(f"Discovery report generated: {filename}")
         
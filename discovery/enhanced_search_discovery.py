@@ -6,21 +6,35 @@ This module implements a comprehensive search and classification approach for di
 2. Uses Gemini to validate if results are actual organizations of the target type
 3. Processes all relevant results from the search, not just the top 10
 """
+import collections
+import concurrent.futures
 import time
 import os
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
+import orjson
 from sqlalchemy.orm import Session
-from app.config import TARGET_STATES, ORG_TYPES, ORGANIZATION_TYPES
+from app.config import TARGET_STATES, ORG_TYPES, ORGANIZATION_TYPES, GOOGLE_SEARCH_QUERIES_PER_SECOND
+from app.database import crud
 from app.database.models import Organization, SearchQuery, SystemMetric
 from app.discovery.search.google_search import GoogleSearchClient
 from app.discovery.gemini_organization_classifier import GeminiOrganizationClassifier
+from app.discovery.rate_limiter import TokenBucket
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Number of search query records buffered before they are written in one batch
+SEARCH_QUERY_FLUSH_SIZE = 50
+
+# Number of (search + classification) work items run concurrently
+SEARCH_WORKERS = 4
+
+# Number of search results collected before a classification batch is sent
+CLASSIFY_BATCH_SIZE = 25
+
 class EnhancedSearchDiscovery:
     """
     Enhanced discovery system based on search and Gemini classification.
@@ -37,6 +51,13 @@ class EnhancedSearchDiscovery:
         self.search_client = GoogleSearchClient(db_session)
         self.classifier = GeminiOrganizationClassifier()
         
+        # Search query records waiting to be written to the database
+        self._pending_queries = []
+        
+        # Caps query starts across worker threads at the configured key limit;
+        # the search client still enforces the per-minute quota on each page
+        self._search_limiter = TokenBucket.per_second(GOOGLE_SEARCH_QUERIES_PER_SECOND)
+        
         # Metrics tracking
         self.metrics = {
             "search_queries_executed": 0,
@@ -88,8 +109,12 @@ class EnhancedSearchDiscovery:
         logger.info(f"Starting enhanced discovery for categories: {categories} in states: {states}")
         
         orgs_discovered = 0
+        self._pending_queries = []
         
-        # Process each category and state
+        # Plan every (category, state, query) search up front, formatting each
+        # query once and skipping repeats (e.g. a state or category listed twice)
+        work_items = []
+        planned = set()
         for category in categories:
             if category not in ORGANIZATION_TYPES:
                 logger.warning(f"Unknown category: {category}, skipping")
@@ -101,79 +126,94 @@ class EnhancedSearchDiscovery:
                 logger.warning(f"No search queries defined for category: {category}, skipping")
                 continue
                 
-            # Process each state
             for state in states:
-                # Check if we've reached the maximum organizations limit
-                if orgs_discovered >= max_orgs:
-                    logger.info(f"Reached maximum organizations limit: {max_orgs}")
-                    break
-                    
-                logger.info(f"Processing {category} in {state}")
-                
-                # Execute each search query for this category and state
                 for query_template in search_queries:
                     # Format query with state
-                    query = query_template.format(state=state)
-                    
-                    logger.info(f"Executing search: {query}")
-                    self.metrics["search_queries_executed"] += 1
-                    
-                    # Track this search in the database
-                    search_query_record = SearchQuery(
-                        query=query,
-                        category=category,
-                        state=state,
-                        search_engine="google"
-                    )
-                    self.db_session.add(search_query_record)
-                    self.db_session.commit()
+                    work_item = (category, state, query_template.format(state=state))
+                    if work_item not in planned:
+                        planned.add(work_item)
+                        work_items.append(work_item)
+        
+        # Searches and classifications run in worker threads, a few queries ahead
+        # of the results being saved; all database work stays on this thread
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=SEARCH_WORKERS)
+        in_flight = collections.deque()
+        next_item = 0
+        current_pair = None
+        
+        try:
+            while next_item < len(work_items) or in_flight:
+                # Keep the pipeline full
+                while next_item < len(work_items) and len(in_flight) < SEARCH_WORKERS:
+                    category, state, query = work_items[next_item]
+                    in_flight.append((
+                        category, state, query,
+                        executor.submit(self._search_and_classify, category, state, query, max_results_per_query)
+                    ))
+                    next_item += 1
+                
+                category, state, query, future = in_flight.popleft()
+                
+                if (category, state) != current_pair:
+                    current_pair = (category, state)
+                    logger.info(f"Processing {category} in {state}")
+                
+                logger.info(f"Executing search: {query}")
+                self.metrics["search_queries_executed"] += 1
+                
+                # Track this search in the database (buffered and written in batches)
+                search_query_record = SearchQuery(
+                    query=query,
+                    category=category,
+                    state=state,
+                    search_engine="google",
+                    execution_date=datetime.utcnow()
+                )
+                self._pending_queries.append(search_query_record)
+                
+                try:
+                    # Get the search result count and the classified organizations
+                    results_count, relevant_orgs = future.result()
                     
-                    try:
-                        # Get search results (up to max_results_per_query)
-                        search_results = self.search_client.get_all_results(query, max_results=max_results_per_query)
+                    # Update metrics and search record
+                    if results_count:
+                        search_query_record.results_count = results_count
                         
-                        # Update metrics and search record
-                        if search_results:
-                            search_query_record.results_count = len(search_results)
-                            self.db_session.commit()
-                            
-                            self.metrics["search_results_found"] += len(search_results)
-                            logger.info(f"Found {len(search_results)} search results for query: {query}")
-                            
-                            # Classify search results using Gemini
-                            relevant_orgs = self.classifier.batch_classify(search_results, category, state)
-                            
-                            # Save relevant organizations to database
-                            orgs_saved = self._save_organizations(relevant_orgs)
-                            orgs_discovered += orgs_saved
-                            
-                            # Update metrics
-                            self.metrics["organizations_discovered"] += orgs_saved
-                            self.metrics["by_category"][category] = self.metrics["by_category"].get(category, 0) + orgs_saved
-                            self.metrics["by_state"][state] = self.metrics["by_state"].get(state, 0) + orgs_saved
-                            
-                            logger.info(f"Saved {orgs_saved} organizations from query: {query}")
-                            
-                            # Check if we've reached the maximum organizations limit
-                            if orgs_discovered >= max_orgs:
-                                logger.info(f"Reached maximum organizations limit during search: {max_orgs}")
-                                break
-                        else:
-                            logger.warning(f"No search results found for query: {query}")
-                            
-                    except Exception as e:
-                        logger.error(f"Error processing search query '{query}': {e}")
+                        self.metrics["search_results_found"] += results_count
+                        logger.info(f"Found {results_count} search results for query: {query}")
                         
-                    # Add delay between queries to avoid rate limiting
-                    time.sleep(2)
-                    
-                # Check if we've reached the limit after this state
+                        # Save relevant organizations to database
+                        orgs_saved = self._save_organizations(relevant_orgs)
+                        orgs_discovered += orgs_saved
+                        
+                        # Update metrics
+                        self.metrics["organizations_discovered"] += orgs_saved
+                        self.metrics["by_category"][category] = self.metrics["by_category"].get(category, 0) + orgs_saved
+                        self.metrics["by_state"][state] = self.metrics["by_state"].get(state, 0) + orgs_saved
+                        
+                        logger.info(f"Saved {orgs_saved} organizations from query: {query}")
+                    else:
+                        logger.warning(f"No search results found for query: {query}")
+                        
+                except Exception as e:
+                    logger.error(f"Error processing search query '{query}': {e}")
+                
+                # Write the buffered records once the batch is full (results_count is set by now)
+                if len(self._pending_queries) >= SEARCH_QUERY_FLUSH_SIZE:
+                    self._flush_search_queries()
+                
+                # Check if we've reached the maximum organizations limit
                 if orgs_discovered >= max_orgs:
+                    logger.info(f"Reached maximum organizations limit: {max_orgs}")
                     break
-                    
-            # Check if we've reached the limit after this category
-            if orgs_discovered >= max_orgs:
-                break
+        finally:
+            # Drop searches that have not started; running ones finish in the background
+            for _, _, _, future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+            
+            # Write any search query records still buffered
+            self._flush_search_queries()
                 
         # Calculate runtime and add to metrics
         end_time = time.time()
@@ -192,6 +232,59 @@ class EnhancedSearchDiscovery:
         
         return self.metrics
     
+    def _search_and_classify(
+        self, category: str, state: str, query: str, max_results: int
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Run one search and classify its results (called from worker threads, no database access).
+        
+        Results are classified in batches as pages arrive rather than after the
+        whole result list has been fetched.
+        
+        Args:
+            category: Organization category
+            state: State the query targets
+            query: Search query
+            max_results: Maximum number of search results
+            
+        Returns:
+            Tuple of (number of search results, relevant_orgs)
+        """
+        # Shared limiter spacing out searches across all workers
+        self._search_limiter.acquire()
+        
+        results_count = 0
+        relevant_orgs = []
+        batch_buf = []
+        
+        for page_items in self.search_client.get_all_results_iter(query, max_results=max_results):
+            results_count += len(page_items)
+            batch_buf.extend(page_items)
+            
+            if len(batch_buf) >= CLASSIFY_BATCH_SIZE:
+                # Classify search results using Gemini
+                relevant_orgs.extend(self.classifier.batch_classify(batch_buf, category, state))
+                batch_buf = []
+        
+        if batch_buf:
+            relevant_orgs.extend(self.classifier.batch_classify(batch_buf, category, state))
+        
+        return results_count, relevant_orgs
+    
+    def _flush_search_queries(self) -> None:
+        """Write the buffered search query records with one bulk insert and commit."""
+        if not self._pending_queries:
+            return
+        
+        try:
+            self.db_session.bulk_save_objects(self._pending_queries)
+            self.db_session.commit()
+        except Exception as e:
+            logger.error(f"Error saving search queries: {e}")
+            self.db_session.rollback()
+        finally:
+            self._pending_queries = []
+    
     def _save_organizations(self, org_data_list: List[Dict[str, Any]]) -> int:
         """
         Save organizations to database if they don't already exist.
@@ -202,39 +295,51 @@ class EnhancedSearchDiscovery:
         Returns:
             Number of organizations saved
         """
-        saved_count = 0
-        
-        for org_data in org_data_list:
-            try:
-                # Check if organization already exists by name and state
-                from app.database import crud
-                existing_org = crud.get_organization_by_name_and_state(
-                    self.db_session, org_data["name"], org_data["state"]
-                )
+        try:
+            # Collapse repeats of the same organization (normalized name and state),
+            # keeping the most relevant one. Names are normalized as in the
+            # case-insensitive existing-organization lookup below
+            candidates = {}
+            for org_data in org_data_list:
+                key = (org_data["name"].strip().lower(), org_data["state"])
+                current = candidates.get(key)
+                if current is None or org_data.get("relevance_score", 0) > current.get("relevance_score", 0):
+                    candidates[key] = org_data
+            
+            # Look up every organization that already exists with a single query
+            existing_orgs = crud.get_organizations_by_name_and_state(
+                self.db_session, [(org_data["name"], org_data["state"]) for org_data in candidates.values()]
+            )
+            
+            new_orgs = []
+            for key, org_data in candidates.items():
+                existing_org = existing_orgs.get(key)
                 
                 if existing_org:
                     logger.info(f"Organization already exists: {org_data['name']} in {org_data['state']}")
                     
-                    # Update relevance score if new one is higher
-                    if org_data.get("relevance_score", 0) > existing_org.relevance_score:
+                    # Update relevance score if new one is higher (committed with the inserts)
+                    if org_data.get("relevance_score", 0) > (existing_org.relevance_score or 0):
                         existing_org.relevance_score = org_data["relevance_score"]
-                        self.db_session.commit()
                         logger.info(f"Updated relevance score for {org_data['name']}")
                         
                     continue
                 
                 # Add discovery timestamp
                 org_data["discovery_date"] = datetime.now()
-                
-                # Create new organization
-                new_org = crud.create_organization(self.db_session, org_data)
-                logger.info(f"Created new organization: {new_org.name} in {new_org.state}")
-                saved_count += 1
-                
-            except Exception as e:
-                logger.error(f"Error saving organization {org_data.get('name', 'Unknown')}: {e}")
-                
-        return saved_count
+                new_orgs.append(org_data)
+            
+            # Create all new organizations with one bulk insert and commit
+            created_orgs = crud.bulk_create_organizations(self.db_session, new_orgs)
+            for org_data in created_orgs:
+                logger.info(f"Created new organization: {org_data['name']} in {org_data['state']}")
+            
+        except Exception as e:
+            logger.error(f"Error saving organizations: {e}")
+            self.db_session.rollback()
+            return 0
+        
+        return len(created_orgs)
     
     def _save_metrics(self, runtime_seconds: int) -> None:
         """
@@ -261,17 +366,18 @@ class EnhancedSearchDiscovery:
     def _generate_report(self) -> None:
         """Generate a report file with the discovery metrics."""
         try:
-            # Create report filename with date
-            date_str = datetime.now().strftime("%Y%m%d")
+            # Create report filename with the full timestamp so each run gets its own file
+            now = datetime.now()
+            timestamp_str = now.strftime("%Y%m%d_%H%M%S")
             report_path = os.path.join(
                 os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 
                 "reports", 
-                f"discovery_{date_str}.txt"
+                f"discovery_{timestamp_str}.txt"
             )
             
             # Format the report content
             report_content = f"""
-Discovery Report - {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+Discovery Report - {now.strftime("%Y-%m-%d %H:%M:%S")}
 =============================================================
 
 Summary:
@@ -287,9 +393,13 @@ Organizations by State:
 {self._format_dict(self.metrics["by_state"])}
 """
             
-            # Write the report
-            with open(report_path, "a") as f:
+            # Write the report in one call
+            with open(report_path, "w") as f:
                 f.write(report_content)
+            
+            # Write the raw metrics alongside it for programmatic consumers
+            with open(os.path.splitext(report_path)[0] + ".json", "wb") as f:
+                f.write(orjson.dumps(self.metrics, option=orjson.OPT_INDENT_2))
                 
             logger.info(f"Discovery report saved to {report_path}")
             
@@ -5,19 +5,272 @@ This module implements advanced fallback strategies for discovering contacts whe
 primary methods don't yield sufficient results (less than 3 contacts per organization).
 """
 
+import concurrent.futures
+import functools
 import re
 import logging
 import time
-import json
+from types import MappingProxyType
+import orjson
 import requests
-from bs4 import BeautifulSoup
 from typing import List, Dict, Any, Optional, Tuple
+from app.config import (
+    GOOGLE_SEARCH_QUERIES_PER_SECOND, RESULT_CACHE_PATH, SEARCH_CACHE_TTL_HOURS, GEMINI_CACHE_TTL_DAYS,
+    TARGET_STATES
+)
+from app.discovery.rate_limiter import TokenBucket
+from app.discovery.result_cache import ResultCache, make_cache_key
 from app.utils.logger import get_logger
 from app.validation.email_validator import EmailValidator
 from app.utils.gemini_client import GeminiClient
 
 logger = get_logger(__name__)
 
+# Number of query formats tried per position title
+POSITION_QUERIES_PER_TITLE = 4
+
+# Number of contacts after which position-based search stops
+POSITION_CONTACT_TARGET = 5
+
+# Maximum search results sent to Gemini in one relevance analysis
+ANALYSIS_RESULT_LIMIT = 40
+
+# Titles searched for any organization type, after the type-specific titles
+COMMON_POSITION_TITLES = ("Project Manager", "Chief Engineer", "Operations Manager", "Estimator", "Director")
+
+# Titles used when an organization type has no specific titles
+GENERIC_POSITION_TITLES = ("Manager", "Director", "Supervisor", "Engineer")
+
+# Position titles searched by organization type
+POSITION_TITLES = MappingProxyType({
+    "water": (
+        "Operations Manager",
+        "Plant Manager",
+        "Water Quality Manager",
+        "Treatment Plant Supervisor",
+        "Utilities Director",
+        "Water Systems Technician",
+        "SCADA Technician",
+        "Control Systems Engineer"
+    ),
+    "municipal": (
+        "Public Works Director",
+        "City Manager",
+        "Water Department Manager",
+        "City Engineer",
+        "Facilities Manager",
+        "Utilities Superintendent",
+        "Infrastructure Director",
+        "Operations Supervisor"
+    ),
+    "government": (
+        "Public Works Director",
+        "County Engineer",
+        "Infrastructure Manager",
+        "Facilities Director",
+        "Operations Manager",
+        "IT Systems Manager",
+        "Technical Operations Supervisor"
+    ),
+    "engineering": (
+        "Project Manager",
+        "Engineering Manager",
+        "Control Systems Engineer",
+        "Technical Director"
+    ),
+    "utility": (
+        "Operations Manager",
+        "Control Room Supervisor",
+        "SCADA Engineer",
+        "Systems Control Manager",
+        "Technical Director",
+        "Plant Manager"
+    ),
+    "transportation": (
+        "Operations Director",
+        "Systems Control Manager",
+        "Traffic Control Manager",
+        "Transportation Engineer",
+        "Infrastructure Systems Manager"
+    ),
+    "oil_gas": (
+        "Operations Manager",
+        "Control Systems Engineer",
+        "SCADA Technician",
+        "Automation Supervisor",
+        "Production Engineer",
+        "Field Operations Manager"
+    ),
+    "agriculture": (
+        "Irrigation Manager",
+        "Operations Director",
+        "Systems Manager",
+        "Technical Supervisor",
+        "Water Resources Manager",
+        "District Engineer"
+    )
+})
+
+# Titles searched per organization type: type-specific titles first, then the
+# common titles, without duplicates
+_MERGED_POSITION_TITLES = MappingProxyType({
+    org_type: tuple(dict.fromkeys([*(titles or GENERIC_POSITION_TITLES), *COMMON_POSITION_TITLES]))
+    for org_type, titles in POSITION_TITLES.items()
+})
+
+# Common email formats for trying patterns
+EMAIL_PATTERNS = (
+    "{first}.{last}@{domain}",
+    "{first_initial}{last}@{domain}",
+    "{first}@{domain}",
+    "{last}.{first}@{domain}",
+    "{first_initial}.{last}@{domain}",
+    "{last}{first_initial}@{domain}",
+    "{first}_{last}@{domain}",
+    "{first}-{last}@{domain}"
+)
+
+# Position search query formats, most specific first; only the first
+# POSITION_QUERIES_PER_TITLE are used. Both quoted and unquoted versions are
+# included for better coverage.
+_POSITION_QUERY_TEMPLATES = (
+    '"{org}" {location} "{title}"',     # Standard format with quotes
+    '{org} {location} "{title}"',       # Unquoted org name, quoted title
+    '"{org}" {state} {title} contact',  # Without quotes for title
+    '{org} {state} {title} contact',    # Unquoted org name and title
+    '"{org}" {title} email',            # Look for email with quoted title
+    '{org} {title} email',              # Unquoted org name with title and email
+    '"{org}" {state} {title}',          # Simple format with quoted org name
+    '{org} {state} {title}',            # Simple format with everything unquoted
+    '{title} at "{org}" {location}',    # "at" format
+    '{title} at {org} {location}',      # "at" format unquoted
+    '"{org}" staff directory',          # General staff directory
+    '{org} staff directory',            # Unquoted staff directory search
+)
+
+# Canned results for the Central Arizona Water Conservation District when search is unavailable
+_CAWCD_FALLBACK_RESULTS = (
+    {
+        "title": "Management Council | Central Arizona Project",
+        "snippet": "Central Arizona Project's Management Council is responsible for the day-to-day operations of the 336-mile long CAP aqueduct system, including Operations Managers, Engineers, and other key personnel.",
+        "url": "https://www.cap-az.com/about/management-council/"
+    },
+    {
+        "title": "Careers | Central Arizona Project",
+        "snippet": "CAP offers highly competitive salaries and excellent benefits. Find job listings and information about careers at the Central Arizona Water Conservation District (CAWCD).",
+        "url": "https://www.cap-az.com/careers/"
+    },
+    {
+        "title": "Contact Us | Central Arizona Project",
+        "snippet": "Contact information for the Central Arizona Project (CAP). Find phone numbers, email addresses, and information about departments and staff.",
+        "url": "https://www.cap-az.com/contact/"
+    },
+    {
+        "title": "About | Central Arizona Project",
+        "snippet": "The Central Arizona Project (CAP) delivers Colorado River water to Central and Southern Arizona. CAP is managed by the Central Arizona Water Conservation District (CAWCD).",
+        "url": "https://www.cap-az.com/about/"
+    }
+)
+
+# Fixed part of the Gemini prompt that filters position search results; the
+# query, position, organization and results are appended after it
+_RESULT_ANALYSIS_INSTRUCTIONS = """
+        TASK: Analyze each search result below to determine if it contains information about a person with a relevant position.
+        
+        Consider these relevant alternative job titles that would be valuable for SCADA integration sales:
+        - Operations Manager / Director
+        - Facilities Director / Manager
+        - City Engineer
+        - Public Works Director
+        - Infrastructure Manager
+        - Plant Manager
+        - Utilities Superintendent / Manager
+        - City Planner (only if they would be involved in infrastructure planning)
+        - Water Resources Manager
+        - Control Systems Engineer
+        - SCADA Technician / Engineer
+        
+        For each result, provide:
+        1. Is this result relevant? (true/false)
+        2. If relevant, what position or job title is mentioned?
+        3. Is the position similar enough to our target position to be valuable?
+        
+        Return only the original search results that are relevant, with unchanged title, snippet, and url.
+        Return the results in this JSON format:
+        [
+            {
+                "title": "Original result title",
+                "snippet": "Original result snippet",
+                "url": "Original result url"
+            },
+            ...
+        ]
+"""
+
+# Fixed part of the Gemini prompt that rates a job title found in a search result
+# against the searched title; both titles are appended after it
+_TITLE_RELEVANCE_INSTRUCTIONS = """
+                    Evaluate if the job title below is relevant to the searched title
+                    for SCADA (Supervisory Control and Data Acquisition) integration services outreach.
+                    
+                    Consider:
+                    1. Would this person have decision-making authority related to automation/control systems?
+                    2. Would they have technical knowledge or influence over operational technology?
+                    3. Might they be involved in infrastructure or facility operations?
+                    4. Could they influence budget decisions for control systems?
+                    
+                    Return a JSON with:
+                    1. "is_relevant": true or false
+                    2. "relevance_score": 1-10 (where 10 is highly relevant)
+                    3. "reason": brief explanation
+"""
+
+# Precompiled patterns used for query parsing and contact extraction
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+_URL_RE = re.compile(r'https?://[^\s"\']+')
+_TITLE_NAME_RE = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)(?:\s*-\s*|\s+at\s+|\s+from\s+|\s+with\s+)')
+_TITLE_JOB_RE = re.compile(r'(?:[-:]\s*)([A-Za-z\s,]+)(?:\s+at|$)')
+_SNIPPET_NAME_RES = (
+    # Pattern for "Name is the Title" or "Name serves as Title"
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)(?:\s+is|\s+serves as|\s+has been|\s+was named|\s+was appointed)(?:\s+the|\s+our|\s+as|\s+to)?(?:\s+new)?\s+([A-Za-z\s]+)'),
+    re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+),?\s+([A-Za-z\s]+)'),
+)
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_PHONE_RE = re.compile(r'(\(\d{3}\)\s*\d{3}-\d{4}|\d{3}-\d{3}-\d{4})')
+
+# (lowercased name, name) pairs for the target states, checked in config order
+_TARGET_STATE_NAMES = tuple((state.lower(), state) for state in TARGET_STATES)
+
+# (keyword, category) pairs for inferring a search category, checked in order
+_CATEGORY_KEYWORDS = (
+    ("water", "water"), ("wastewater", "water"), ("utility", "water"), ("utilities", "water"),
+    ("engineer", "engineering"), ("engineering", "engineering"), ("design", "engineering"),
+    ("government", "government"), ("agency", "government"), ("department", "government"),
+    ("city", "municipal"), ("town", "municipal"), ("county", "municipal"), ("municipal", "municipal"),
+    ("power", "utility"), ("electric", "utility"),
+    ("transport", "transportation"), ("transit", "transportation"), ("traffic", "transportation"),
+    ("oil", "oil_gas"), ("gas", "oil_gas"), ("petroleum", "oil_gas"), ("pipeline", "oil_gas"),
+    ("agriculture", "agriculture"), ("farm", "agriculture"), ("irrigation", "agriculture")
+)
+
+# Replaces parentheses with spaces before a query is sent to the search engine
+_PAREN_TABLE = str.maketrans("()", "  ")
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_query(query: str) -> str:
+    """
+    Replace parentheses in a search query with spaces, memoized per query.
+    
+    Args:
+        query: Search query
+        
+    Returns:
+        Sanitized query
+    """
+    return query.translate(_PAREN_TABLE)
+
+
 class FallbackContactDiscovery:
     """
     Implements fallback strategies for contact discovery when primary methods
@@ -43,89 +296,36 @@ class FallbackContactDiscovery:
             from app.discovery.search_engine import SearchEngine
             self.search_engine = SearchEngine(self.db_session)
         
+        # Shared limiter for searches issued from worker threads (replaces a fixed sleep per query)
+        self._search_limiter = TokenBucket.per_second(GOOGLE_SEARCH_QUERIES_PER_SECOND)
+        
+        # Cache of search engine results keyed by (query, category, state)
+        self._search_cache = ResultCache(
+            RESULT_CACHE_PATH,
+            namespace="fallback_search",
+            ttl_seconds=SEARCH_CACHE_TTL_HOURS * 3600
+        )
+        self.search_cache_stats = {"hits": 0, "misses": 0}
+        
+        # Cache of Gemini job title relevance evaluations keyed by (extracted title, searched title)
+        self._relevance_cache = ResultCache(
+            RESULT_CACHE_PATH,
+            namespace="fallback_title_relevance",
+            ttl_seconds=GEMINI_CACHE_TTL_DAYS * 24 * 3600
+        )
+        
+        # Cache of Gemini relevance analyses keyed by (position, organization, results)
+        self._analysis_cache = ResultCache(
+            RESULT_CACHE_PATH,
+            namespace="fallback_result_analysis",
+            ttl_seconds=GEMINI_CACHE_TTL_DAYS * 24 * 3600
+        )
+        
         # Position titles by organization type
-        self.position_titles = {
-            "water": [
-                "Operations Manager", 
-                "Plant Manager", 
-                "Water Quality Manager",
-                "Treatment Plant Supervisor",
-                "Utilities Director", 
-                "Water Systems Technician",
-                "SCADA Technician",
-                "Control Systems Engineer"
-            ],
-            "municipal": [
-                "Public Works Director",
-                "City Manager",
-                "Water Department Manager",
-                "City Engineer",
-                "Facilities Manager",
-                "Utilities Superintendent",
-                "Infrastructure Director",
-                "Operations Supervisor"
-            ],
-            "government": [
-                "Public Works Director",
-                "County Engineer",
-                "Infrastructure Manager",
-                "Facilities Director",
-                "Operations Manager",
-                "IT Systems Manager",
-                "Technical Operations Supervisor"
-            ],
-            "engineering": [
-                "Project Manager",
-                "Engineering Manager",
-                "Control Systems Engineer",
-                "Technical Director",
-               
-            ],
-            "utility": [
-                "Operations Manager",
-                "Control Room Supervisor",
-                "SCADA Engineer",
-                "Systems Control Manager",
-                "Technical Director",
-                "Plant Manager",
-                
-            ],
-            "transportation": [
-                "Operations Director",
-                "Systems Control Manager",
-                "Traffic Control Manager",
-                "Transportation Engineer",
-                "Infrastructure Systems Manager"
-            ],
-            "oil_gas": [
-                "Operations Manager",
-                "Control Systems Engineer",
-                "SCADA Technician",
-                "Automation Supervisor",
-                "Production Engineer",
-                "Field Operations Manager"
-            ],
-            "agriculture": [
-                "Irrigation Manager",
-                "Operations Director",
-                "Systems Manager",
-                "Technical Supervisor",
-                "Water Resources Manager",
-                "District Engineer"
-            ]
-        }
+        self.position_titles = POSITION_TITLES
         
         # Common email formats for trying patterns
-        self.email_patterns = [
-            "{first}.{last}@{domain}",
-            "{first_initial}{last}@{domain}",
-            "{first}@{domain}",
-            "{last}.{first}@{domain}",
-            "{first_initial}.{last}@{domain}",
-            "{last}{first_initial}@{domain}",
-            "{first}_{last}@{domain}",
-            "{first}-{last}@{domain}"
-        ]
+        self.email_patterns = EMAIL_PATTERNS
         
     def discover_contacts(self, organization: Dict[str, Any], min_contacts: int = 3) -> List[Dict[str, Any]]:
         """
@@ -156,10 +356,9 @@ class FallbackContactDiscovery:
         
         # 1. Position-based discovery
         if len(discovered_contacts) < min_contacts:
+            # Contacts from discover_by_position are already unique by name
             position_contacts = self.discover_by_position(org_name, org_type, location, state)
-            for contact in position_contacts:
-                if contact not in discovered_contacts:
-                    discovered_contacts.append(contact)
+            discovered_contacts.extend(position_contacts)
             
             logger.info(f"Found {len(position_contacts)} contacts via position-based search")
         
@@ -206,66 +405,60 @@ class FallbackContactDiscovery:
             List of discovered contacts
         """
         discovered_contacts = []
+        seen_names = set()  # Normalized (first, last) names already in discovered_contacts
         
-        # Get relevant position titles for this organization type
-        titles = self.position_titles.get(org_type, self.position_titles.get('municipal', []))
-        if not titles:
-            titles = ["Manager", "Director", "Supervisor", "Engineer"]
-            
-        # Add common titles that should be searched for any organization type
-        common_titles = ["Project Manager", "Chief Engineer", "Operations Manager", "Estimator", "Director"]
-        
-        # Combine organization-specific titles with common titles, avoiding duplicates
-        all_titles = []
-        for title in titles:
-            if title not in all_titles:
-                all_titles.append(title)
-                
-        for title in common_titles:
-            if title not in all_titles:
-                all_titles.append(title)
+        # Get relevant position titles (plus the common titles) for this organization type
+        all_titles = _MERGED_POSITION_TITLES.get(org_type, _MERGED_POSITION_TITLES['municipal'])
         
         # Add state to location if not already included
         if state and state.lower() not in location.lower():
             location = f"{location}, {state}"
         
-        # Try each title with different search patterns for better results
-        for title in all_titles:
-            # Clean any parentheses from organization name first
-            clean_org_name = org_name.replace("(", "").replace(")", "").strip()
-            
-            # Try different query formats for better coverage, including both quoted and unquoted versions
-            queries = [
-                f"\"{clean_org_name}\" {location} \"{title}\"",                     # Standard format with quotes
-                f"{clean_org_name} {location} \"{title}\"",                         # Unquoted org name, quoted title
-                f"\"{clean_org_name}\" {state} {title} contact",                    # Without quotes for title
-                f"{clean_org_name} {state} {title} contact",                        # Unquoted org name and title
-                f"\"{clean_org_name}\" {title} email",                             # Look for email with quoted title
-                f"{clean_org_name} {title} email",                                 # Unquoted org name with title and email
-                f"\"{clean_org_name}\" {state} {title}",                           # Simple format with quoted org name
-                f"{clean_org_name} {state} {title}",                               # Simple format with everything unquoted
-                f"{title} at \"{clean_org_name}\" {location}",                      # "at" format
-                f"{title} at {clean_org_name} {location}",                          # "at" format unquoted
-                f"\"{clean_org_name}\" staff directory",                           # General staff directory
-                f"{clean_org_name} staff directory"                                # Unquoted staff directory search
-            ]
-            
-            # Execute up to 4 of these query formats to try more variations
-            contacts_for_title = 0
-            for query in queries[:4]:
-                try:
-                    logger.info(f"Searching for: {query}")
-                    search_results = self._perform_search(query)
+        # Clean any parentheses from organization name first
+        clean_org_name = org_name.replace("(", "").replace(")", "").strip()
+        
+        # Each title's queries run in order and stop as soon as the title has enough
+        # contacts. Only the first search of the next title is prefetched, in a single
+        # worker, while the current title's results are processed here
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        
+        def prefetch_first_query(position_title: str) -> Tuple[set, concurrent.futures.Future]:
+            seen_results = set()
+            query = self._position_queries(clean_org_name, location, state, position_title)[0]
+            return seen_results, executor.submit(
+                self._search_position_query, org_name, position_title, query, seen_results
+            )
+        
+        prefetched = prefetch_first_query(all_titles[0]) if all_titles else None
+        staff_directory_searched = False
+        
+        try:
+            # Try each title with different search patterns for better results
+            for index, title in enumerate(all_titles):
+                seen_results, first_future = prefetched
+                prefetched = prefetch_first_query(all_titles[index + 1]) if index + 1 < len(all_titles) else None
+                
+                # Process search results (contacts for this title share one discovery method string)
+                discovery_method = f"position_search_{title}"
+                contacts_for_title = 0
+                for query_index, query in enumerate(self._position_queries(clean_org_name, location, state, title)):
+                    try:
+                        if query_index == 0:
+                            query_results = first_future.result()
+                        else:
+                            query_results = self._search_position_query(org_name, title, query, seen_results)
+                    except Exception as e:
+                        logger.error(f"Error in position search for {query}: {e}")
+                        continue
                     
-                    # Process search results
-                    for result in search_results:
+                    for result in query_results:
                         # Try to extract names and contacts from each result
                         contact_info = self._extract_contact_from_result(result, title)
                         
                         if contact_info:
                             # Add metadata
                             contact_info['organization'] = org_name
-                            contact_info['discovery_method'] = f"position_search_{title}"
+                            contact_info['discovery_method'] = discovery_method
                             contact_info['discovery_query'] = query
                             
                             # Set relevance score
@@ -277,83 +470,163 @@ class FallbackContactDiscovery:
                                 contact_info['relevance_score'] = 7.0
                             
                             # Add to discovered contacts if not already present
-                            if not any(c.get('first_name') == contact_info.get('first_name') and 
-                                      c.get('last_name') == contact_info.get('last_name') 
-                                      for c in discovered_contacts):
+                            name_key = self._contact_name_key(contact_info)
+                            if name_key not in seen_names:
+                                seen_names.add(name_key)
                                 discovered_contacts.append(contact_info)
                                 
                                 # Count this as a contact found for this title
                                 if title.lower() in contact_info.get('job_title', '').lower():
                                     contacts_for_title += 1
                                 
-                                logger.info(f"Found contact: {contact_info.get('first_name')} {contact_info.get('last_name')}, "
-                                         f"Title: {contact_info.get('job_title')}")
+                                logger.info("Found contact: %s %s, Title: %s", contact_info.get('first_name'),
+                                            contact_info.get('last_name'), contact_info.get('job_title'))
+                        
+                        if contacts_for_title >= 2 or len(discovered_contacts) >= POSITION_CONTACT_TARGET:
+                            break
                     
-                    # If we found contacts with this query, try the next title
+                    # If we found enough contacts for this title, skip its remaining queries
                     if contacts_for_title >= 2:
                         logger.info(f"Found sufficient contacts for {title}, moving to next title")
                         break
-                        
-                    # Rate limiting for search API
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"Error in position search for {query}: {e}")
-                    continue
-            
-            # Final query: try a staff directory search if we still don't have enough contacts
-            # This often finds contacts with different but relevant positions
-            if contacts_for_title == 0 and self.gemini_client:
-                try:
-                    staff_query = f"\"{org_name}\" staff directory"
-                    logger.info(f"Searching for staff directory: {staff_query}")
-                    
-                    search_results = self._perform_search(staff_query)
                     
-                    for result in search_results:
-                        # Try to extract names and contacts from each result, but evaluate alternate titles
-                        contact_info = self._extract_contact_from_result(result, title)
+                    # Skip the remaining queries once enough contacts were found overall
+                    if len(discovered_contacts) >= POSITION_CONTACT_TARGET:
+                        break
+                
+                # Final query: try a staff directory search if we still don't have enough contacts
+                # This often finds contacts with different but relevant positions. The query is
+                # the same for every title, so it runs at most once per organization.
+                if (contacts_for_title == 0 and self.gemini_client and not staff_directory_searched
+                        and len(discovered_contacts) < POSITION_CONTACT_TARGET):
+                    staff_directory_searched = True
+                    try:
+                        staff_query = f"\"{org_name}\" staff directory"
+                        logger.info(f"Searching for staff directory: {staff_query}")
                         
-                        if contact_info:
-                            # Add metadata
-                            contact_info['organization'] = org_name
-                            contact_info['discovery_method'] = "staff_directory_search"
-                            contact_info['discovery_query'] = staff_query
-                            contact_info['relevance_score'] = 6.5  # Slightly lower but still good
+                        search_results = self._perform_search(staff_query)
+                        
+                        for result in search_results:
+                            # Try to extract names and contacts from each result, but evaluate alternate titles
+                            contact_info = self._extract_contact_from_result(result, title)
                             
-                            # Add to discovered contacts if not already present
-                            if not any(c.get('first_name') == contact_info.get('first_name') and 
-                                      c.get('last_name') == contact_info.get('last_name') 
-                                      for c in discovered_contacts):
-                                discovered_contacts.append(contact_info)
-                                logger.info(f"Found contact from staff directory: {contact_info.get('first_name')} "
-                                         f"{contact_info.get('last_name')}, Title: {contact_info.get('job_title')}")
+                            if contact_info:
+                                # Add metadata
+                                contact_info['organization'] = org_name
+                                contact_info['discovery_method'] = "staff_directory_search"
+                                contact_info['discovery_query'] = staff_query
+                                contact_info['relevance_score'] = 6.5  # Slightly lower but still good
                                 
-                    # Rate limiting
-                    time.sleep(1)
-                except Exception as e:
-                    logger.error(f"Error in staff directory search: {e}")
-            
-            # If we found enough contacts overall, stop searching
-            if len(discovered_contacts) >= 5:
-                logger.info(f"Found {len(discovered_contacts)} contacts, stopping search")
-                break
+                                # Add to discovered contacts if not already present
+                                name_key = self._contact_name_key(contact_info)
+                                if name_key not in seen_names:
+                                    seen_names.add(name_key)
+                                    discovered_contacts.append(contact_info)
+                                    logger.info("Found contact from staff directory: %s %s, Title: %s",
+                                                contact_info.get('first_name'), contact_info.get('last_name'),
+                                                contact_info.get('job_title'))
+                                    
+                                    if len(discovered_contacts) >= POSITION_CONTACT_TARGET:
+                                        break
+                    except Exception as e:
+                        logger.error(f"Error in staff directory search: {e}")
+                
+                # If we found enough contacts overall, stop searching
+                if len(discovered_contacts) >= POSITION_CONTACT_TARGET:
+                    logger.info(f"Found {len(discovered_contacts)} contacts, stopping search")
+                    break
+        finally:
+            # Skip the prefetched search if it has not started, and wait for it otherwise,
+            # so no searches run after this method returns
+            if prefetched is not None:
+                prefetched[1].cancel()
+            executor.shutdown(wait=True)
         
         logger.info(f"Position-based search complete. Found {len(discovered_contacts)} contacts across {len(all_titles)} role titles.")
         return discovered_contacts
     
-    def _perform_search(self, query: str) -> List[Dict[str, str]]:
+    def _search_position_query(
+        self, org_name: str, title: str, query: str, seen_results: set
+    ) -> List[Dict[str, str]]:
+        """
+        Run one search for a position title and keep the new results relevant to it.
+        
+        Args:
+            org_name: Organization name
+            title: Position title
+            query: Search query
+            seen_results: URLs/titles of results already returned for this title
+                (updated in place, as the query formats often return the same pages)
+            
+        Returns:
+            List of search results not seen before for this title, filtered for relevance
+        """
+        logger.info("Searching for: %s", query)
+        new_results = []
+        for result in self._perform_search(query, analyze=False):
+            result_key = result.get('url') or result.get('title')
+            if result_key not in seen_results:
+                seen_results.add(result_key)
+                new_results.append(result)
+        
+        # Have Gemini analyze the new results for relevance in one call
+        if self.gemini_client and new_results:
+            relevant_results = self._analyze_real_search_results(new_results, title, org_name, query)
+            relevant_keys = {
+                result.get('url') or result.get('title')
+                for result in relevant_results if isinstance(result, dict)
+            }
+            new_results = [
+                result for result in new_results
+                if (result.get('url') or result.get('title')) in relevant_keys
+            ]
+        
+        return new_results
+    
+    def _contact_name_key(self, contact: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Build the key used to detect the same person found by different searches.
+        
+        Args:
+            contact: Contact dictionary
+            
+        Returns:
+            Tuple of normalized (first_name, last_name)
+        """
+        return (
+            (contact.get('first_name') or '').strip().lower(),
+            (contact.get('last_name') or '').strip().lower()
+        )
+    
+    def _position_queries(self, clean_org_name: str, location: str, state: str, title: str) -> List[str]:
+        """
+        Build the search queries tried for one position title, most specific first.
+        
+        Args:
+            clean_org_name: Organization name without parentheses
+            location: Organization city/location (including state)
+            state: Organization state
+            title: Position title
+            
+        Returns:
+            List of up to POSITION_QUERIES_PER_TITLE search queries
+        """
+        return [
+            template.format(org=clean_org_name, location=location, state=state, title=title)
+            for template in _POSITION_QUERY_TEMPLATES[:POSITION_QUERIES_PER_TITLE]
+        ]
+    
+    def _perform_search(self, query: str, analyze: bool = True) -> List[Dict[str, str]]:
         """
         Perform a search using the query with actual search engines.
         
         Args:
             query: The search query
+            analyze: Whether to have Gemini filter the results for the quoted position
             
         Returns:
             List of search result dictionaries
         """
-        import re
-        
         # Extract possible state and category information from the query
         state = self._extract_state_from_query(query)
         category = self._extract_category_from_query(query)
@@ -365,15 +638,15 @@ class FallbackContactDiscovery:
         position = None
         
         # Sanitize query - remove parentheses before any other processing
-        sanitized_query = query.replace("(", " ").replace(")", " ")
+        sanitized_query = _sanitize_query(query)
         
         # Extract the organization name and position from query if in quotes
-        org_match = re.search(r'"([^"]+)"', sanitized_query)
+        org_match = _QUOTED_RE.search(sanitized_query)
         if org_match:
             org_name = org_match.group(1)
             
         # Find the last quoted item which is likely the position
-        position_match = re.findall(r'"([^"]+)"', sanitized_query)
+        position_match = _QUOTED_RE.findall(sanitized_query)
         if position_match:
             position = position_match[-1]
             
@@ -401,17 +674,17 @@ class FallbackContactDiscovery:
         if self.search_engine:
             try:
                 # Log original and sanitized queries for debugging
-                logger.info(f"Original query: {query}")
-                logger.info(f"Sanitized query for search: {sanitized_query}")
+                logger.debug("Original query: %s", query)
+                logger.debug("Sanitized query for search: %s", sanitized_query)
                 
                 # Use sanitized query for search
-                results = self.search_engine.execute_search(sanitized_query, category, state)
+                results = self._execute_cached_search(sanitized_query, category, state)
                 
                 # If no results with specific query, try the simplified queries
                 if not results and simplified_queries:
                     for simplified_query in simplified_queries:
                         logger.info(f"No results with previous query, trying simplified query: {simplified_query}")
-                        results = self.search_engine.execute_search(simplified_query, category, state)
+                        results = self._execute_cached_search(simplified_query, category, state)
                         if results:
                             logger.info(f"Got results with simplified query: {simplified_query}")
                             break
@@ -420,10 +693,10 @@ class FallbackContactDiscovery:
                 transformed_results = []
                 
                 # Log the structure of the first result to help with debugging
-                if results and len(results) > 0:
-                    logger.info(f"First search result structure: {type(results[0])}")
+                if results and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("First search result structure: %s", type(results[0]))
                     if isinstance(results[0], dict):
-                        logger.info(f"First result keys: {results[0].keys()}")
+                        logger.debug("First result keys: %s", list(results[0].keys()))
                 
                 for result in results:
                     try:
@@ -460,8 +733,7 @@ class FallbackContactDiscovery:
                             result_str = str(result)
                             if "http" in result_str:
                                 # Extract a URL if possible
-                                import re
-                                url_match = re.search(r'https?://[^\s"\']+', result_str)
+                                url_match = _URL_RE.search(result_str)
                                 if url_match:
                                     transformed_results.append({
                                         "title": "Extracted result",
@@ -472,11 +744,11 @@ class FallbackContactDiscovery:
                             pass
                 
                 if transformed_results:
-                    logger.info(f"Found {len(transformed_results)} results from search engine for: {sanitized_query}")
+                    logger.info("Found %d results from search engine for: %s", len(transformed_results), sanitized_query)
                     
                     # If there are actual search results and we have a Gemini client, 
                     # have Gemini analyze them for relevance rather than generating fake results
-                    if self.gemini_client and position:
+                    if analyze and self.gemini_client and position:
                         logger.info(f"Analyzing {len(transformed_results)} search results for relevance to position: {position}")
                         return self._analyze_real_search_results(transformed_results, position, org_name, sanitized_query)
                     
@@ -495,10 +767,11 @@ class FallbackContactDiscovery:
         state = self._extract_state_from_query(sanitized_query) or ""
         
         # For specific organization types like CAWCD, use "water" category
-        if "water" in sanitized_query.lower() or "conservation district" in sanitized_query.lower():
+        query_lower = sanitized_query.lower()
+        if "water" in query_lower or "conservation district" in query_lower:
             category = "water"
             
-        if "cawcd" in sanitized_query.lower() or "central arizona water conservation district" in sanitized_query.lower():
+        if "cawcd" in query_lower or "central arizona water conservation district" in query_lower:
             category = "water"
             state = "Arizona"
             
@@ -510,28 +783,7 @@ class FallbackContactDiscovery:
             if position_match and position_match[-1] != org_name:
                 position = position_match[-1]
             
-            cawcd_results = [
-                {
-                    "title": "Management Council | Central Arizona Project",
-                    "snippet": "Central Arizona Project's Management Council is responsible for the day-to-day operations of the 336-mile long CAP aqueduct system, including Operations Managers, Engineers, and other key personnel.",
-                    "url": "https://www.cap-az.com/about/management-council/"
-                },
-                {
-                    "title": "Careers | Central Arizona Project",
-                    "snippet": "CAP offers highly competitive salaries and excellent benefits. Find job listings and information about careers at the Central Arizona Water Conservation District (CAWCD).",
-                    "url": "https://www.cap-az.com/careers/"
-                },
-                {
-                    "title": "Contact Us | Central Arizona Project",
-                    "snippet": "Contact information for the Central Arizona Project (CAP). Find phone numbers, email addresses, and information about departments and staff.",
-                    "url": "https://www.cap-az.com/contact/"
-                },
-                {
-                    "title": "About | Central Arizona Project",
-                    "snippet": "The Central Arizona Project (CAP) delivers Colorado River water to Central and Southern Arizona. CAP is managed by the Central Arizona Water Conservation District (CAWCD).",
-                    "url": "https://www.cap-az.com/about/"
-                }
-            ]
+            cawcd_results = [dict(result) for result in _CAWCD_FALLBACK_RESULTS]
             
             # Add position-specific result if position is known
             if position:
@@ -572,6 +824,37 @@ class FallbackContactDiscovery:
         logger.warning(f"Failed to generate fallback results for: {sanitized_query}. Returning empty results.")
         return []
         
+    def _execute_cached_search(self, query: str, category: str, state: str) -> List[Dict[str, Any]]:
+        """
+        Execute a search through the search engine, reusing recent results for the same query.
+        
+        Args:
+            query: Sanitized search query
+            category: Search category/industry
+            state: Target state
+            
+        Returns:
+            List of raw search engine results
+        """
+        cache_key = make_cache_key(query, category, state)
+        cached_results = self._search_cache.get(cache_key)
+        if cached_results is not None:
+            self.search_cache_stats["hits"] += 1
+            logger.info("Using cached search results for: %s", query)
+            return cached_results
+        
+        self.search_cache_stats["misses"] += 1
+        
+        # Shared limiter spacing out search API calls across worker threads
+        self._search_limiter.acquire()
+        results = self.search_engine.execute_search(query, category, state)
+        
+        # Only cache real search results; generated fallback results carry category/state fields
+        if results and not any(isinstance(result, dict) and "category" in result for result in results):
+            self._search_cache.set(cache_key, results)
+        
+        return results
+    
     def _analyze_real_search_results(self, results: List[Dict[str, str]], position: str, org_name: str, query: str) -> List[Dict[str, str]]:
         """
         Use Gemini to analyze real search results for relevant alternative positions.
@@ -589,47 +872,25 @@ class FallbackContactDiscovery:
             return results
             
         # Prepare the results for analysis
-        results_json = json.dumps(results[:10])  # Limit to first 10 results to avoid token limits
+        results_json = orjson.dumps(results[:ANALYSIS_RESULT_LIMIT]).decode()  # Limit results to avoid token limits
+        
+        # Different query variants for the same position often return the same results,
+        # so the query text is left out of the cache key
+        cache_key = make_cache_key(position.lower(), org_name, results_json)
+        cached_results = self._analysis_cache.get(cache_key)
+        if cached_results is not None:
+            logger.info(f"Using cached Gemini analysis of {len(results)} search results for position: {position}")
+            return cached_results
         
-        prompt = f"""
-        Analyze these real search results for the query: {query}
+        # Fixed instructions come first so repeated calls share a common prompt prefix
+        prompt = f"""{_RESULT_ANALYSIS_INSTRUCTIONS}
+        Query: {query}
         
         The target position is: {position}.
         {f"The target organization is: {org_name}." if org_name else ""}
         
-        TASK: Analyze each search result to determine if it contains information about a person with a relevant position.
-        
-        Consider these relevant alternative job titles that would be valuable for SCADA integration sales:
-        - Operations Manager / Director
-        - Facilities Director / Manager
-        - City Engineer
-        - Public Works Director
-        - Infrastructure Manager
-        - Plant Manager
-        - Utilities Superintendent / Manager
-        - City Planner (only if they would be involved in infrastructure planning)
-        - Water Resources Manager
-        - Control Systems Engineer
-        - SCADA Technician / Engineer
-        
         Search Results:
         {results_json}
-        
-        For each result, provide:
-        1. Is this result relevant? (true/false)
-        2. If relevant, what position or job title is mentioned?
-        3. Is the position similar enough to our target position to be valuable?
-        
-        Return only the original search results that are relevant, with unchanged title, snippet, and url.
-        Return the results in this JSON format:
-        [
-            {{
-                "title": "Original result title",
-                "snippet": "Original result snippet",
-                "url": "Original result url"
-            }},
-            ...
-        ]
         """
         
         try:
@@ -643,8 +904,9 @@ class FallbackContactDiscovery:
                 else:
                     json_content = response
                     
-                analyzed_results = json.loads(json_content)
+                analyzed_results = orjson.loads(json_content)
                 logger.info(f"Gemini analyzed {len(results)} search results and found {len(analyzed_results)} relevant results")
+                self._analysis_cache.set(cache_key, analyzed_results)
                 return analyzed_results
         except Exception as e:
             logger.error(f"Error analyzing search results with Gemini: {e}")
@@ -652,36 +914,25 @@ class FallbackContactDiscovery:
         # If analysis fails, return the original results
         return results
         
-    def _extract_state_from_query(self, query: str) -> str:
-        """Extract state information from a search query."""
-        # List of target states from config
-        from app.config import TARGET_STATES
-        
-        for state in TARGET_STATES:
-            if state.lower() in query.lower():
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_state_from_query(query: str) -> str:
+        """Extract state information from a search query, memoized per query."""
+        query_lower = query.lower()
+        for state_lower, state in _TARGET_STATE_NAMES:
+            if state_lower in query_lower:
                 return state
                 
         return ""
         
-    def _extract_category_from_query(self, query: str) -> str:
-        """Extract category/industry information from a search query."""
-        # Map of keywords to categories
-        category_keywords = {
-            "water": ["water", "wastewater", "utility", "utilities"],
-            "engineering": ["engineer", "engineering", "design"],
-            "government": ["government", "agency", "department"],
-            "municipal": ["city", "town", "county", "municipal"],
-            "utility": ["utility", "utilities", "power", "electric"],
-            "transportation": ["transport", "transit", "traffic"],
-            "oil_gas": ["oil", "gas", "petroleum", "pipeline"],
-            "agriculture": ["agriculture", "farm", "irrigation"]
-        }
-        
-        # Check for category keywords in the query
-        for category, keywords in category_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in query.lower():
-                    return category
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_category_from_query(query: str) -> str:
+        """Extract category/industry information from a search query, memoized per query."""
+        query_lower = query.lower()
+        for keyword, category in _CATEGORY_KEYWORDS:
+            if keyword in query_lower:
+                return category
                     
         return ""
     
@@ -699,15 +950,8 @@ class FallbackContactDiscovery:
         snippet = result.get('snippet', '')
         title = result.get('title', '')
         
-        # Try to extract name using common patterns
-        # Pattern for "Name is the Title" or "Name serves as Title"
-        name_patterns = [
-            r'([A-Z][a-z]+ [A-Z][a-z]+)(?:\s+is|\s+serves as|\s+has been|\s+was named|\s+was appointed)(?:\s+the|\s+our|\s+as|\s+to)?(?:\s+new)?\s+([A-Za-z\s]+)',
-            r'([A-Z][a-z]+ [A-Z][a-z]+),?\s+([A-Za-z\s]+)',
-        ]
-        
         # Check if name is directly in the title (e.g., "Lisa Webster - Salem City Planner")
-        title_name_match = re.search(r'([A-Z][a-z]+ [A-Z][a-z]+)(?:\s*-\s*|\s+at\s+|\s+from\s+|\s+with\s+)', title)
+        title_name_match = _TITLE_NAME_RE.search(title)
         
         name = None
         extracted_position = None
@@ -718,14 +962,14 @@ class FallbackContactDiscovery:
             # Try to find position in the rest of the title
             remaining_title = title[title.find(name) + len(name):]
             # Extract the job title if present
-            job_match = re.search(r'(?:[-:]\s*)([A-Za-z\s,]+)(?:\s+at|$)', remaining_title)
+            job_match = _TITLE_JOB_RE.search(remaining_title)
             if job_match:
                 extracted_position = job_match.group(1).strip()
         
-        # If not found in title, check snippet
+        # If not found in title, check snippet using common patterns
         if not name:
-            for pattern in name_patterns:
-                matches = re.search(pattern, snippet)
+            for pattern in _SNIPPET_NAME_RES:
+                matches = pattern.search(snippet)
                 if matches:
                     name = matches.group(1)
                     extracted_position = matches.group(2)
@@ -743,13 +987,11 @@ class FallbackContactDiscovery:
         last_name = ' '.join(name_parts[1:])
         
         # Try to extract email from snippet
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        email_match = re.search(email_pattern, snippet)
+        email_match = _EMAIL_RE.search(snippet)
         email = email_match.group(0) if email_match else None
         
         # Try to extract phone from snippet
-        phone_pattern = r'(\(\d{3}\)\s*\d{3}-\d{4}|\d{3}-\d{3}-\d{4})'
-        phone_match = re.search(phone_pattern, snippet)
+        phone_match = _PHONE_RE.search(snippet)
         phone = phone_match.group(0) if phone_match else None
         
         # If the extracted position doesn't match what we searched for,
@@ -760,42 +1002,42 @@ class FallbackContactDiscovery:
         
         if extracted_position and position_title.lower() not in extracted_position.lower() and self.gemini_client:
             # The extracted position doesn't match what we searched for, evaluate relevance
-            logger.info(f"Evaluating relevance of '{extracted_position}' vs. searched '{position_title}'")
+            logger.info("Evaluating relevance of '%s' vs. searched '%s'", extracted_position, position_title)
             try:
-                prompt = f"""
-                Evaluate if the job title "{extracted_position}" is relevant to "{position_title}" 
-                for SCADA (Supervisory Control and Data Acquisition) integration services outreach.
-                
-                Consider:
-                1. Would this person have decision-making authority related to automation/control systems?
-                2. Would they have technical knowledge or influence over operational technology?
-                3. Might they be involved in infrastructure or facility operations?
-                4. Could they influence budget decisions for control systems?
-                
-                Return a JSON with:
-                1. "is_relevant": true or false
-                2. "relevance_score": 1-10 (where 10 is highly relevant)
-                3. "reason": brief explanation
-                """
+                # The same title pairs come up for many organizations, so evaluations are cached
+                cache_key = make_cache_key(extracted_position.strip().lower(), position_title.lower())
+                evaluation = self._relevance_cache.get(cache_key)
                 
-                response = self.gemini_client.generate_text(prompt)
+                if evaluation is None:
+                    # Fixed instructions come first so repeated calls share a common prompt prefix
+                    prompt = f"""{_TITLE_RELEVANCE_INSTRUCTIONS}
+                    Job title: "{extracted_position}"
+                    Searched title: "{position_title}"
+                    """
+                    
+                    response = self.gemini_client.generate_text(prompt)
+                    
+                    if response:
+                        # Parse JSON response
+                        if "```json" in response:
+                            json_content = response.split("```json")[1].split("```")[0].strip()
+                        elif "```" in response:
+                            json_content = response.split("```")[1].split("```")[0].strip()
+                        else:
+                            json_content = response.strip()
+                            
+                        evaluation = orjson.loads(json_content)
+                        self._relevance_cache.set(cache_key, evaluation)
+                else:
+                    logger.info("Using cached relevance evaluation for '%s' vs. '%s'", extracted_position, position_title)
                 
-                if response:
-                    # Parse JSON response
-                    import json
-                    if "```json" in response:
-                        json_content = response.split("```json")[1].split("```")[0].strip()
-                    elif "```" in response:
-                        json_content = response.split("```")[1].split("```")[0].strip()
-                    else:
-                        json_content = response.strip()
-                        
-                    result = json.loads(json_content)
-                    relevant_contact = result.get("is_relevant", True)
-                    relevance_score = result.get("relevance_score", 5)
-                    relevance_notes = result.get("reason", "")
+                if evaluation:
+                    relevant_contact = evaluation.get("is_relevant", True)
+                    relevance_score = evaluation.get("relevance_score", 5)
+                    relevance_notes = evaluation.get("reason", "")
                     
-                    logger.info(f"Gemini relevance evaluation: {relevant_contact}, score: {relevance_score}, reason: {relevance_notes}")
+                    logger.info("Gemini relevance evaluation: %s, score: %s, reason: %s",
+                                relevant_contact, relevance_score, relevance_notes)
             
             except Exception as e:
                 logger.error(f"Error evaluating contact relevance: {e}")
@@ -804,7 +1046,7 @@ class FallbackContactDiscovery:
         
         # Skip non-relevant contacts
         if not relevant_contact:
-            logger.info(f"Skipping non-relevant contact: {first_name} {last_name} ({extracted_position})")
+            logger.info("Skipping non-relevant contact: %s %s (%s)", first_name, last_name, extracted_position)
             return None
         
         # Create contact dictionary
@@ -3,16 +3,23 @@ Gemini-based organization classifier for the GBL Data Contact Management System.
 
 This module provides functionality to classify search results as relevant organizations using Google's Gemini API.
 """
-import time
 import json
 import re
 from typing import Dict, List, Any, Optional, Tuple
-from app.config import GEMINI_API_KEY, ORG_TYPES
+from app.config import (
+    GEMINI_API_KEY, GEMINI_REQUESTS_PER_MINUTE, ORG_TYPES, RESULT_CACHE_PATH, GEMINI_CACHE_TTL_DAYS
+)
+from app.discovery.rate_limiter import TokenBucket
+from app.discovery.result_cache import ResultCache, make_cache_key
 from app.utils.logger import get_logger
 import google.generativeai as genai
 
 logger = get_logger(__name__)
 
+# Shared rate limiter for classification calls from all worker threads
+# (allows bursts up to the per-minute quota)
+_gemini_rate_limiter = TokenBucket.per_minute(GEMINI_REQUESTS_PER_MINUTE)
+
 class GeminiOrganizationClassifier:
     """Uses Google's Gemini API to determine if a search result is a relevant organization."""
     
@@ -28,6 +35,13 @@ class GeminiOrganizationClassifier:
                 logger.warning("No Gemini API key provided, classification will not work")
         except Exception as e:
             logger.error(f"Error initializing Gemini API: {e}")
+        
+        # Classifications persisted across runs, keyed by result URL, type and state
+        self._cache = ResultCache(
+            RESULT_CACHE_PATH,
+            namespace="organization_classification",
+            ttl_seconds=GEMINI_CACHE_TTL_DAYS * 24 * 3600
+        )
     
     def classify_search_result(self, search_result: Dict[str, Any], org_type: str, state: str) -> Tuple[bool, Dict[str, Any]]:
         """
@@ -48,68 +62,88 @@ class GeminiOrganizationClassifier:
             return False, {}
             
         try:
-            # Extract type description from config
-            type_description = ORG_TYPES.get(org_type, {}).get("description", org_type.title())
-            
-            # Extract information from search result
-            title = search_result.get("title", "")
-            snippet = search_result.get("snippet", "")
-            url = search_result.get("link", "")
-            
-            # Create a prompt for Gemini to classify the result
-            prompt = f"""
-            I have a search result that might be a {type_description} in {state}. I need to determine if this is actually a relevant organization.
-
-            Title: {title}
-            Snippet: {snippet}
-            URL: {url}
-
-            I want you to analyze this information and answer with YES or NO:
-            1. Is this a {type_description}? (Not a job board, news article, social media page, or directory)
-            2. Is it an actual organization (not a list, guide, or general information page)?
-
-            If you answered YES to both questions, also extract the following information:
-            - Organization Name (the official name, not just what's in the title)
-            - Confidence Score (0.0-1.0) that this is a relevant {org_type} organization
-            - Relevance (how well this organization fits the {org_type} category, 0.0-1.0)
-            - Any notes or observations about this organization
-            
-            Format your answer as a JSON object with these fields exactly:
-            {{
-                "is_relevant": true or false,
-                "organization_name": "extracted name here",
-                "confidence_score": 0.0-1.0,
-                "relevance_score": 0.0-1.0,
-                "notes": "any observations"
-            }}
-            
-            Only respond with this JSON object, nothing else.
-            """
-            
-            # Call Gemini API
-            model = genai.GenerativeModel('gemini-2.0-flash')
-            response = model.generate_content(prompt)
-            response_text = response.text
-            
-            # Extract JSON from response
-            matches = re.search(r'({[\s\S]*})', response_text)
-            if not matches:
-                logger.warning(f"Couldn't extract JSON from Gemini response: {response_text[:100]}...")
+            result_json = self._request_classification(search_result, org_type, state)
+            if result_json is None:
                 return False, {}
-                
-            result_json = json.loads(matches.group(1))
             
-            is_relevant = result_json.get("is_relevant", False)
-            
-            logger.info(f"Gemini classification for '{title[:30]}...': is_relevant={is_relevant}, " 
-                       f"confidence={result_json.get('confidence_score', 0)}")
-            
-            return is_relevant, result_json
+            return result_json.get("is_relevant", False), result_json
             
         except Exception as e:
             logger.error(f"Error classifying with Gemini: {e}")
             return False, {}
     
+    def _request_classification(
+        self, search_result: Dict[str, Any], org_type: str, state: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Ask Gemini to classify a search result.
+        
+        Args:
+            search_result: Search result dictionary with title, snippet, and URL
+            org_type: Organization type to check for
+            state: State to check for
+            
+        Returns:
+            Classification JSON object, or None if the response held no JSON
+            (API and parsing errors are raised)
+        """
+        # Extract type description from config
+        type_description = ORG_TYPES.get(org_type, {}).get("description", org_type.title())
+        
+        # Extract information from search result
+        title = search_result.get("title", "")
+        snippet = search_result.get("snippet", "")
+        url = search_result.get("link", "")
+        
+        # Create a prompt for Gemini to classify the result
+        prompt = f"""
+        I have a search result that might be a {type_description} in {state}. I need to determine if this is actually a relevant organization.
+
+        Title: {title}
+        Snippet: {snippet}
+        URL: {url}
+
+        I want you to analyze this information and answer with YES or NO:
+        1. Is this a {type_description}? (Not a job board, news article, social media page, or directory)
+        2. Is it an actual organization (not a list, guide, or general information page)?
+
+        If you answered YES to both questions, also extract the following information:
+        - Organization Name (the official name, not just what's in the title)
+        - Confidence Score (0.0-1.0) that this is a relevant {org_type} organization
+        - Relevance (how well this organization fits the {org_type} category, 0.0-1.0)
+        - Any notes or observations about this organization
+        
+        Format your answer as a JSON object with these fields exactly:
+        {{
+            "is_relevant": true or false,
+            "organization_name": "extracted name here",
+            "confidence_score": 0.0-1.0,
+            "relevance_score": 0.0-1.0,
+            "notes": "any observations"
+        }}
+        
+        Only respond with this JSON object, nothing else.
+        """
+        
+        # Call Gemini API
+        model = genai.GenerativeModel('gemini-2.0-flash')
+        _gemini_rate_limiter.acquire()
+        response = model.generate_content(prompt)
+        response_text = response.text
+        
+        # Extract JSON from response
+        matches = re.search(r'({[\s\S]*})', response_text)
+        if not matches:
+            logger.warning(f"Couldn't extract JSON from Gemini response: {response_text[:100]}...")
+            return None
+            
+        result_json = json.loads(matches.group(1))
+        
+        logger.info(f"Gemini classification for '{title[:30]}...': is_relevant={result_json.get('is_relevant', False)}, " 
+                   f"confidence={result_json.get('confidence_score', 0)}")
+        
+        return result_json
+    
     def batch_classify(self, search_results: List[Dict[str, Any]], org_type: str, state: str) -> List[Dict[str, Any]]:
         """
         Classify a batch of search results.
@@ -124,9 +158,36 @@ class GeminiOrganizationClassifier:
         """
         relevant_orgs = []
         
+        # Reuse classifications of results seen in earlier runs (same URL, type and state);
+        # only the remaining results are sent to Gemini
+        cache_keys = [
+            make_cache_key(result.get("link", ""), org_type, state) if result.get("link") else None
+            for result in search_results
+        ]
+        cached = self._cache.get_many(key for key in cache_keys if key)
+        new_classifications = {}
+        api_calls = 0
+        
         for i, result in enumerate(search_results):
             try:
-                is_relevant, metadata = self.classify_search_result(result, org_type, state)
+                cache_key = cache_keys[i]
+                metadata = cached.get(cache_key) if cache_key else None
+                
+                if metadata is None:
+                    if not self.api_key:
+                        logger.warning("Cannot classify without Gemini API key")
+                        continue
+                    
+                    api_calls += 1
+                    
+                    metadata = self._request_classification(result, org_type, state)
+                    if metadata is None:
+                        continue
+                    
+                    if cache_key:
+                        new_classifications[cache_key] = metadata
+                
+                is_relevant = metadata.get("is_relevant", False)
                 
                 if is_relevant:
                     # Create organization data dictionary
@@ -146,13 +207,13 @@ class GeminiOrganizationClassifier:
                         org_data["description"] = metadata.get("notes", "")
                     
                     relevant_orgs.append(org_data)
-                
-                # Add small delay between API calls to avoid rate limiting
-                if i < len(search_results) - 1:
-                    time.sleep(0.5)
                     
             except Exception as e:
                 logger.error(f"Error processing search result {i}: {e}")
         
-        logger.info(f"Classified {len(search_results)} results, found {len(relevant_orgs)} relevant organizations")
-        return relevant_orgs
\ No newline at end of file
+        # Store the new classifications with a single write
+        self._cache.set_many(new_classifications)
+        
+        logger.info(f"Classified {len(search_results)} results ({len(search_results) - api_calls} from cache), "
+                    f"found {len(relevant_orgs)} relevant organizations")
+        return relevant_orgs
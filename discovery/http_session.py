@@ -0,0 +1,42 @@
+"""
+Shared HTTP session factory for the Contact Discovery System.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+def create_http_session(pool_size: int = 32, retries: int = 2, backoff_factor: float = 0.3) -> requests.Session:
+    """
+    Create a requests session with connection pooling, keep-alive and retries.
+
+    Reusing one session across requests avoids a new TCP/TLS handshake for
+    every page fetched from the same host.
+
+    Args:
+        pool_size: Number of pooled connections per host (and number of host pools)
+        retries: Number of retries for connection errors and 5xx/429 responses
+        backoff_factor: Exponential backoff factor between retries
+
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+    return session
@@ -58,21 +58,35 @@ class OrganizationExtractor:
         """
         try:
             soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove script and style elements
-            for script_or_style in soup(['script', 'style', 'header', 'footer', 'nav']):
-                script_or_style.decompose()
-            
-            # Get text
-            text = soup.get_text(separator=' ', strip=True)
-            
-            # Remove excess whitespace
-            text = re.sub(r'\s+', ' ', text).strip()
-            
-            return text
+            return self.soup_to_text(soup)
         except Exception as e:
             logger.error(f"Error converting HTML to text: {e}")
             return html_content  # Return original content if parsing fails
+    
+    def soup_to_text(self, soup: BeautifulSoup) -> str:
+        """
+        Convert an already parsed HTML tree to plain text.
+        
+        Note that boilerplate elements (script, style, header, footer, nav) are
+        removed from the tree in place.
+        
+        Args:
+            soup: Parsed BeautifulSoup tree
+            
+        Returns:
+            Extracted plain text
+        """
+        # Remove script and style elements
+        for script_or_style in soup(['script', 'style', 'header', 'footer', 'nav']):
+            script_or_style.decompose()
+        
+        # Get text
+        text = soup.get_text(separator=' ', strip=True)
+        
+        # Remove excess whitespace
+        text = re.sub(r'\s+', ' ', text).strip()
+        
+        return text
 
 
     def extract_organizations_from_content(self, content: str, url: str, state_context: Optional[str] = None, industry_hint: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -0,0 +1,98 @@
+"""
+Rate limiting utilities for the Contact Discovery System.
+"""
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Allows bursts of up to `capacity` calls and refills at `rate` tokens per
+    second. Callers only block when the bucket is actually empty.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens the bucket can hold
+
+        Raises:
+            ValueError: If rate is not positive or capacity is below one token
+        """
+        if rate <= 0:
+            raise ValueError(f"TokenBucket rate must be positive, got {rate}")
+        if capacity < 1:
+            raise ValueError(f"TokenBucket capacity must be at least 1, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls: int) -> "TokenBucket":
+        """
+        Create a bucket allowing `calls` calls per minute (burst up to `calls`).
+
+        Args:
+            calls: Number of calls allowed per minute
+
+        Returns:
+            TokenBucket instance
+        """
+        return cls(rate=calls / 60.0, capacity=calls)
+
+    @classmethod
+    def per_second(cls, calls: float) -> "TokenBucket":
+        """
+        Create a bucket allowing `calls` calls per second (burst up to `calls`).
+
+        Fractional rates below one call per second still get room for one token,
+        so a single call can always be made.
+
+        Args:
+            calls: Number of calls allowed per second
+
+        Returns:
+            TokenBucket instance
+        """
+        return cls(rate=calls, capacity=max(1.0, calls))
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, sleeping only if not enough are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Number of seconds spent waiting
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket can hold
+        """
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket with capacity {self.capacity}")
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait_time = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+            waited += wait_time
@@ -0,0 +1,192 @@
+"""
+Persistent result cache for expensive discovery calls (Gemini, search APIs).
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Keys per SELECT in get_many (stays below SQLite's default bound-parameter limit)
+_MAX_KEYS_PER_QUERY = 500
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a compact cache key from the given parts.
+
+    Args:
+        parts: Values identifying the cached result (converted with str())
+
+    Returns:
+        Hex digest of the parts
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(str(part).encode("utf-8", "surrogatepass"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe key/value cache stored in a SQLite file, with per-entry expiry.
+
+    Values must be JSON serializable. Errors reading or writing the cache are
+    logged and treated as cache misses so callers never fail because of it.
+    """
+
+    def __init__(self, path: Union[str, Path], namespace: str, ttl_seconds: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Path to the SQLite database file
+            namespace: Namespace separating different kinds of cached results
+            ttl_seconds: Time-to-live for entries (None means entries never expire)
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value TEXT NOT NULL, "
+                "expires_at REAL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            self._conn.commit()
+        except Exception as e:
+            logger.error(f"Error opening result cache at {self.path}: {e}")
+            self._conn = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        if self._conn is None:
+            return None
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM result_cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, key)
+                ).fetchone()
+
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at < time.time():
+                return None
+
+            return json.loads(value)
+        except Exception as e:
+            logger.error(f"Error reading result cache: {e}")
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+        """
+        if self._conn is None:
+            return
+
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+
+        try:
+            payload = json.dumps(value)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO result_cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (self.namespace, key, payload, expires_at)
+                )
+                self._conn.commit()
+        except Exception as e:
+            logger.error(f"Error writing result cache: {e}")
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        Get several cached values with one query per chunk of keys.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of the keys found (missing and expired keys are left out)
+        """
+        if self._conn is None:
+            return {}
+
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        now = time.time()
+
+        try:
+            for start in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+                chunk = keys[start:start + _MAX_KEYS_PER_QUERY]
+                placeholders = ", ".join("?" * len(chunk))
+                with self._lock:
+                    rows = self._conn.execute(
+                        "SELECT key, value, expires_at FROM result_cache "
+                        f"WHERE namespace = ? AND key IN ({placeholders})",
+                        (self.namespace, *chunk)
+                    ).fetchall()
+
+                for key, value, expires_at in rows:
+                    if expires_at is None or expires_at >= now:
+                        found[key] = json.loads(value)
+        except Exception as e:
+            logger.error(f"Error reading result cache: {e}")
+
+        return found
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """
+        Store several values in the cache with a single commit.
+
+        Args:
+            items: Dictionary of cache key to JSON-serializable value
+        """
+        if self._conn is None or not items:
+            return
+
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+
+        try:
+            rows = [
+                (self.namespace, key, json.dumps(value), expires_at)
+                for key, value in items.items()
+            ]
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO result_cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+        except Exception as e:
+            logger.error(f"Error writing result cache: {e}")
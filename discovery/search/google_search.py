@@ -3,13 +3,15 @@ Google Custom Search API integration for organization discovery.
 """
 import re  # Required for the search_for_org_website function
 import json
+import threading
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import requests
 from urllib.parse import urlparse
 from sqlalchemy.orm import Session
 from app.config import GOOGLE_API_KEY, GOOGLE_CSE_ID, SEARCH_QUERIES, TARGET_STATES
 from app.database.models import SearchQuery
+from app.discovery.http_session import create_http_session
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,14 +20,16 @@ logger = get_logger(__name__)
 class GoogleSearchClient:
     """Client for Google Custom Search API integration with rate limiting."""
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, http_session: Optional[requests.Session] = None):
         """
         Initialize the Google search client.
         
         Args:
             db_session: Database session
+            http_session: Optional shared HTTP session (a pooled session is created if omitted)
         """
         self.db_session = db_session
+        self.http = http_session or create_http_session()
         # Use the API key from your .env file
         self.api_key = GOOGLE_API_KEY
         
@@ -43,6 +47,7 @@ class GoogleSearchClient:
         # Rate limiting variables
         self.queries_per_minute = 100  # Google's limit
         self.query_timestamps = []  # Track timestamps of recent queries
+        self._rate_limit_lock = threading.Lock()  # Guards query_timestamps across threads
     
     def search(self, query: str, start_index: int = 1) -> Optional[Dict[str, Any]]:
         """
@@ -140,7 +145,7 @@ class GoogleSearchClient:
             max_retries = 2
             for attempt in range(max_retries + 1):
                 try:
-                    response = requests.get(self.base_url, params=params, timeout=10)
+                    response = self.http.get(self.base_url, params=params, timeout=10)
                     
                     # Check for specific error responses
                     if response.status_code == 400:
@@ -222,11 +227,29 @@ class GoogleSearchClient:
         Returns:
             List of search results
         """
+        all_results = []
+        for page_items in self.get_all_results_iter(query, max_results=max_results):
+            all_results.extend(page_items)
+        
+        logger.info(f"Total results collected for '{query}': {len(all_results)}")
+        return all_results
+    
+    def get_all_results_iter(self, query: str, max_results: int = 100) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield search results for a query one page at a time, handling pagination.
+        
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return (up to 100)
+            
+        Yields:
+            Lists of processed search results, one per fetched page
+        """
         if max_results > 100:
             logger.warning(f"Google Custom Search API can only return a maximum of 100 results. Limiting to 100.")
             max_results = 100
             
-        all_results = []
+        results_returned = 0
         
         # Calculate the number of pages we need to fetch
         num_pages = min(self.max_pages, (max_results + self.results_per_page - 1) // self.results_per_page)
@@ -237,8 +260,8 @@ class GoogleSearchClient:
             # Calculate the start index for this page (1-based)
             start_index = (page * self.results_per_page) + 1
             
-            # Bail out if we've already collected enough results
-            if len(all_results) >= max_results:
+            # Bail out if we've already returned enough results
+            if results_returned >= max_results:
                 break
                 
             # Execute the search for this page
@@ -264,9 +287,12 @@ class GoogleSearchClient:
                     "domain": self._extract_domain(item.get("link", ""))
                 }
                 processed_items.append(processed_item)
-                
-            all_results.extend(processed_items)
+            
+            # Trim to exact max_results
+            processed_items = processed_items[:max_results - results_returned]
+            results_returned += len(processed_items)
             logger.info(f"Added {len(processed_items)} results from page {page+1} for query: {query}")
+            yield processed_items
             
             # Check if there are more results
             if len(results["items"]) < self.results_per_page:
@@ -278,42 +304,36 @@ class GoogleSearchClient:
                 self._respect_rate_limit()
                 time.sleep(self.delay_between_queries)
         
-        # Trim to exact max_results
-        if len(all_results) > max_results:
-            all_results = all_results[:max_results]
-            
-        logger.info(f"Total results collected for '{query}': {len(all_results)}")
-        return all_results
-        
     def _respect_rate_limit(self) -> None:
         """
         Respect the Google Custom Search API rate limit of 100 queries per minute.
         This method will wait if needed to ensure we don't exceed the limit.
         """
-        current_time = time.time()
-        
-        # Remove timestamps older than 1 minute
-        one_minute_ago = current_time - 60
-        self.query_timestamps = [t for t in self.query_timestamps if t > one_minute_ago]
-        
-        # Check if we're approaching the limit - use a more conservative limit of 80 per minute to avoid rate limiting
-        if len(self.query_timestamps) >= 80:  # More conservative than previous 90 limit
-            # Calculate how long to wait - add 5 seconds buffer for extra safety
-            oldest_timestamp = min(self.query_timestamps) if self.query_timestamps else current_time
-            time_to_wait = 60 - (current_time - oldest_timestamp) + 5  # Add 5 second buffer
-            
-            if time_to_wait > 0:
-                logger.warning(f"Rate limit approaching ({len(self.query_timestamps)}/{self.queries_per_minute}), "
-                              f"waiting {time_to_wait:.2f}s to avoid exceeding Google API quota")
-                time.sleep(time_to_wait)
+        with self._rate_limit_lock:
+            current_time = time.time()
+            
+            # Remove timestamps older than 1 minute
+            one_minute_ago = current_time - 60
+            self.query_timestamps = [t for t in self.query_timestamps if t > one_minute_ago]
+            
+            # Check if we're approaching the limit - use a more conservative limit of 80 per minute to avoid rate limiting
+            if len(self.query_timestamps) >= 80:  # More conservative than previous 90 limit
+                # Calculate how long to wait - add 5 seconds buffer for extra safety
+                oldest_timestamp = min(self.query_timestamps) if self.query_timestamps else current_time
+                time_to_wait = 60 - (current_time - oldest_timestamp) + 5  # Add 5 second buffer
                 
-                # After sleeping, clear out outdated timestamps again
-                current_time = time.time()
-                one_minute_ago = current_time - 60
-                self.query_timestamps = [t for t in self.query_timestamps if t > one_minute_ago]
-        
-        # Record this query timestamp
-        self.query_timestamps.append(time.time())
+                if time_to_wait > 0:
+                    logger.warning(f"Rate limit approaching ({len(self.query_timestamps)}/{self.queries_per_minute}), "
+                                  f"waiting {time_to_wait:.2f}s to avoid exceeding Google API quota")
+                    time.sleep(time_to_wait)
+                    
+                    # After sleeping, clear out outdated timestamps again
+                    current_time = time.time()
+                    one_minute_ago = current_time - 60
+                    self.query_timestamps = [t for t in self.query_timestamps if t > one_minute_ago]
+            
+            # Record this query timestamp
+            self.query_timestamps.append(time.time())
         
     def _extract_domain(self, url: str) -> str:
         """
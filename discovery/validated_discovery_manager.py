@@ -85,31 +85,28 @@ class ValidatedDiscoveryManager(DiscoveryManager):
         
         return result
     
-    def _extract_contacts_from_content(self, content: str, organization: Organization, profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _validate_extracted_contacts(self, org_name: str, contacts_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Extract and validate contacts from content.
+        Validate contacts extracted from content.
         
-        This overrides the parent class method to add validation.
+        This overrides the parent class hook to add validation. It runs on the
+        thread that owns the database session, after extraction has finished.
         
         Args:
-            content: HTML content
-            organization: Organization record
-            profiles: List of role profiles
+            org_name: Organization name
+            contacts_data: List of extracted contact dictionaries
             
         Returns:
             List of validated contact dictionaries
         """
-        # Call parent method to extract contacts
-        contacts_data = super()._extract_contacts_from_content(content, organization, profiles)
-        
         # Validate contacts in a batch for better performance
-        logger.info(f"Validating {len(contacts_data)} contacts extracted from {organization.name}")
+        logger.info(f"Validating {len(contacts_data)} contacts extracted from {org_name}")
         valid_contacts = self.validated_crud.batch_validate_contacts(contacts_data)
         
         # Log validation results
         rejected_count = len(contacts_data) - len(valid_contacts)
         if rejected_count > 0:
-            logger.info(f"Rejected {rejected_count} contacts from {organization.name} that failed validation")
+            logger.info(f"Rejected {rejected_count} contacts from {org_name} that failed validation")
         
         return valid_contacts
     